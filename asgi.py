@@ -0,0 +1,12 @@
+"""
+ASGI entrypoint (uvicorn asgi:app): contact and health routes on an async repository.
+"""
+
+from src.shared.config import load_env
+
+# Los .env se cargan antes de importar la app: el logging se configura al importarla.
+load_env()
+
+from src.infrastructure.asgi.asgi_app import create_asgi_app  # noqa: E402  pylint: disable=wrong-import-position
+
+app = create_asgi_app()
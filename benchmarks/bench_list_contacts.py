@@ -0,0 +1,25 @@
+"""
+Micro-benchmarks: ListContactsUseCase over N rows.
+"""
+
+from collections import deque
+
+from benchmarks.fixtures import FakeContactRepository, build_rows
+from benchmarks.harness import Benchmark
+from src.use_cases.list_contacts import MAX_PAGE_SIZE, ListContactsUseCase
+
+
+def _page():
+    use_case = ListContactsUseCase(FakeContactRepository(build_rows(MAX_PAGE_SIZE)))
+    return lambda: use_case.execute_page(limit=MAX_PAGE_SIZE)
+
+
+def _iter_all(count):
+    use_case = ListContactsUseCase(FakeContactRepository(build_rows(count)))
+    return lambda: deque(use_case.iter_all(), maxlen=0)
+
+
+BENCHMARKS = [
+    Benchmark("list_contacts.execute_page_200", _page),
+    Benchmark("list_contacts.iter_all_1000", lambda: _iter_all(1000)),
+]
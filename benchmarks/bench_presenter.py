@@ -0,0 +1,24 @@
+"""
+Micro-benchmarks: ContactPresenter projections.
+"""
+
+from benchmarks.fixtures import build_rows
+from benchmarks.harness import Benchmark
+from src.entities.contact import Contact
+from src.interface_adapters.presenters.contact_presenter import ContactPresenter
+
+
+def _single_contact():
+    contact = Contact(*build_rows(1)[0][:-1])
+    return lambda: ContactPresenter.to_response(contact)
+
+
+def _rows(count):
+    rows = build_rows(count)
+    return lambda: ContactPresenter.rows_to_response(rows)
+
+
+BENCHMARKS = [
+    Benchmark("presenter.to_response", _single_contact),
+    Benchmark("presenter.rows_to_response_200", lambda: _rows(200)),
+]
@@ -0,0 +1,19 @@
+"""
+Micro-benchmarks: contact payload validation.
+"""
+
+from benchmarks.fixtures import VALID_PAYLOAD
+from benchmarks.harness import Benchmark
+from src.interface_adapters.controllers.contact_controller import sanitize_and_validate_contact_payload
+
+INVALID_PAYLOAD = {"name": "Ada", "email": "not-an-email", "message": "", "company": "x" * 200}
+
+
+def _validate(payload):
+    return lambda: sanitize_and_validate_contact_payload(payload)
+
+
+BENCHMARKS = [
+    Benchmark("validation.valid_payload", lambda: _validate(VALID_PAYLOAD)),
+    Benchmark("validation.invalid_payload", lambda: _validate(INVALID_PAYLOAD)),
+]
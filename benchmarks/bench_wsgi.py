@@ -0,0 +1,69 @@
+"""
+Macro-benchmarks: full Flask/WSGI stack through the test client with fake repositories.
+"""
+
+from benchmarks.fixtures import VALID_PAYLOAD, FakeContactRepository, build_rows
+from benchmarks.harness import Benchmark
+from src.infrastructure.common.uuid_generator import UUIDGenerator
+from src.infrastructure.flask import flask_app
+from src.infrastructure.flask.list_response_cache import ListResponseCache
+from src.interface_adapters.controllers.contact_controller import ContactController
+from src.shared.config import Settings
+from src.use_cases.list_contacts import ListContactsUseCase
+from src.use_cases.register_contact import RegisterContactUseCase
+
+HEADERS = {"Origin": "http://localhost:5173"}
+SETTINGS = Settings(development=True, rate_limit_enabled=False, duplicate_window_seconds=0)
+
+
+class _NoCache:
+    "List cache that always misses, to time the full list path."
+    def get(self, key, etag):
+        return None
+
+    def put(self, key, etag, body):
+        pass
+
+
+def _client(list_cache):
+    "Builds an app whose services are backed by in-memory fakes."
+    app = flask_app.create_app(SETTINGS)
+    services = app.extensions["services"]
+    repository = FakeContactRepository(build_rows(50))
+    services.contact_controller = ContactController(RegisterContactUseCase(repository, UUIDGenerator()))
+    services.list_contacts_use_case = ListContactsUseCase(repository)
+    services.list_response_cache = list_cache
+    return app.test_client()
+
+
+def _bench(name, list_cache, make_call):
+    def setup():
+        call = make_call(_client(list_cache()))
+        status = call().status_code
+        if status >= 400:
+            raise RuntimeError(f"{name}: unexpected HTTP {status}")
+        return call
+
+    return Benchmark(name, setup)
+
+
+def _post(client):
+    return lambda: client.post("/v1/contact/email", json=VALID_PAYLOAD, headers=HEADERS)
+
+
+def _list(client):
+    return lambda: client.get("/v1/contact/list", headers=HEADERS)
+
+
+def _list_not_modified(client):
+    etag = client.get("/v1/contact/list", headers=HEADERS).headers["ETag"]
+    headers = {**HEADERS, "If-None-Match": etag}
+    return lambda: client.get("/v1/contact/list", headers=headers)
+
+
+BENCHMARKS = [
+    _bench("wsgi.post_contact", ListResponseCache, _post),
+    _bench("wsgi.list_uncached", _NoCache, _list),
+    _bench("wsgi.list_cached", ListResponseCache, _list),
+    _bench("wsgi.list_not_modified", ListResponseCache, _list_not_modified),
+]
@@ -0,0 +1,61 @@
+"""
+Shared fake data and in-memory repositories for the benchmarks.
+"""
+
+from datetime import datetime, timedelta
+
+from src.application.dtos.contact_row import ContactRow
+from src.entities.contact import Contact
+
+VALID_PAYLOAD = {
+    "name": "  Laura   Gómez ",
+    "email": "laura@example.com",
+    "company": "  Industrias   GBA ",
+    "message": "<b>Hola</b>, necesito un diagnóstico de la planta y una cotización. " * 4,
+    "page_location": "https://profebustos.com.ar/#contacto",
+    "traffic_source": "utm_campaign",
+}
+
+
+def build_rows(count):
+    "ContactRow tuples, newest first, like MySQLClient.get_contactos_page returns them."
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        ContactRow(
+            ticket_id=f"ticket-{i:06d}",
+            name="Laura Gómez",
+            email=f"laura{i}@example.com",
+            company="Industrias GBA",
+            message="Necesito un diagnóstico de la planta.",
+            page_location="https://profebustos.com.ar/#contacto",
+            traffic_source="utm_campaign",
+            ip="203.0.113.7",
+            user_agent="Mozilla/5.0",
+            created_at=start - timedelta(minutes=i),
+            id=count - i,
+        )
+        for i in range(count)
+    ]
+
+
+class FakeContactRepository:
+    "Repository double: keeps saved contacts in a list and serves pages from prebuilt rows."
+    def __init__(self, rows):
+        self.rows = rows
+        self.saved = []
+
+    def save(self, contact):
+        self.saved.append(contact)
+        if len(self.saved) > 10_000:
+            del self.saved[:5_000]
+        return contact
+
+    def get_page(self, limit, after=None):
+        return self.rows[:limit], None
+
+    def get_watermark(self):
+        return len(self.rows), len(self.rows)
+
+    def iter_all(self):
+        for row in self.rows:
+            yield Contact(*row[:-1])
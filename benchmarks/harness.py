@@ -0,0 +1,79 @@
+"""
+Minimal benchmark harness: calibrated timing loops and JSON baselines.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (str(ROOT), str(ROOT / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+class Benchmark:
+    "A named callable timed per call; `setup()` returns the callable to time."
+    def __init__(self, name, setup, teardown=None):
+        self.name = name
+        self.setup = setup
+        self.teardown = teardown
+
+
+def measure(func, min_time=0.1, repeat=5):
+    "Calibrates a loop count that runs for ~min_time, then returns per-call best/median in microseconds."
+    number = 1
+    while True:
+        elapsed = _run(func, number)
+        if elapsed >= min_time / 10 or number >= 1_000_000:
+            break
+        number *= 10
+    number = max(1, int(number * (min_time / max(elapsed, 1e-9))))
+    timings = [_run(func, number) / number * 1e6 for _ in range(repeat)]
+    return {"best_us": min(timings), "median_us": statistics.median(timings), "loops": number}
+
+
+def _run(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def machine_info():
+    "Context stored next to baselines: numbers are only comparable on the same machine/interpreter."
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def load_baseline(path):
+    "Returns the stored baseline document, or None."
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path, results):
+    "Writes the results as the new baseline."
+    document = {"machine": machine_info(), "results": results}
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(results, baseline, threshold):
+    "Returns [(name, current_us, baseline_us, ratio)] for benchmarks slower than baseline * (1 + threshold)."
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        ratio = result["best_us"] / previous["best_us"]
+        if ratio > 1 + threshold:
+            regressions.append((name, result["best_us"], previous["best_us"], ratio))
+    return regressions
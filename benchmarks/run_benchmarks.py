@@ -0,0 +1,88 @@
+"""
+Run the benchmark suite and compare against the stored JSON baseline.
+
+    python benchmarks/run_benchmarks.py               # compare, exit 1 on regression
+    python benchmarks/run_benchmarks.py --update      # record a new baseline
+    python benchmarks/run_benchmarks.py -k wsgi       # only benchmarks whose name contains "wsgi"
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Sin logs por request (el logging se configura al importar los módulos de la app).
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from benchmarks.harness import compare, load_baseline, machine_info, measure, save_baseline  # noqa: E402
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+
+def discover():
+    "Collects BENCHMARKS from every benchmarks/bench_*.py module."
+    benchmarks = []
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        module = importlib.import_module(f"benchmarks.{path.stem}")
+        benchmarks.extend(getattr(module, "BENCHMARKS", []))
+    return benchmarks
+
+
+def run(benchmarks, min_time, repeat):
+    results = {}
+    for benchmark in benchmarks:
+        func = benchmark.setup()
+        try:
+            results[benchmark.name] = measure(func, min_time=min_time, repeat=repeat)
+        finally:
+            if benchmark.teardown is not None:
+                benchmark.teardown()
+        result = results[benchmark.name]
+        print(f"{benchmark.name:<36} best {result['best_us']:10.2f} us  median {result['median_us']:10.2f} us")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=float(os.getenv("BENCH_THRESHOLD", "0.25")),
+                        help="allowed slowdown vs. baseline (0.25 = 25%%)")
+    parser.add_argument("-k", dest="keyword", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timing repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in discover() if args.keyword in b.name]
+    results = run(benchmarks, args.min_time, args.repeat)
+
+    if args.update:
+        baseline = load_baseline(args.baseline) or {"results": {}}
+        merged = {**baseline.get("results", {}), **results}
+        save_baseline(args.baseline, merged)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update to create one.")
+        return 0
+    if baseline.get("machine") != machine_info():
+        print("Warning: baseline was recorded on a different machine/interpreter:", baseline.get("machine"))
+    regressions = compare(results, baseline, args.threshold)
+    for name, current, previous, ratio in regressions:
+        print(f"REGRESSION {name}: {current:.2f} us vs baseline {previous:.2f} us ({ratio:.2f}x)")
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
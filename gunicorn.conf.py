@@ -0,0 +1,64 @@
+"""
+Path: gunicorn.conf.py
+"""
+
+# Configuración de gunicorn (Procfile / Railway): `gunicorn -c gunicorn.conf.py wsgi:app`.
+# Con preload_app la app se importa una sola vez en el master; los hooks se ocupan de que
+# cada worker tenga sus propias conexiones, hilos y caches después del fork.
+
+import os
+
+from src.shared.config import Settings
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+# Reciclado de workers: el jitter evita que todos se reinicien a la vez.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+
+def _services(app):
+    return app.extensions["services"]
+
+
+def on_starting(server):
+    "Borra los archivos de métricas de workers de un deploy anterior."
+    metrics_dir = Settings.from_env().metrics_dir
+    if metrics_dir:
+        from src.infrastructure.metrics.metrics_registry import MetricsRegistry  # pylint: disable=import-outside-toplevel
+
+        MetricsRegistry(metrics_dir).reset()
+        server.log.info("Metrics dir %s limpio", metrics_dir)
+
+
+def when_ready(server):
+    "El master no atiende requests: detiene los hilos y conexiones creados al precargar la app."
+    _services(server.app.wsgi()).stop_background_workers()
+
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    "Descarta lo heredado del master y arranca los hilos de fondo propios del worker."
+    services = _services(worker.app.wsgi())
+    services.reset_after_fork()
+    services.start_background_workers()
+
+
+def post_worker_init(worker):
+    "Precalienta el pool y el hot path antes de aceptar tráfico."
+    if not _services(worker.app.wsgi()).warm_up():
+        worker.log.warning("Worker %s arrancó sin base; /health/ready reintentará el warm-up", worker.pid)
+
+
+def worker_exit(server, worker):  # pylint: disable=unused-argument
+    "Vuelca la cola write-behind y cierra el pool al salir (SIGTERM, max_requests)."
+    _services(worker.app.wsgi()).stop_background_workers()
+
+
+def child_exit(server, worker):
+    "En el master, tras la salida de un worker (incluso por timeout o SIGKILL): suma sus métricas al agregado."
+    _services(server.app.wsgi()).metrics.mark_process_dead(worker.pid)
@@ -0,0 +1,47 @@
+"""
+Path: outbox_worker.py
+"""
+
+import argparse
+import signal
+import sys
+
+from src.infrastructure.common.outbox_worker import OutboxWorker
+from src.infrastructure.flask.services import AppServices
+from src.infrastructure.pymysql.mysql_client import MySQLClient
+from src.infrastructure.pymysql.outbox_store import MySQLOutboxStore
+from src.shared.config import Settings
+
+
+def build_worker(settings, args):
+    "Worker del outbox con la configuración de `settings`, pisada por los argumentos de línea de comandos."
+    store = MySQLOutboxStore(MySQLClient().connect)
+    return OutboxWorker(
+        store,
+        AppServices(settings).outbox_handlers,
+        batch_size=args.batch_size or settings.outbox_batch_size,
+        concurrency=args.concurrency or settings.outbox_concurrency,
+        poll_interval=args.poll_interval or settings.outbox_poll_interval,
+        max_attempts=settings.outbox_max_attempts,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Procesa los eventos de contact_outbox (escala con más procesos).")
+    parser.add_argument("--once", action="store_true", help="procesa un solo lote y termina")
+    parser.add_argument("--batch-size", type=int, help="eventos por lote (OUTBOX_BATCH_SIZE)")
+    parser.add_argument("--concurrency", type=int, help="hilos por proceso (OUTBOX_CONCURRENCY)")
+    parser.add_argument("--poll-interval", type=float, help="segundos de espera con el outbox vacío")
+    arguments = parser.parse_args()
+    settings = Settings.from_env()
+    if not settings.contact_outbox:
+        # Sin CONTACT_OUTBOX=true nadie escribe en contact_outbox: se termina sin error en vez de sondear la tabla.
+        print("CONTACT_OUTBOX no está activo: no hay eventos que procesar")
+        sys.exit(0)
+    worker = build_worker(settings, arguments)
+    if arguments.once:
+        print(f"{worker.run_once()} eventos procesados")
+    else:
+        signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+        signal.signal(signal.SIGINT, lambda *_: worker.stop())
+        worker.run()
@@ -2,7 +2,13 @@
 Path: run.py
 """
 
-from src.infrastructure.flask.flask_app import app
+from src.shared.config import load_env
+
+load_env()
+
+from src.infrastructure.flask.flask_app import create_app  # noqa: E402  pylint: disable=wrong-import-position
+
+app = create_app()
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
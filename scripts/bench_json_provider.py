@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: serialization throughput of a /v1/contact/list page with
+Flask's default provider (dict presenter + jsonify) vs. FastJSONProvider.
+"""
+
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+from src.application.dtos.contact_dto import ContactDTO  # noqa: E402
+from src.infrastructure.flask.json_provider import FastJSONProvider, orjson  # noqa: E402
+from src.interface_adapters.presenters.contact_presenter import ContactPresenter  # noqa: E402
+
+
+def build_page(size):
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        ContactDTO(
+            ticket_id=f"ticket-{i:06d}",
+            name="Laura Gómez",
+            email=f"laura{i}@example.com",
+            company="Industrias GBA",
+            message="Necesito un diagnóstico de la planta y una cotización. " * 4,
+            page_location="https://profebustos.com.ar/#contacto",
+            traffic_source="utm_campaign",
+            ip="203.0.113.7",
+            user_agent="Mozilla/5.0 (X11; Linux x86_64)",
+            created_at=start - timedelta(minutes=i),
+        )
+        for i in range(size)
+    ]
+
+
+def measure(func, number, repeat=5):
+    "Mejor tiempo por página en milisegundos."
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e3
+
+
+def main() -> int:
+    app = Flask(__name__)
+    default = DefaultJSONProvider(app)
+    candidates = {"stdlib": FastJSONProvider(app, use_orjson=False)}
+    if orjson is not None:
+        candidates["orjson"] = FastJSONProvider(app)
+
+    for size in (50, 200, 2000):
+        items = build_page(size)
+        number = max(1, 4000 // size)
+
+        def baseline(items=items):
+            dicts = [ContactPresenter.to_response_with_created_at(c) for c in items]
+            return default.dumps({"success": True, "contactos": dicts}).encode("utf-8")
+
+        base_ms = measure(baseline, number)
+        line = f"{size:>5} items  default {base_ms:8.3f} ms"
+        for label, provider in candidates.items():
+            ms = measure(lambda p=provider, i=items: p.dumps_bytes({"success": True, "contactos": i}), number)
+            line += f"  {label} {ms:8.3f} ms ({base_ms / ms:5.1f}x)"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
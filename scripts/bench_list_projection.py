@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: peak memory and time to project 10k listed contacts into
+response dicts, for the previous pipeline (DictCursor row -> Contact ->
+ContactDTO -> dict, without __slots__) vs. the ContactRow read-model path.
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.application.dtos.contact_dto import ContactDTO  # noqa: E402
+from src.application.dtos.contact_row import CONTACT_ROW_FIELDS  # noqa: E402
+from src.entities.contact import Contact  # noqa: E402
+from src.interface_adapters.presenters.contact_presenter import ContactPresenter  # noqa: E402
+
+ROWS = 10_000
+
+
+class LegacyContact:
+    def __init__(self, ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at=None):
+        self.ticket_id = ticket_id
+        self.name = name
+        self.email = email
+        self.company = company
+        self.message = message
+        self.page_location = page_location
+        self.traffic_source = traffic_source
+        self.ip = ip
+        self.user_agent = user_agent
+        self.created_at = created_at
+
+
+@dataclass(frozen=True)
+class LegacyContactDTO:
+    ticket_id: str
+    name: str
+    email: str
+    company: str
+    message: str
+    page_location: str
+    traffic_source: str
+    ip: str
+    user_agent: str
+    created_at: object = None
+    deferred: bool = False
+    replayed: bool = False
+
+
+def build_rows():
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        (
+            f"ticket-{i:06d}",
+            "Laura Gómez",
+            f"laura{i}@example.com",
+            "Industrias GBA",
+            "Necesito un diagnóstico de la planta.",
+            "https://profebustos.com.ar/#contacto",
+            "utm_campaign",
+            "203.0.113.7",
+            "Mozilla/5.0",
+            start - timedelta(minutes=i),
+            ROWS - i,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def entity_pipeline(contact_cls, dto_cls):
+    def run(rows):
+        dict_rows = [dict(zip(CONTACT_ROW_FIELDS, row)) for row in rows]  # lo que entrega DictCursor
+        contacts = [contact_cls(**{k: r[k] for k in CONTACT_ROW_FIELDS[:-1]}) for r in dict_rows]
+        dtos = [dto_cls(**{k: getattr(c, k) for k in CONTACT_ROW_FIELDS[:-1]}) for c in contacts]
+        return [ContactPresenter.to_response_with_created_at(d) for d in dtos]
+    return run
+
+
+def read_model_pipeline(rows):
+    return ContactPresenter.rows_to_response(rows)
+
+
+def measure(func, rows, repeat=5):
+    "Mejor tiempo (ms) y pico de memoria asignada (KiB) para proyectar todas las filas."
+    best = min(_timed(func, rows) for _ in range(repeat))
+    tracemalloc.start()
+    func(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1e3, peak / 1024
+
+
+def _timed(func, rows):
+    start = time.perf_counter()
+    func(rows)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    rows = build_rows()
+    pipelines = {
+        "before (dict, no slots)": entity_pipeline(LegacyContact, LegacyContactDTO),
+        "entities with __slots__": entity_pipeline(Contact, ContactDTO),
+        "ContactRow read-model": read_model_pipeline,
+    }
+    print(f"{ROWS} rows")
+    for label, func in pipelines.items():
+        ms, peak_kib = measure(func, rows)
+        print(f"{label:<26} {ms:8.2f} ms  peak {peak_kib:10.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
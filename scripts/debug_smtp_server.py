@@ -0,0 +1,41 @@
+"""
+Local SMTP stand-in: accepts every message and prints it instead of delivering it.
+
+    python scripts/debug_smtp_server.py --port 1025
+
+Point the app at it with SMTP_HOST=127.0.0.1 SMTP_PORT=1025 SMTP_STARTTLS=false.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.infrastructure.smtp.debug_smtp_server import DebugSMTPServer  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def print_message(message):
+    print(f"--- {message['Subject']} (to {message['To']}, reply-to {message['Reply-To']})")
+    print(message.get_body(preferencelist=("plain",)).get_content())
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args()
+    server = DebugSMTPServer((args.host, args.port), on_message=print_message)
+    print(f"Debug SMTP server listening on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Concurrent load generator for the contact endpoints.
+Reuses the request builders of validate_endpoints.py.
+
+    python scripts/load_endpoints.py --in-memory --requests 2000 --concurrency 16
+    python scripts/load_endpoints.py --base-url http://localhost:5000 --mode asyncio \
+        --mix post=5,invalid=2,list=2,options=1
+
+Against a running server, ORIGIN_VERIFY_SECRET must match and the server should run with
+RATE_LIMIT_ENABLED=false (otherwise most POSTs are answered 429).
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from validate_endpoints import (  # noqa: E402
+    DEFAULT_ENV_PATH,
+    ORIGIN,
+    build_get_list_request,
+    build_post_contact_invalid_request,
+    build_post_contact_request,
+    build_preflight_request,
+    load_env_file,
+    make_request,
+)
+
+DEFAULT_MIX = "post=5,invalid=2,list=2,options=1"
+
+
+class RequestMix:
+    "Elige el tipo de request según pesos y arma (method, path, headers, body) con los builders."
+    def __init__(self, spec, secret, seed=None):
+        self.secret = secret
+        self.kinds = []
+        self.weights = []
+        for part in spec.split(","):
+            kind, _, weight = part.partition("=")
+            if kind not in self.BUILDERS:
+                raise ValueError(f"Unknown request kind '{kind}' (expected one of {sorted(self.BUILDERS)})")
+            self.kinds.append(kind)
+            self.weights.append(float(weight or 1))
+        self._random = random.Random(seed)
+        self._sequence = itertools.count()
+        self._run_id = secrets.token_hex(3)
+        self._lock = threading.Lock()
+
+    BUILDERS = {
+        "post": lambda self, n: build_post_contact_request(self.secret, email=f"load-{self._run_id}-{n}@example.com"),
+        "invalid": lambda self, n: build_post_contact_invalid_request(self.secret),
+        "list": lambda self, n: build_get_list_request(self.secret),
+        "options": lambda self, n: build_preflight_request(self.secret),
+    }
+
+    def next(self):
+        "Retorna (kind, method, path, headers, body)."
+        with self._lock:
+            kind = self._random.choices(self.kinds, self.weights)[0]
+            n = next(self._sequence)
+        method, path, headers, body = self.BUILDERS[kind](self, n)
+        return (kind, method, path, headers, body)
+
+
+class Results:
+    "Acumula latencias, status y error_code por tipo de request."
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.error_codes = Counter()
+        self.transport_errors = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind, status, raw, elapsed):
+        error_code = None
+        if status >= 400 and raw:
+            try:
+                error_code = json.loads(raw).get("error_code")
+            except (ValueError, AttributeError):
+                error_code = None
+        with self._lock:
+            self.latencies[kind].append(elapsed)
+            self.statuses[kind][status] += 1
+            if status >= 400:
+                self.error_codes[f"{status} {error_code or '-'}"] += 1
+
+    def record_failure(self, kind, exc):
+        with self._lock:
+            self.transport_errors[f"{kind}: {exc.__class__.__name__}"] += 1
+
+    def report(self, elapsed):
+        all_latencies = sorted(itertools.chain.from_iterable(self.latencies.values()))
+        total = len(all_latencies) + sum(self.transport_errors.values())
+        return {
+            "requests": total,
+            "seconds": round(elapsed, 3),
+            "throughput_rps": round(total / elapsed, 1) if elapsed else None,
+            "latency_ms": _percentiles(all_latencies),
+            "by_kind": {
+                kind: {
+                    "count": len(values),
+                    "latency_ms": _percentiles(sorted(values)),
+                    "statuses": dict(sorted(self.statuses[kind].items())),
+                }
+                for kind, values in sorted(self.latencies.items())
+            },
+            "error_codes": dict(self.error_codes.most_common()),
+            "transport_errors": dict(self.transport_errors),
+        }
+
+
+def _percentiles(sorted_values):
+    if not sorted_values:
+        return {}
+
+    def rank(p):
+        index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+        return round(sorted_values[index] * 1000, 2)
+
+    return {"p50": rank(50), "p95": rank(95), "p99": rank(99), "max": round(sorted_values[-1] * 1000, 2)}
+
+
+def run_threads(base_url, mix, results, total, concurrency):
+    "Cada hilo dispara requests bloqueantes con validate_endpoints.make_request."
+    remaining = itertools.count()
+
+    def worker():
+        while next(remaining) < total:
+            kind, method, path, headers, body = mix.next()
+            start = time.perf_counter()
+            try:
+                status, raw = make_request(method, path, headers=headers, body=body, base_url=base_url)
+            except RuntimeError as exc:
+                results.record_failure(kind, exc)
+                continue
+            results.record(kind, status, raw, time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+
+
+async def _send(reader, writer, host, method, path, headers, body):
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", f"Origin: {ORIGIN}", f"Content-Length: {len(payload)}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed by server")
+    status = int(status_line.split()[1])
+    response_headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        response_headers[name.strip().lower()] = value.strip()
+    if "content-length" in response_headers:
+        raw = await reader.readexactly(int(response_headers["content-length"]))
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+    else:
+        raw = await reader.read()
+        keep_alive = False
+    return status, raw, keep_alive
+
+
+async def _async_worker(base_url, mix, results, remaining, total):
+    parts = urlsplit(base_url)
+    host, port = parts.hostname, parts.port or 80
+    connection = None
+    while next(remaining) < total:
+        kind, method, path, headers, body = mix.next()
+        start = time.perf_counter()
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(host, port)
+            status, raw, keep_alive = await _send(*connection, parts.netloc, method, path, headers, body)
+        except (OSError, ValueError, asyncio.IncompleteReadError) as exc:
+            results.record_failure(kind, exc)
+            connection = None
+            continue
+        results.record(kind, status, raw, time.perf_counter() - start)
+        if not keep_alive:
+            connection[1].close()
+            connection = None
+    if connection is not None:
+        connection[1].close()
+
+
+def run_asyncio(base_url, mix, results, total, concurrency):
+    "Un event loop con `concurrency` corutinas, cada una con su conexión HTTP/1.1 keep-alive."
+    remaining = itertools.count()
+
+    async def main():
+        await asyncio.gather(*(
+            _async_worker(base_url, mix, results, remaining, total) for _ in range(concurrency)
+        ))
+
+    asyncio.run(main())
+
+
+def start_in_memory_server():
+    "Levanta la app en este proceso con un repositorio en memoria (sin MySQL)."
+    secret = secrets.token_hex(16)
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from werkzeug.serving import WSGIRequestHandler, make_server  # pylint: disable=import-outside-toplevel
+
+    from src.infrastructure.flask.flask_app import create_app  # pylint: disable=import-outside-toplevel
+    from src.shared.config import Settings  # pylint: disable=import-outside-toplevel
+
+    app = create_app(Settings(
+        origin_verify_secret=secret,
+        contact_repository="memory",
+        rate_limit_enabled=False,
+        duplicate_window_seconds=0,
+    ))
+
+    class QuietHandler(WSGIRequestHandler):
+        "Sin una línea de access log por request (distorsiona la medición)."
+        def log_request(self, code="-", size="-"):
+            pass
+
+    server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, name="load-server", daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", secret, server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost:5000"))
+    parser.add_argument("--in-memory", action="store_true", help="serve the app in-process with an in-memory repository")
+    parser.add_argument("--mode", choices=("threads", "asyncio"), default="threads")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted request kinds (default: {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.in_memory:
+        base_url, secret, server = start_in_memory_server()
+    else:
+        load_env_file(DEFAULT_ENV_PATH)
+        base_url, secret = args.base_url, os.getenv("ORIGIN_VERIFY_SECRET")
+        if not secret:
+            print("Missing ORIGIN_VERIFY_SECRET in environment or .env.")
+            return 1
+
+    mix = RequestMix(args.mix, secret, seed=args.seed)
+    results = Results()
+    runner = run_asyncio if args.mode == "asyncio" else run_threads
+    start = time.perf_counter()
+    try:
+        runner(base_url, mix, results, args.requests, args.concurrency)
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            server.shutdown()
+    report = results.report(elapsed)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    latency = report["latency_ms"]
+    print(f"{report['requests']} requests in {report['seconds']}s ({report['throughput_rps']} req/s), "
+          f"mode={args.mode} concurrency={args.concurrency}")
+    print(f"latency ms: p50={latency.get('p50')} p95={latency.get('p95')} p99={latency.get('p99')} max={latency.get('max')}")
+    for kind, data in report["by_kind"].items():
+        print(f"  {kind:<8} n={data['count']:<6} p50={data['latency_ms']['p50']:<8} "
+              f"p95={data['latency_ms']['p95']:<8} p99={data['latency_ms']['p99']:<8} statuses={data['statuses']}")
+    if report["error_codes"]:
+        print("error codes:", report["error_codes"])
+    if report["transport_errors"]:
+        print("transport errors:", report["transport_errors"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
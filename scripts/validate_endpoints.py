@@ -30,8 +30,8 @@ def load_env_file(path):
                 os.environ[key] = value
 
 
-def make_request(method, path, headers=None, body=None):
-    url = f"{BASE_URL}{path}"
+def make_request(method, path, headers=None, body=None, base_url=None):
+    url = f"{base_url or BASE_URL}{path}"
     data = None
     if body is not None:
         data = json.dumps(body).encode("utf-8")
@@ -53,27 +53,23 @@ def assert_key(payload, key):
         raise AssertionError(f"Missing key '{key}' in payload: {payload}")
 
 
-def validate_post_contact(secret):
+def build_post_contact_request(secret, email="ada@example.com"):
     headers = {
         "Content-Type": "application/json",
         "X-Origin-Verify": secret,
     }
     body = {
         "name": "Ada Lovelace",
-        "email": "ada@example.com",
+        "email": email,
         "company": "Analytical Engines",
         "message": "Hello",
         "page_location": "/",
         "traffic_source": "direct",
     }
-    status, raw = make_request("POST", "/v1/contact/email", headers=headers, body=body)
-    if status != 201:
-        raise AssertionError(f"POST /v1/contact/email expected 201, got {status}: {raw}")
-    payload = json.loads(raw.decode("utf-8"))
-    assert_key(payload, "ticket_id")
+    return "POST", "/v1/contact/email", headers, body
 
 
-def validate_post_contact_invalid(secret):
+def build_post_contact_invalid_request(secret):
     headers = {
         "Content-Type": "application/json",
         "X-Origin-Verify": secret,
@@ -86,7 +82,33 @@ def validate_post_contact_invalid(secret):
         "page_location": "",
         "traffic_source": "",
     }
-    status, raw = make_request("POST", "/v1/contact/email", headers=headers, body=body)
+    return "POST", "/v1/contact/email", headers, body
+
+
+def build_get_list_request(secret):
+    return "GET", "/v1/contact/list", {"X-Origin-Verify": secret}, None
+
+
+def build_preflight_request(secret=None):
+    headers = {
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type",
+    }
+    return "OPTIONS", "/v1/contact/email", headers, None
+
+
+def validate_post_contact(secret):
+    method, path, headers, body = build_post_contact_request(secret)
+    status, raw = make_request(method, path, headers=headers, body=body)
+    if status != 201:
+        raise AssertionError(f"POST /v1/contact/email expected 201, got {status}: {raw}")
+    payload = json.loads(raw.decode("utf-8"))
+    assert_key(payload, "ticket_id")
+
+
+def validate_post_contact_invalid(secret):
+    method, path, headers, body = build_post_contact_invalid_request(secret)
+    status, raw = make_request(method, path, headers=headers, body=body)
     if status != 400:
         raise AssertionError(f"POST invalid expected 400, got {status}: {raw}")
     payload = json.loads(raw.decode("utf-8"))
@@ -96,8 +118,8 @@ def validate_post_contact_invalid(secret):
 
 
 def validate_get_list(secret):
-    headers = {"X-Origin-Verify": secret}
-    status, raw = make_request("GET", "/v1/contact/list", headers=headers)
+    method, path, headers, body = build_get_list_request(secret)
+    status, raw = make_request(method, path, headers=headers, body=body)
     if status != 200:
         raise AssertionError(f"GET /v1/contact/list expected 200, got {status}: {raw}")
     payload = json.loads(raw.decode("utf-8"))
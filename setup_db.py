@@ -5,14 +5,13 @@ Path: setup_db.py
 
 
 from src.infrastructure.pymysql.create_db_if_not_exists import DatabaseCreator
-from src.infrastructure.pymysql.create_table_if_not_exists import TableCreator
+from src.infrastructure.pymysql.schema_migrator import SchemaMigrator
 from src.infrastructure.pymysql.setup import MySQLSetupChecker
 
 if __name__ == "__main__":
     db_creator = DatabaseCreator()
     db_creator.create_database_if_not_exists()
-    table_creator = TableCreator()
-    table_creator.create_contactos_table()
+    SchemaMigrator().migrate()
     checker = MySQLSetupChecker()
     checker.logger.info("=== Verificación de entorno MySQL ===")
     if checker.connect():
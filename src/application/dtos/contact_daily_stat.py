@@ -0,0 +1,10 @@
+"""
+Path: src/application/dtos/contact_daily_stat.py
+"""
+
+from collections import namedtuple
+
+# Una fila del rollup diario: contactos por (day, site, traffic_source).
+CONTACT_DAILY_STAT_FIELDS = ("day", "site", "traffic_source", "contacts")
+
+ContactDailyStat = namedtuple("ContactDailyStat", CONTACT_DAILY_STAT_FIELDS)
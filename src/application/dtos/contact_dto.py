@@ -5,7 +5,7 @@ Path: src/application/dtos/contact_dto.py
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContactDTO:
     ticket_id: str
     name: str
@@ -17,3 +17,5 @@ class ContactDTO:
     ip: str
     user_agent: str
     created_at: object = None
+    deferred: bool = False
+    replayed: bool = False
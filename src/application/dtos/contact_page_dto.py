@@ -0,0 +1,12 @@
+"""
+Path: src/application/dtos/contact_page_dto.py
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ContactPageDTO:
+    items: list
+    limit: int
+    next_after: tuple = None
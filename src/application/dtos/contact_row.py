@@ -0,0 +1,24 @@
+"""
+Path: src/application/dtos/contact_row.py
+"""
+
+from collections import namedtuple
+
+# Read-model del listado: una tupla por fila, en este orden. El repositorio puede devolver
+# tuplas planas con la misma forma (p. ej. directo del cursor) sin construir objetos.
+# `id` va al final para que las proyecciones de salida lo descarten con zip().
+CONTACT_ROW_FIELDS = (
+    "ticket_id",
+    "name",
+    "email",
+    "company",
+    "message",
+    "page_location",
+    "traffic_source",
+    "ip",
+    "user_agent",
+    "created_at",
+    "id",
+)
+
+ContactRow = namedtuple("ContactRow", CONTACT_ROW_FIELDS)
@@ -0,0 +1,13 @@
+"""
+Path: src/application/dtos/contact_search_query.py
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ContactSearchQuery:
+    # Búsqueda por texto (todas las palabras, como prefijo, en name/company/message) o, si la
+    # consulta parece un email, por prefijo de email.
+    terms: tuple = ()
+    email_prefix: str | None = None
@@ -0,0 +1,14 @@
+"""
+Path: src/application/dtos/contact_stats_dto.py
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class ContactStatsDTO:
+    start: date
+    end: date
+    rows: list
+    totals: dict
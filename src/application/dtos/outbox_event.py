@@ -0,0 +1,14 @@
+"""
+Path: src/application/dtos/outbox_event.py
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEvent:
+    id: int
+    event_type: str
+    ticket_id: str
+    payload: dict
+    attempts: int = 0
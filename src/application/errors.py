@@ -17,3 +17,11 @@ class ContactListFailed(ApplicationError):
 
 class DatabaseUnavailable(ApplicationError):
     "Raised when the database is unavailable."
+
+
+class ContactQueueFull(ApplicationError):
+    "Raised when the deferred write queue cannot accept more contacts."
+
+
+class IdempotencyKeyReused(ApplicationError):
+    "Raised when an Idempotency-Key is replayed with a different payload."
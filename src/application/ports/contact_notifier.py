@@ -0,0 +1,14 @@
+"""
+Path: src/application/ports/contact_notifier.py
+"""
+
+from typing import Protocol
+
+from src.application.dtos.contact_dto import ContactDTO
+
+
+class ContactNotifier(Protocol):
+    "Hands registered contacts off for notification (e.g. a transactional email)."
+    def notify(self, contact: ContactDTO) -> None:
+        "Enqueue a notification without blocking; must not raise on delivery problems."
+        raise NotImplementedError
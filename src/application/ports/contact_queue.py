@@ -0,0 +1,14 @@
+"""
+Path: src/application/ports/contact_queue.py
+"""
+
+from typing import Protocol
+
+from src.entities.contact import Contact
+
+
+class ContactQueue(Protocol):
+    "Accepts contacts for deferred persistence."
+    def submit(self, contact: Contact) -> None:
+        "Enqueue a contact; raise ContactQueueFull if it cannot be accepted."
+        raise NotImplementedError
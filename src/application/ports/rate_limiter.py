@@ -0,0 +1,12 @@
+"""
+Path: src/application/ports/rate_limiter.py
+"""
+
+from typing import Protocol
+
+
+class RateLimiter(Protocol):
+    "Limits how often a client may submit, keyed by scope (e.g. ip, email)."
+    def hit(self, keys: dict) -> float:
+        "Consume one unit for every scope/value pair; return 0 if allowed or the seconds to wait."
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+"""
+Path: src/application/ports/submission_cache.py
+"""
+
+from typing import Optional, Protocol
+
+from src.application.dtos.contact_dto import ContactDTO
+
+
+class SubmissionCache(Protocol):
+    "Remembers recent registrations to answer duplicate submissions."
+    def get(self, key: str) -> Optional[ContactDTO]:
+        "Return the registration stored under key, if still fresh."
+        raise NotImplementedError
+
+    def put(self, key: str, value: ContactDTO) -> None:
+        "Store a registration under key."
+        raise NotImplementedError
@@ -4,6 +4,19 @@ Path: src/entities/contact.py
 
 class Contact:
     "Representa un contacto registrado a traves del formulario."
+    __slots__ = (
+        "ticket_id",
+        "name",
+        "email",
+        "company",
+        "message",
+        "page_location",
+        "traffic_source",
+        "ip",
+        "user_agent",
+        "created_at",
+    )
+
     def __init__(self, ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at=None):
         self.ticket_id = ticket_id
         self.name = name
@@ -0,0 +1,25 @@
+"""
+Path: src/entities/traffic_attribution.py
+"""
+
+from urllib.parse import parse_qs, urlsplit
+
+DIRECT = "direct"
+MAX_SITE_LENGTH = 255
+MAX_SOURCE_LENGTH = 128
+
+
+def traffic_attribution(page_location, traffic_source=None):
+    "Devuelve (site, source) de un contacto: host de page_location y su utm_source (o traffic_source, o 'direct')."
+    site, utm_source = "", None
+    if page_location:
+        parts = urlsplit(page_location.strip())
+        site = (parts.hostname or "").removeprefix("www.")
+        # Las SPA con hash routing llevan los UTM después del #: se revisan ambas query strings.
+        for query in (parts.query, urlsplit(parts.fragment).query):
+            values = parse_qs(query).get("utm_source")
+            if values and values[0].strip():
+                utm_source = values[0]
+                break
+    source = (utm_source or traffic_source or "").strip().lower() or DIRECT
+    return site[:MAX_SITE_LENGTH], source[:MAX_SOURCE_LENGTH]
@@ -0,0 +1,202 @@
+"""
+Path: src/infrastructure/aiomysql/aiomysql_contact_repository.py
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
+import pymysql
+
+from src.application.dtos.contact_row import ContactRow
+from src.application.errors import ContactCreateFailed, ContactListFailed, DatabaseUnavailable
+from src.infrastructure.common.utc_clock import utc_now
+from src.infrastructure.pymysql.db_config import SESSION_INIT_COMMAND, load_db_config
+from src.infrastructure.pymysql.mysql_client import (
+    OUTBOX_INSERT,
+    STATS_INCREMENT,
+    daily_stats_increments,
+    outbox_event,
+)
+from src.interface_adapters.gateways.async_contact_repository import AsyncContactRepository
+from src.shared.logger_flask_v0 import get_logger
+
+try:
+    import aiomysql
+except ImportError:  # pragma: no cover - dependencia opcional, solo para asgi.py con MySQL
+    aiomysql = None
+
+logger = get_logger("aiomysql_contact_repository")
+
+# Mismas consultas que MySQLClient; el orden de columnas es CONTACT_ROW_FIELDS.
+INSERT_SQL = (
+    "INSERT INTO contactos ("
+    "ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at"
+    ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+PAGE_COLUMNS = (
+    "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at, id "
+    "FROM contactos "
+)
+PAGE_ORDER = "ORDER BY created_at DESC, id DESC LIMIT %s"
+WATERMARK_SQL = "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM contactos"
+
+
+class AioMySQLContactRepository(AsyncContactRepository):
+    "Repositorio MySQL asíncrono (aiomysql): un pool por proceso, creado en el primer uso."
+    def __init__(
+        self,
+        host=None,
+        user=None,
+        password=None,
+        db=None,
+        port=None,
+        pool_size=None,
+        metrics=None,
+        outbox=False,
+        daily_stats=False,
+    ):
+        if aiomysql is None:
+            raise RuntimeError("CONTACT_REPOSITORY=mysql en asgi.py requiere aiomysql (pip install aiomysql)")
+        self.config = load_db_config(host=host, user=user, password=password, db=db, port=port)
+        # Sin threads por request, el pool puede ser bastante más grande que el de MySQLClient.
+        self.pool_size = pool_size or int(os.getenv("MYSQL_ASYNC_POOL_SIZE", "20"))
+        self.max_idle_seconds = int(os.getenv("MYSQL_POOL_MAX_IDLE", "300"))
+        self.metrics = metrics
+        self.outbox = outbox
+        self.daily_stats = daily_stats
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def save(self, contact):
+        "Guarda un contacto y lo retorna."
+        async with self._query("insert", ContactCreateFailed) as connection:
+            async with connection.cursor() as cursor:
+                values = (
+                    contact.ticket_id,
+                    contact.name,
+                    contact.email,
+                    contact.company,
+                    contact.message,
+                    contact.page_location,
+                    contact.traffic_source,
+                    contact.ip,
+                    contact.user_agent,
+                    contact.created_at or utc_now(),
+                )
+                await cursor.execute(INSERT_SQL, values)
+                if self.outbox:
+                    await cursor.execute(OUTBOX_INSERT, outbox_event(values))
+                if self.daily_stats:
+                    await cursor.executemany(STATS_INCREMENT, daily_stats_increments([values]))
+            await connection.commit()
+        self._notify_change()
+        return contact
+
+    async def get_page(self, limit, after=None):
+        "Devuelve una página de filas ContactRow y el keyset (created_at, id) de la siguiente."
+        async with self._query("select_page", ContactListFailed) as connection:
+            async with connection.cursor() as cursor:
+                # Se pide una fila extra para saber si existe una página siguiente.
+                if after is None:
+                    await cursor.execute(PAGE_COLUMNS + PAGE_ORDER, (limit + 1,))
+                else:
+                    created_at, last_id = after
+                    await cursor.execute(
+                        PAGE_COLUMNS + "WHERE created_at < %s OR (created_at = %s AND id < %s) " + PAGE_ORDER,
+                        (created_at, created_at, last_id, limit + 1),
+                    )
+                rows = [ContactRow(*raw) for raw in await cursor.fetchall()]
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1].created_at, rows[-1].id)
+        return rows, next_after
+
+    async def get_watermark(self):
+        "Devuelve (max(id), count)."
+        async with self._query("watermark", ContactListFailed) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(WATERMARK_SQL)
+                max_id, total = await cursor.fetchone()
+        return max_id, total
+
+    async def ping(self):
+        "Verifica que el pool pueda entregar una conexión viva."
+        async with self._query("ping", DatabaseUnavailable) as connection:
+            await connection.ping(reconnect=False)
+
+    async def warm(self, connections):
+        "Abre hasta `connections` conexiones del pool antes del primer request."
+        pool = await self._get_pool()
+        count = min(connections, self.pool_size)
+        try:
+            acquired = await asyncio.gather(*(pool.acquire() for _ in range(count)))
+        except (ConnectionError, TimeoutError, pymysql.Error) as exc:
+            raise DatabaseUnavailable() from exc
+        for connection in acquired:
+            pool.release(connection)
+
+    async def close(self):
+        "Cierra el pool y espera a que se liberen sus conexiones."
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+    def pool_stats(self):
+        "Métricas del pool de aiomysql (mismas claves de tamaño que MySQLConnectionPool)."
+        pool = self._pool
+        if pool is None:
+            return {"max_size": self.pool_size, "size": 0, "idle": 0, "in_use": 0}
+        return {
+            "max_size": pool.maxsize,
+            "size": pool.size,
+            "idle": pool.freesize,
+            "in_use": pool.size - pool.freesize,
+        }
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    try:
+                        self._pool = await aiomysql.create_pool(
+                            host=self.config["host"],
+                            user=self.config["user"],
+                            password=self.config["password"] or "",
+                            db=self.config["db"],
+                            port=self.config["port"],
+                            minsize=0,
+                            maxsize=self.pool_size,
+                            pool_recycle=self.max_idle_seconds,
+                            connect_timeout=5,
+                            init_command=SESSION_INIT_COMMAND,
+                        )
+                    except (ConnectionError, TimeoutError, pymysql.Error) as exc:
+                        logger.error("Error de conexión a MySQL (aiomysql): %s", exc)
+                        raise DatabaseUnavailable() from exc
+        return self._pool
+
+    @asynccontextmanager
+    async def _query(self, operation, failure):
+        "Presta una conexión del pool registrando latencia y errores, y traduce los errores de MySQL."
+        start = time.perf_counter()
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as connection:
+                yield connection
+        except Exception as exc:
+            if self.metrics is not None:
+                self.metrics.inc("mysql_query_errors_total", {"operation": operation, "error": exc.__class__.__name__})
+            if isinstance(exc, (pymysql.err.OperationalError, pymysql.err.InterfaceError)):
+                raise DatabaseUnavailable() from exc
+            if isinstance(exc, (pymysql.Error, ConnectionError, TimeoutError, ValueError)):
+                raise failure() from exc
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe(
+                    "mysql_query_duration_seconds", time.perf_counter() - start, {"operation": operation}
+                )
@@ -0,0 +1,217 @@
+"""
+Path: src/infrastructure/asgi/asgi_app.py
+"""
+
+import json
+import time
+import uuid
+from urllib.parse import parse_qsl
+
+from src.application.errors import ContactListFailed, DatabaseUnavailable
+from src.infrastructure.asgi.services import AsyncAppServices
+from src.infrastructure.common import contact_http
+from src.infrastructure.common.contact_http import MAX_CONTENT_LENGTH
+from src.infrastructure.flask.json_provider import dumps_bytes
+from src.infrastructure.flask.list_response_cache import make_etag
+from src.interface_adapters.controllers.pagination import parse_page_params
+from src.shared.config import Settings
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("asgi_app")
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+def create_asgi_app(settings=None, services=None):
+    "Crea la app ASGI; `settings` se toma del entorno (una sola vez) si no se pasa."
+    settings = settings or Settings.from_env()
+    return ContactASGIApp(settings, services or AsyncAppServices(settings))
+
+
+class Headers:
+    "Headers del request con búsqueda sin distinguir mayúsculas (como werkzeug)."
+    def __init__(self, raw_headers):
+        self._values = {}
+        for name, value in raw_headers:
+            key = name.decode("latin-1").lower()
+            value = value.decode("latin-1")
+            self._values[key] = f"{self._values[key]}, {value}" if key in self._values else value
+
+    def get(self, name, default=None):
+        "Devuelve el header `name` o `default`."
+        return self._values.get(name.lower(), default)
+
+
+class AsgiRequest:
+    "Vista mínima del request con la interfaz que usa ContactController (is_json, get_json, headers, ...)."
+    def __init__(self, scope, body, too_large=False):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.headers = Headers(scope.get("headers") or ())
+        self.args = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        client = scope.get("client")
+        self.remote_addr = client[0] if client else None
+        self.content_type = self.headers.get("Content-Type")
+        self.body = body
+        self.too_large = too_large
+        self._json = None
+        self.is_json = False
+        mimetype = (self.content_type or "").split(";")[0].strip().lower()
+        if mimetype == "application/json" or (mimetype.startswith("application/") and mimetype.endswith("+json")):
+            try:
+                self._json = json.loads(body) if body else None
+                self.is_json = True
+            except ValueError:
+                # JSON mal formado se responde como JSON_REQUIRED desde el controller.
+                self.is_json = False
+
+    def get_json(self):
+        "Devuelve el cuerpo JSON ya decodificado."
+        return self._json
+
+
+class ContactASGIApp:
+    "App ASGI con las rutas de contacto y health; un router propio, sin framework."
+    def __init__(self, settings, services):
+        self.settings = settings
+        self.services = services
+        self.use_orjson = settings.json_encoder != "stdlib"
+        self.routes = {
+            "/v1/contact/email": {"POST": self.registrar_contacto, "OPTIONS": self.preflight_contact},
+            "/v1/contact/list": {"GET": self.listar_contactos},
+            "/health": {"GET": self.health_check},
+            "/health/db": {"GET": self.health_check_db},
+            "/health/ready": {"GET": self.health_check_ready},
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        start = time.perf_counter()
+        body, too_large = await _read_body(scope, receive)
+        request = AsgiRequest(scope, body, too_large)
+        request_id = request.headers.get("CF-RAY") or request.headers.get("X-Request-Id") or str(uuid.uuid4())
+        route, (status, headers, payload) = await self._dispatch(request)
+        cors = contact_http.cors_headers(request.method, request.path, request.headers.get("Origin"))
+        headers = headers + _encode_headers(cors) + [(b"x-request-id", request_id.encode("latin-1"))]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": payload})
+        elapsed = time.perf_counter() - start
+        contact_http.record_request(self.services.metrics, request.method, route, status, elapsed)
+        contact_http.log_request(logger, request, status, self.settings.log_sample_rate, request_id, elapsed)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.services.start_background_workers()
+                if not await self.services.warm_up():
+                    logger.warning("ASGI arrancó sin base; /health/ready reintentará el warm-up")
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.services.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _dispatch(self, request):
+        methods = self.routes.get(request.path)
+        if methods is None:
+            return "unmatched", self._respond(contact_http.not_found(request.path))
+        handler = methods.get(request.method)
+        if handler is None:
+            return request.path, self._respond(contact_http.method_not_allowed())
+        forbidden = contact_http.origin_verify_failure(request.method, request.path, request.headers, self.settings)
+        if forbidden is not None:
+            return request.path, self._respond(forbidden)
+        try:
+            return request.path, await handler(request)
+        except Exception as exc:  # pylint: disable=broad-except
+            return request.path, self._respond(contact_http.internal_error(exc, self.settings.development))
+
+    async def preflight_contact(self, request):  # pylint: disable=unused-argument
+        "Manejo de preflight CORS para /v1/contact/email."
+        return 204, [], b""
+
+    async def registrar_contacto(self, request):
+        "Endpoint para registrar datos de contacto."
+        metrics = self.services.metrics
+        rejection = contact_http.contact_request_rejection(request.content_type, request.too_large, metrics)
+        if rejection is not None:
+            return self._respond(rejection)
+        response, status = await self.services.contact_controller.registrar_contacto_async(request)
+        return self._respond(contact_http.contact_response(response, status, metrics))
+
+    async def listar_contactos(self, request):
+        "Devuelve una página de contactos registrados, del más reciente al más antiguo."
+        try:
+            limit, after = parse_page_params(request.args)
+        except ValueError:
+            return self._respond(contact_http.invalid_pagination())
+        cache_key = contact_http.list_cache_key(limit, request.args)
+        list_contacts_use_case = self.services.list_contacts_use_case
+        list_response_cache = self.services.list_response_cache
+        try:
+            etag = make_etag(await list_contacts_use_case.watermark(), cache_key)
+            headers = _encode_headers({"ETag": f'"{etag}"', **contact_http.LIST_CACHE_HEADERS})
+            if contact_http.etag_matches(request.headers.get("If-None-Match"), etag):
+                return 304, headers, b""
+            body = list_response_cache.get(cache_key, etag)
+            if body is None:
+                page = await list_contacts_use_case.execute_page(limit=limit, after=after)
+                body = dumps_bytes(contact_http.page_body(page), use_orjson=self.use_orjson)
+                list_response_cache.put(cache_key, etag, body)
+            return 200, JSON_HEADERS + headers, body
+        except DatabaseUnavailable:
+            return self._respond(contact_http.db_unavailable())
+        except ContactListFailed as e:
+            return self._respond(contact_http.read_failed(e, "obtener contactos", 'Error al obtener los contactos'))
+
+    async def health_check(self, request):  # pylint: disable=unused-argument
+        "Health check endpoint."
+        return self._respond(contact_http.health())
+
+    async def health_check_db(self, request):  # pylint: disable=unused-argument
+        "DB health check endpoint."
+        repository = self.services.async_contact_repository
+        try:
+            await repository.ping()
+        except (DatabaseUnavailable, ConnectionError, TimeoutError, ValueError) as exc:
+            return self._respond(contact_http.db_health_failed(exc))
+        return self._respond(contact_http.db_health(self.settings.contact_repository, repository.pool_stats()))
+
+    async def health_check_ready(self, request):  # pylint: disable=unused-argument
+        "Readiness: 200 una vez que el proceso terminó el warm-up (lo reintenta si todavía no)."
+        return self._respond(contact_http.readiness(self.services.ready or await self.services.warm_up()))
+
+    def _respond(self, result):
+        "Serializa un (cuerpo, status, headers) de contact_http como respuesta ASGI."
+        body, status, headers = result
+        return status, JSON_HEADERS + _encode_headers(headers), dumps_bytes(body, use_orjson=self.use_orjson)
+
+
+async def _read_body(scope, receive):
+    "Lee el cuerpo hasta MAX_CONTENT_LENGTH; devuelve (bytes, excedido)."
+    for name, value in scope.get("headers") or ():
+        if name.lower() == b"content-length" and value.isdigit() and int(value) > MAX_CONTENT_LENGTH:
+            return b"", True
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_CONTENT_LENGTH:
+            return b"", True
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks), False
+
+
+def _encode_headers(headers):
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
@@ -0,0 +1,86 @@
+"""
+Path: src/infrastructure/asgi/services.py
+"""
+
+# pylint: disable=import-outside-toplevel
+
+from functools import cached_property
+
+from src.application.errors import DatabaseUnavailable
+from src.infrastructure.flask.services import AppServices
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.services")
+
+
+class AsyncAppServices(AppServices):
+    "Dependencias del entrypoint ASGI: las mismas de AppServices, con repositorio y casos de uso asíncronos."
+    # `contact_repository` (síncrono) sigue existiendo para los hilos del spool y la cola
+    # write-behind; el alta directa y el listado usan `async_contact_repository`.
+
+    @cached_property
+    def async_contact_repository(self):
+        "Repositorio asíncrono según CONTACT_REPOSITORY: aiomysql, o el síncrono envuelto (sqlite, memory)."
+        backend = self.settings.contact_repository
+        if backend == "mysql":
+            from src.infrastructure.aiomysql.aiomysql_contact_repository import AioMySQLContactRepository
+
+            repository = AioMySQLContactRepository(
+                metrics=self.metrics,
+                outbox=self.settings.contact_outbox,
+                daily_stats=self.settings.contact_stats_inline,
+            )
+            repository.add_change_listener(self.list_response_cache.invalidate)
+            return repository
+        from src.interface_adapters.gateways.threaded_async_contact_repository import (
+            ThreadedAsyncContactRepository,
+        )
+
+        # Envuelve la misma instancia que usan el spool y la cola (y que ya invalida el cache);
+        # el repositorio en memoria no bloquea y se llama en línea.
+        return ThreadedAsyncContactRepository(self.contact_repository, offload=backend != "memory")
+
+    @cached_property
+    def contact_controller(self):
+        "Controller del alta de contactos, con el caso de uso asíncrono."
+        from src.infrastructure.common.uuid_generator import UUIDGenerator
+        from src.interface_adapters.controllers.contact_controller import ContactController
+        from src.use_cases.register_contact import AsyncRegisterContactUseCase
+
+        use_case = AsyncRegisterContactUseCase(
+            self.async_contact_repository,
+            UUIDGenerator(),
+            self.contact_write_queue,
+            self.contact_spool,
+            self.submission_cache,
+            self.contact_notifier,
+        )
+        return ContactController(use_case, self.rate_limiter, debug=self.settings.development)
+
+    @cached_property
+    def list_contacts_use_case(self):
+        "Caso de uso asíncrono del listado."
+        from src.use_cases.list_contacts import AsyncListContactsUseCase
+
+        return AsyncListContactsUseCase(self.async_contact_repository)
+
+    async def warm_up(self):  # pylint: disable=invalid-overridden-method
+        "Construye el hot path y abre conexiones del pool asíncrono; marca `ready` si la base responde."
+        # pylint: disable=pointless-statement
+        self.contact_controller
+        self.list_contacts_use_case
+        self.metrics
+        try:
+            await self.async_contact_repository.warm(self.settings.mysql_pool_warm)
+        except DatabaseUnavailable as exc:
+            logger.warning("Warm-up incompleto, la base no responde: %s", exc.__class__.__name__)
+            return False
+        self.ready = True
+        return True
+
+    async def aclose(self):
+        "Vuelca la cola write-behind y los avisos, detiene el replay del spool y cierra los pools."
+        self.stop_background_workers()
+        repository = self.__dict__.get("async_contact_repository")
+        if repository is not None:
+            await repository.close()
@@ -0,0 +1,219 @@
+"""
+Path: src/infrastructure/common/contact_http.py
+"""
+
+import random
+
+from src.interface_adapters.presenters.contact_presenter import ContactPresenter
+from src.interface_adapters.controllers.pagination import encode_cursor
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("contact_http")
+
+# Piezas HTTP comunes a flask_app y asgi_app. Cada handler devuelve (cuerpo, status, headers) y
+# cada entrypoint solo lo serializa: payloads de error, CORS y logs no pueden divergir.
+MAX_CONTENT_LENGTH = 20 * 1024
+DEV_ORIGIN = "http://localhost:5173"
+CONTACT_PREFIX = "/v1/contact/"
+# CORS explícito para la ruta crítica de contacto
+CORS_RESOURCES = {
+    r"/v1/contact/*": {
+        "origins": [
+            DEV_ORIGIN,
+            "https://datamaq.com.ar",
+            "https://www.datamaq.com.ar",
+            "https://profebustos.com.ar",
+            "https://www.profebustos.com.ar",
+        ],
+        "methods": ["POST", "OPTIONS"],
+        "allow_headers": ["Content-Type", "X-Origin-Verify", "Idempotency-Key"],
+        "max_age": 600,
+    }
+}
+CONTACT_CORS = CORS_RESOURCES[r"/v1/contact/*"]
+LIST_CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+
+def error_body(message, error_code=None):
+    "Payload de error estándar: success, error y (si hay) error_code."
+    body = {'success': False, 'error': message}
+    if error_code is not None:
+        body['error_code'] = error_code
+    return body
+
+
+def forbidden():
+    "403 de X-Origin-Verify (sin error_code, como siempre)."
+    return error_body("Forbidden"), 403, {}
+
+
+def not_found(detail):
+    "404 con el payload de la API."
+    logger.warning("Recurso no encontrado: %s", str(detail))
+    return error_body('Recurso no encontrado (404)', 'NOT_FOUND'), 404, {}
+
+
+def method_not_allowed():
+    "405 con el payload de la API."
+    return error_body('Método no permitido', 'METHOD_NOT_ALLOWED'), 405, {}
+
+
+def internal_error(exc, development):
+    "500 de una excepción no capturada; el detalle solo en desarrollo."
+    logger.exception("Error inesperado: %s", str(exc))
+    message = f'Ocurrió un error técnico. Detalle: {str(exc)}' if development else 'Ocurrió un error técnico.'
+    return error_body(message, 'INTERNAL_ERROR'), 500, {}
+
+
+def db_unavailable():
+    "503 cuando el repositorio no responde."
+    return error_body('Servicio temporalmente no disponible', 'DB_UNAVAILABLE'), 503, {}
+
+
+def read_failed(exc, action, message):
+    "500 de un ContactListFailed; `action` va al log y `message` al cliente."
+    logger.exception("Error al %s: %s", action, str(exc))
+    return error_body(message), 500, {}
+
+
+def invalid_pagination():
+    "400 por cursor o limit inválidos."
+    return error_body('Parámetros de paginación inválidos', 'INVALID_PAGINATION'), 400, {}
+
+
+def origin_verify_failure(method, path, headers, settings):
+    "Chequeo de X-Origin-Verify para /v1/contact/*; devuelve el 403 o None."
+    if method == "OPTIONS":
+        return None
+    if settings.development and headers.get("Origin") == DEV_ORIGIN:
+        return None
+    if path.startswith(CONTACT_PREFIX):
+        return require_origin_secret(headers, settings.origin_verify_secret)
+    return None
+
+
+def require_origin_secret(headers, secret):
+    "403 si X-Origin-Verify no coincide con el secreto (o no hay secreto configurado)."
+    if not secret or headers.get("X-Origin-Verify", "") != secret:
+        return forbidden()
+    return None
+
+
+def cors_headers(method, path, origin):
+    "Headers CORS de /v1/contact/* para `origin` (vacío si la ruta u origen no aplican)."
+    if not path.startswith(CONTACT_PREFIX) or origin not in CONTACT_CORS["origins"]:
+        return {}
+    headers = {"Access-Control-Allow-Origin": origin, "Vary": "Origin"}
+    if method == "OPTIONS":
+        headers.update({
+            "Access-Control-Allow-Methods": ", ".join(CONTACT_CORS["methods"]),
+            "Access-Control-Allow-Headers": ", ".join(CONTACT_CORS["allow_headers"]),
+            "Access-Control-Max-Age": str(CONTACT_CORS["max_age"]),
+        })
+    return headers
+
+
+def contact_request_rejection(content_type, too_large, metrics):
+    "415/413 del alta antes de leer el JSON; None si el request sigue al controller."
+    if content_type != "application/json":
+        metrics.inc("contact_validation_failures_total", {"error_code": "UNSUPPORTED_MEDIA_TYPE"})
+        return error_body("Unsupported Media Type", "UNSUPPORTED_MEDIA_TYPE"), 415, {}
+    if too_large:
+        metrics.inc("contact_validation_failures_total", {"error_code": "PAYLOAD_TOO_LARGE"})
+        return error_body("Payload Too Large", "PAYLOAD_TOO_LARGE"), 413, {}
+    return None
+
+
+def contact_response(response, status, metrics):
+    "Traduce la respuesta de ContactController: métricas de validación, Retry-After y presenter."
+    if status in (400, 413):
+        for error in response.get('errors') or [response]:
+            metrics.inc("contact_validation_failures_total", {"error_code": error.get('error_code', 'INVALID')})
+    if status == 429:
+        retry_after = response.pop('retry_after')
+        return response, status, {'Retry-After': str(retry_after)}
+    if response.get('success') and 'contact' in response:
+        contact = response.pop('contact')
+        return ContactPresenter.to_response(contact), status, {}
+    return response, status, {}
+
+
+def list_cache_key(limit, args):
+    "Clave del cache de páginas del listado."
+    return f"{limit}|{args.get('cursor', '')}"
+
+
+def page_body(page):
+    "Cuerpo JSON de una página de contactos (listado o búsqueda)."
+    return {
+        'success': True,
+        'contactos': ContactPresenter.rows_to_response(page.items),
+        'limit': page.limit,
+        'next_cursor': encode_cursor(page.next_after),
+    }
+
+
+def health():
+    "Liveness."
+    return {'success': True, 'ok': True}, 200, {}
+
+
+def db_health(backend, pool_stats):
+    "Estado de la base cuando el ping respondió."
+    return {'success': True, 'ok': True, 'backend': backend, 'pool': pool_stats}, 200, {}
+
+
+def db_health_failed(exc):
+    "503 del health de base."
+    logger.warning("DB health check failed: %s", exc.__class__.__name__)
+    return error_body('DB unavailable', 'DB_UNAVAILABLE'), 503, {}
+
+
+def readiness(ready):
+    "200 si el proceso terminó el warm-up, 503 si no."
+    if ready:
+        return {'success': True, 'ready': True}, 200, {}
+    return error_body('Not ready', 'NOT_READY'), 503, {}
+
+
+def etag_matches(if_none_match, etag):
+    "Compara If-None-Match con el ETag (acepta `*`, listas y etags débiles)."
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def record_request(metrics, method, route, status, elapsed):
+    "Cuenta el request y su latencia por ruta y status."
+    labels = {"method": method, "route": route, "status": status}
+    metrics.inc("http_requests_total", labels)
+    if elapsed is not None:
+        metrics.observe("http_request_duration_seconds", elapsed, labels)
+    metrics.refresh_gauges()
+
+
+def log_request(request_logger, request, status, sample_rate, request_id, elapsed):
+    "Log de /v1/contact/* en el logger del entrypoint: errores siempre, respuestas exitosas según LOG_SAMPLE_RATE."
+    if not request.path.startswith(CONTACT_PREFIX):
+        return
+    if status < 400 and sample_rate < 1 and random.random() >= sample_rate:
+        return
+    request_logger.info("Request log", extra={"ctx": {
+        "method": request.method,
+        "path": request.path,
+        "status": status,
+        "ip": request.headers.get("CF-Connecting-IP", request.remote_addr),
+        "origin": request.headers.get("Origin", ""),
+        "ua": request.headers.get("User-Agent", ""),
+        "referer": request.headers.get("Referer"),
+        "req_id": request_id,
+        "ms": round(elapsed * 1000, 1) if elapsed is not None else None,
+    }})
@@ -0,0 +1,380 @@
+"""
+Path: src/infrastructure/common/contact_spool.py
+"""
+
+import atexit
+import json
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime, timezone
+
+from src.application.errors import ContactCreateFailed, ContactQueueFull, DatabaseUnavailable
+from src.application.ports.contact_queue import ContactQueue
+from src.entities.contact import Contact
+from src.infrastructure.common.utc_clock import utc_now
+from src.shared.logger_flask_v0 import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin lock entre procesos (desarrollo con un solo proceso).
+    fcntl = None
+
+logger = get_logger("profebustos.spool")
+
+# Cada registro: longitud (uint32) + crc32 (uint32) del payload JSON, big-endian.
+RECORD_HEADER = struct.Struct(">II")
+ACTIVE_SUFFIX = ".open"
+SEALED_SUFFIX = ".log"
+# Segmento con bytes corruptos ya reproducido: se conserva para revisión en vez de borrarlo.
+CORRUPT_SUFFIX = ".corrupt"
+# Un contacto serializado ocupa pocos KB; un header que dice más es basura al resincronizar.
+MAX_RECORD_BYTES = 64 * 1024
+# Contactos que MySQL rechaza (DataError/IntegrityError), una línea JSON por contacto.
+DEAD_LETTER_NAME = "dead-letter.jsonl"
+
+
+class ContactSpool(ContactQueue):
+    "Spool local, append-only y con fsync, para contactos que no pudieron llegar a MySQL."
+    def __init__(self, directory, segment_max_bytes=4 * 1024 * 1024):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self._pid = os.getpid()
+        self._seq = 0
+        self._active = None
+        self._active_size = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def submit(self, contact):
+        "Agrega el contacto al segmento activo y lo sincroniza a disco antes de retornar."
+        if contact.created_at is None:
+            contact.created_at = utc_now()
+        payload = json.dumps(_contact_to_record(contact), separators=(",", ":")).encode("utf-8")
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        try:
+            with self._lock:
+                if self._active is None or self._pid != os.getpid():
+                    self._open_segment_locked()
+                self._active.write(record)
+                self._active.flush()
+                os.fsync(self._active.fileno())
+                self._active_size += len(record)
+                if self._active_size >= self.segment_max_bytes:
+                    self._seal_locked()
+        except OSError as exc:
+            logger.error("No se pudo escribir en el spool: %s", exc)
+            raise ContactQueueFull() from exc
+
+    def seal(self):
+        "Cierra el segmento activo de este proceso para que pueda reproducirse."
+        with self._lock:
+            if self._active is not None and self._active_size:
+                self._seal_locked()
+
+    def sealed_segments(self):
+        "Lista los segmentos cerrados (incluidos los huérfanos de procesos muertos), del más viejo al más nuevo."
+        segments = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(SEALED_SUFFIX):
+                segments.append(path)
+            elif name.endswith(ACTIVE_SUFFIX):
+                sealed = _seal_if_orphaned(path)
+                if sealed is not None:
+                    segments.append(sealed)
+        return sorted(segments, key=os.path.getmtime)
+
+    def pending_bytes(self):
+        "Bytes pendientes de reproducir en todo el directorio."
+        total = 0
+        for name in os.listdir(self.directory):
+            if name.endswith((SEALED_SUFFIX, ACTIVE_SUFFIX)):
+                total += os.path.getsize(os.path.join(self.directory, name))
+        return total
+
+    @staticmethod
+    def read_segment(path):
+        "Lee los contactos de un segmento, saltando registros truncados o corruptos."
+        return ContactSpool.scan_segment(path)[0]
+
+    @staticmethod
+    def scan_segment(path):
+        "Lee un segmento y devuelve (contactos, bytes salteados); tras un registro corrupto resincroniza al siguiente válido."
+        contacts = []
+        skipped = 0
+        with open(path, "rb") as handle:
+            data = handle.read()
+        offset = 0
+        while offset < len(data):
+            payload = _record_at(data, offset)
+            if payload is None:
+                resume = _next_record(data, offset + 1)
+                logger.warning(
+                    "Spool: %d bytes corruptos o truncados en %s (offset %d)",
+                    resume - offset, os.path.basename(path), offset,
+                )
+                skipped += resume - offset
+                offset = resume
+                continue
+            contacts.append(_record_to_contact(json.loads(payload)))
+            offset += RECORD_HEADER.size + len(payload)
+        return contacts, skipped
+
+    def dead_letter(self, contact, reason):
+        "Aparta un contacto que MySQL rechaza para revisarlo a mano, sin bloquear el resto del spool."
+        line = json.dumps(
+            {
+                "failed_at": utc_now().isoformat(),
+                "reason": reason,
+                "contact": _contact_to_record(contact),
+            },
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        with self._lock:
+            with open(os.path.join(self.directory, DEAD_LETTER_NAME), "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    @staticmethod
+    def read_dead_letters(path):
+        "Lee los contactos apartados en un archivo dead-letter."
+        with open(path, encoding="utf-8") as handle:
+            return [_record_to_contact(json.loads(line)["contact"]) for line in handle if line.strip()]
+
+    def replay_lock(self):
+        "Lock de archivo para que un solo proceso reproduzca el spool a la vez."
+        return _ReplayLock(os.path.join(self.directory, "replay.lock"))
+
+    def _open_segment_locked(self):
+        if self._active is not None:
+            self._active.close()
+        self._pid = os.getpid()
+        while True:
+            self._seq += 1
+            name = f"segment-{self._pid}-{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}-{self._seq:06d}{ACTIVE_SUFFIX}"
+            path = os.path.join(self.directory, name)
+            handle = open(path, "ab")
+            # El flock marca el segmento como vivo mientras el proceso exista (los pids se reutilizan
+            # entre reinicios de contenedor). Si otro proceso lo tomó como huérfano antes del lock,
+            # ya fue renombrado: se abre otro.
+            if _lock_segment(handle) and os.path.exists(path):
+                break
+            handle.close()
+        self._active = handle
+        self._active_size = 0
+        _fsync_directory(self.directory)
+
+    def _seal_locked(self):
+        path = self._active.name
+        self._active.close()
+        self._active = None
+        self._active_size = 0
+        os.replace(path, path[: -len(ACTIVE_SUFFIX)] + SEALED_SUFFIX)
+        _fsync_directory(self.directory)
+
+
+class ContactSpoolReplayer:
+    "Hilo que vuelca el spool en MySQL por lotes cuando la base vuelve a estar disponible."
+    def __init__(self, spool, repository, batch_size=100, interval=5):
+        self.spool = spool
+        self.repository = repository
+        self.batch_size = batch_size
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        "Inicia el hilo de reproducción (idempotente)."
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="contact-spool-replayer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout=5):
+        "Detiene el hilo de reproducción."
+        self._stopping.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def replay_once(self):
+        "Reproduce todos los segmentos cerrados; retorna la cantidad de contactos volcados."
+        self.spool.seal()
+        replayed = 0
+        with self.spool.replay_lock() as acquired:
+            if not acquired:
+                return 0
+            for path in self.spool.sealed_segments():
+                contacts, skipped = self.spool.scan_segment(path)
+                rejected = 0
+                for start in range(0, len(contacts), self.batch_size):
+                    batch = contacts[start:start + self.batch_size]
+                    # save_many es idempotente por ticket_id: un segmento reproducido a medias
+                    # puede volver a enviarse completo sin duplicar filas.
+                    try:
+                        self.repository.save_many(batch)
+                    except ContactCreateFailed:
+                        rejected += self._replay_one_by_one(batch)
+                if skipped:
+                    # Los registros válidos ya se volcaron; el archivo queda para revisar los bytes perdidos.
+                    corrupt = path[: -len(SEALED_SUFFIX)] + CORRUPT_SUFFIX
+                    os.replace(path, corrupt)
+                    logger.error(
+                        "Spool: %s tenía %d bytes ilegibles, conservado como %s",
+                        os.path.basename(path), skipped, os.path.basename(corrupt),
+                    )
+                else:
+                    os.remove(path)
+                replayed += len(contacts) - rejected
+                logger.info(
+                    "Spool: %d contactos reproducidos desde %s (%d al dead-letter)",
+                    len(contacts) - rejected, os.path.basename(path), rejected,
+                )
+        return replayed
+
+    def _replay_one_by_one(self, batch):
+        "Reintenta el lote fila por fila; aparta las que MySQL rechaza y retorna cuántas fueron."
+        rejected = 0
+        for contact in batch:
+            try:
+                self.repository.save_many([contact])
+            except ContactCreateFailed as exc:
+                reason = repr(exc.__cause__ or exc)
+                logger.error("Spool: contacto %s rechazado por MySQL: %s", contact.ticket_id, reason)
+                self.spool.dead_letter(contact, reason)
+                rejected += 1
+        return rejected
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            try:
+                self.replay_once()
+            except DatabaseUnavailable:
+                logger.info("Spool: MySQL sigue no disponible, se reintentará")
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Spool: error al reproducir: %s", exc)
+
+
+class _ReplayLock:
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+
+    def __enter__(self):
+        self._handle = open(self.path, "a+b")
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        self._handle.close()
+        return False
+
+
+def _contact_to_record(contact):
+    record = contact.to_dict()
+    if isinstance(record["created_at"], datetime):
+        record["created_at"] = record["created_at"].isoformat()
+    return record
+
+
+def _record_to_contact(record):
+    created_at = record.get("created_at")
+    return Contact(
+        ticket_id=record["ticket_id"],
+        name=record["name"],
+        email=record["email"],
+        company=record["company"],
+        message=record["message"],
+        page_location=record["page_location"],
+        traffic_source=record["traffic_source"],
+        ip=record["ip"],
+        user_agent=record["user_agent"],
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+    )
+
+
+def _record_at(data, offset):
+    "Payload del registro que empieza en offset, o None si está truncado o no pasa el crc."
+    if offset + RECORD_HEADER.size > len(data):
+        return None
+    length, checksum = RECORD_HEADER.unpack_from(data, offset)
+    start = offset + RECORD_HEADER.size
+    if length > MAX_RECORD_BYTES or start + length > len(data):
+        return None
+    payload = data[start:start + length]
+    if not payload.startswith(b"{") or zlib.crc32(payload) != checksum:
+        return None
+    return payload
+
+
+def _next_record(data, offset):
+    "Offset del próximo registro válido desde offset, o el fin de los datos."
+    position = data.find(b"{", offset + RECORD_HEADER.size)
+    while position != -1:
+        if _record_at(data, position - RECORD_HEADER.size) is not None:
+            return position - RECORD_HEADER.size
+        position = data.find(b"{", position + 1)
+    return len(data)
+
+
+def _lock_segment(handle):
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _seal_if_orphaned(path):
+    "Cierra un segmento activo cuyo proceso ya no existe; devuelve la ruta sellada o None si sigue en uso."
+    name = os.path.basename(path)
+    if fcntl is None:
+        # Windows: sin flock y con un solo proceso, solo los segmentos propios están vivos.
+        if _segment_pid(name) == os.getpid():
+            return None
+        sealed = path[: -len(ACTIVE_SUFFIX)] + SEALED_SUFFIX
+        os.replace(path, sealed)
+        return sealed
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with handle:
+        # El dueño mantiene el flock hasta morir: si se puede tomar, el segmento es huérfano
+        # aunque su pid lo haya reutilizado otro proceso.
+        if not _lock_segment(handle):
+            return None
+        sealed = path[: -len(ACTIVE_SUFFIX)] + SEALED_SUFFIX
+        os.replace(path, sealed)
+    return sealed
+
+
+def _segment_pid(name):
+    try:
+        return int(name.split("-")[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _fsync_directory(directory):
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
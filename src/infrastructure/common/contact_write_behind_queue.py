@@ -0,0 +1,166 @@
+"""
+Path: src/infrastructure/common/contact_write_behind_queue.py
+"""
+
+import atexit
+import queue
+import threading
+import time
+
+from src.application.errors import ContactCreateFailed, ContactQueueFull
+from src.application.ports.contact_queue import ContactQueue
+from src.infrastructure.common.utc_clock import utc_now
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.write_behind")
+
+
+class ContactWriteBehindQueue(ContactQueue):
+    "Cola acotada en memoria que persiste contactos en lotes desde un hilo en segundo plano."
+    def __init__(
+        self,
+        repository,
+        max_size=1000,
+        batch_size=50,
+        flush_interval=0.2,
+        submit_timeout=0.05,
+        max_retries=3,
+        retry_backoff=0.5,
+        fallback=None,
+    ):
+        self.repository = repository
+        self.fallback = fallback
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.submit_timeout = submit_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stopping = threading.Event()
+        self._thread = None
+        self._atexit_registered = False
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "rejected": 0, "flushed": 0, "batches": 0, "failed": 0}
+
+    def start(self):
+        "Inicia el hilo de volcado (idempotente)."
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="contact-write-behind", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def submit(self, contact):
+        "Encola un contacto; si la cola sigue llena tras `submit_timeout` o ya se detuvo, lanza ContactQueueFull."
+        if self._stopping.is_set():
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise ContactQueueFull()
+        if contact.created_at is None:
+            # El INSERT se ejecuta más tarde: se fija la hora de recepción.
+            contact.created_at = utc_now()
+        try:
+            self._queue.put(contact, timeout=self.submit_timeout)
+        except queue.Full as exc:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise ContactQueueFull() from exc
+        with self._lock:
+            self._stats["submitted"] += 1
+
+    def stop(self, timeout=10):
+        "Deja de aceptar trabajo y vuelca lo pendiente antes de terminar."
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("Write-behind: quedaron %d contactos sin volcar", self._queue.qsize())
+
+    def stats(self):
+        "Devuelve contadores y profundidad actual de la cola."
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["depth"] = self._queue.qsize()
+        snapshot["max_size"] = self._queue.maxsize
+        return snapshot
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _next_batch(self):
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0 or self._stopping.is_set():
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.repository.save_many(batch)
+                with self._lock:
+                    self._stats["flushed"] += len(batch)
+                    self._stats["batches"] += 1
+                return
+            except ContactCreateFailed:
+                # MySQL rechazó los datos: reintentar el lote no sirve y un registro inválido
+                # no debe arrastrar al resto.
+                self._flush_one_by_one(batch)
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                if attempt == self.max_retries:
+                    self._on_failure(batch, exc)
+                    return
+                logger.warning(
+                    "Write-behind: fallo al volcar lote (%d contactos, intento %d): %s",
+                    len(batch), attempt + 1, exc.__class__.__name__,
+                )
+                time.sleep(self.retry_backoff * (2 ** attempt))
+
+    def _flush_one_by_one(self, batch):
+        for contact in batch:
+            try:
+                self.repository.save_many([contact])
+            except Exception as exc:  # pylint: disable=broad-except
+                self._on_failure([contact], exc)
+                continue
+            with self._lock:
+                self._stats["flushed"] += 1
+
+    def _on_failure(self, batch, exc):
+        if self.fallback is not None:
+            try:
+                for contact in batch:
+                    self.fallback.submit(contact)
+                logger.warning(
+                    "Write-behind: lote de %d contactos derivado al spool (%s)",
+                    len(batch), exc.__class__.__name__,
+                )
+                return
+            except Exception as fallback_exc:  # pylint: disable=broad-except
+                logger.error("Write-behind: el spool también falló: %s", fallback_exc)
+        with self._lock:
+            self._stats["failed"] += len(batch)
+        logger.error(
+            "Write-behind: lote descartado tras %d reintentos (%s): %s",
+            self.max_retries, exc.__class__.__name__, [c.ticket_id for c in batch],
+        )
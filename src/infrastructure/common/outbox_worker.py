@@ -0,0 +1,87 @@
+"""
+Path: src/infrastructure/common/outbox_worker.py
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.outbox")
+
+
+class OutboxWorker:
+    "Reclama lotes del outbox, los despacha en paralelo por event_type y los marca hechos (at-least-once)."
+    def __init__(
+        self,
+        store,
+        handlers,
+        batch_size=50,
+        concurrency=4,
+        poll_interval=1.0,
+        max_attempts=5,
+        retry_backoff=5.0,
+    ):
+        self.store = store
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="outbox")
+        self._stopping = threading.Event()
+        self.stats = {"done": 0, "retried": 0, "dead": 0}
+
+    def run_once(self):
+        "Procesa un lote; devuelve cuántos eventos reclamó."
+        with self.store.claim(self.batch_size) as batch:
+            if not batch.events:
+                return 0
+            errors = list(self._executor.map(self._handle, batch.events))
+            for event, error in zip(batch.events, errors):
+                if error is None:
+                    batch.done(event)
+                    self.stats["done"] += 1
+                elif event.attempts + 1 >= self.max_attempts:
+                    logger.error("Outbox: evento %s (%s) descartado: %s", event.id, event.event_type, error)
+                    batch.dead(event, error)
+                    self.stats["dead"] += 1
+                else:
+                    logger.warning("Outbox: evento %s (%s) reintentará: %s", event.id, event.event_type, error)
+                    batch.retry(event, error, self.retry_backoff * (2 ** event.attempts))
+                    self.stats["retried"] += 1
+            return len(batch.events)
+
+    def run(self):
+        "Procesa lotes hasta stop(); espera `poll_interval` cuando el outbox queda vacío o falla la base."
+        logger.info("Outbox worker iniciado (lotes de %d)", self.batch_size)
+        while not self._stopping.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Outbox: fallo al reclamar o cerrar un lote: %s", exc)
+                claimed = 0
+            if claimed < self.batch_size:
+                self._stopping.wait(self.poll_interval)
+        self._executor.shutdown(wait=True)
+        self.store.close()
+        logger.info("Outbox worker detenido: %s", self.stats)
+
+    def stop(self):
+        "Termina después del lote en curso."
+        self._stopping.set()
+
+    def _handle(self, event):
+        handler = self.handlers.get(event.event_type)
+        if handler is None:
+            return f"Sin handler para {event.event_type}"
+        try:
+            handler(event)
+        except Exception as exc:  # pylint: disable=broad-except
+            return f"{exc.__class__.__name__}: {exc}"
+        return None
+
+
+def log_event(event):
+    "Handler por defecto: solo registra el evento."
+    logger.info("Outbox: %s ticket_id=%s", event.event_type, event.ticket_id)
@@ -0,0 +1,44 @@
+"""
+Path: src/infrastructure/common/ttl_lru_cache.py
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from src.application.ports.submission_cache import SubmissionCache
+
+
+class TTLLRUCache(SubmissionCache):
+    "Cache acotado en memoria con expiración por TTL y desalojo LRU, seguro para hilos."
+    def __init__(self, max_entries=10000, ttl_seconds=600, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        "Devuelve el valor si existe y no expiró."
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        "Guarda el valor y desaloja el menos usado si se supera el máximo."
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,20 @@
+"""
+Path: src/infrastructure/common/utc_clock.py
+"""
+
+from datetime import datetime, timezone
+
+from src.application.ports.clock import Clock
+
+
+def utc_now():
+    "Hora actual en UTC sin tzinfo (como DATETIME de MySQL): el reloj de created_at y del rollup diario."
+    # Sin microsegundos: DATETIME los redondea y 23:59:59.6 se guardaría en el día siguiente al contado.
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+class UTCClock(Clock):
+    "Reloj del sistema en UTC; el mismo con el que todos los backends fijan created_at."
+    def now(self):
+        "Devuelve utc_now()."
+        return utc_now()
@@ -2,210 +2,394 @@
 Path: src/infrastructure/flask/flask_app.py
 """
 
+import hmac
+import itertools
 import os
 import time
 import uuid
-from flask import Flask, request, jsonify, send_from_directory, g
-from flask_cors import CORS
+from datetime import date
+from flask import Flask, Response, request, jsonify, send_from_directory, g
 
+from src.shared.config import Settings
 from src.shared.logger_flask_v0 import get_logger
 
-from src.infrastructure.pymysql.mysql_client import MySQLClient
-from src.interface_adapters.gateways.contact_repository_adapter import ContactRepositoryAdapter
-from src.interface_adapters.controllers.contact_controller import ContactController
+from src.interface_adapters.controllers.pagination import parse_page_params, parse_search_params
 from src.interface_adapters.presenters.contact_presenter import ContactPresenter
-from src.use_cases.register_contact import RegisterContactUseCase
-from src.use_cases.list_contacts import ListContactsUseCase
-from src.application.errors import ContactListFailed
-from src.infrastructure.common.uuid_generator import UUIDGenerator
+from src.interface_adapters.presenters.contact_export_presenter import ContactExportPresenter
+from src.application.errors import ContactListFailed, DatabaseUnavailable
+from src.infrastructure.common import contact_http
+from src.infrastructure.common.contact_http import MAX_CONTENT_LENGTH
+from src.infrastructure.flask.list_response_cache import make_etag
+from src.infrastructure.flask.json_provider import FastJSONProvider
+from src.infrastructure.flask.services import AppServices
 
 logger = get_logger("flask_app")
 
-app = Flask(__name__)
-app.config["MAX_CONTENT_LENGTH"] = 20 * 1024
-# CORS explícito para la ruta crítica de contacto
-CORS(
-    app,
-    resources={
-        r"/v1/contact/*": {
-            "origins": [
-                "http://localhost:5173",
-                "https://datamaq.com.ar",
-                "https://www.datamaq.com.ar",
-                "https://profebustos.com.ar",
-                "https://www.profebustos.com.ar",
-            ],
-            "methods": ["POST", "OPTIONS"],
-            "allow_headers": ["Content-Type", "X-Origin-Verify"],
-            "max_age": 600,
-        }
-    },
-)
-
-def require_cf_header():
-    "Middleware para verificar el header X-Origin-Verify en rutas críticas."
-    secret = os.getenv("ORIGIN_VERIFY_SECRET", "")
-    header_value = request.headers.get("X-Origin-Verify", "")
-    if not secret or header_value != secret:
-        return jsonify({"success": False, "error": "Forbidden"}), 403
-    return None
-
-@app.before_request
-def enforce_origin_verify():
+PROFILE_MODES = ("cprofile", "sample")
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", ContactExportPresenter.to_ndjson_lines),
+    "csv": ("text/csv", ContactExportPresenter.to_csv_lines),
+}
+
+
+def create_app(settings=None, services=None):
+    "Crea la app Flask; `settings` se toma del entorno (una sola vez) si no se pasa."
+    settings = settings or Settings.from_env()
+    services = services or AppServices(settings)
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app, use_orjson=settings.json_encoder != "stdlib")
+    app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+    app.extensions["settings"] = settings
+    app.extensions["services"] = services
+
+    _register_request_hooks(app, settings, services)
+    _register_contact_routes(app, services)
+    _register_ops_routes(app, settings, services)
+    _register_error_handlers(app, settings)
+
+    # Migraciones al boot (opcional): el advisory lock serializa a los workers que arrancan juntos.
+    if settings.auto_create_db and settings.contact_repository == "mysql":
+        from src.infrastructure.pymysql.schema_migrator import SchemaMigrator  # pylint: disable=import-outside-toplevel
+
+        try:
+            SchemaMigrator().migrate()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("No se pudieron aplicar las migraciones al iniciar: %s", exc)
+    services.start_background_workers()
+    return app
+
+
+def require_cf_header(secret):
     "Middleware para verificar el header X-Origin-Verify en rutas críticas."
-    if request.method == "OPTIONS":
-        return None
-    g.request_id = (
-        request.headers.get("CF-RAY")
-        or request.headers.get("X-Request-Id")
-        or str(uuid.uuid4())
-    )
-    g.request_start = time.time()
-    if (
-        os.getenv("FLASK_ENV") == "development"
-        and request.headers.get("Origin") == "http://localhost:5173"
-    ):
+    forbidden = contact_http.require_origin_secret(request.headers, secret)
+    return _respond(forbidden) if forbidden is not None else None
+
+
+def _respond(result):
+    "Serializa un (cuerpo, status, headers) de contact_http como respuesta JSON de Flask."
+    body, status, headers = result
+    return jsonify(body), status, headers
+
+
+def profile_authorized(settings):
+    "Valida X-Profile-Token contra PROFILE_SECRET (o ORIGIN_VERIFY_SECRET si no está definido)."
+    secret = settings.profile_secret or settings.origin_verify_secret
+    token = request.headers.get("X-Profile-Token", "")
+    return bool(secret) and hmac.compare_digest(token.encode("utf-8"), secret.encode("utf-8"))
+
+
+def _register_request_hooks(app, settings, services):
+    log_sample_rate = settings.log_sample_rate
+
+    @app.before_request
+    def enforce_origin_verify():
+        "Middleware para verificar el header X-Origin-Verify en rutas críticas."
+        if request.method == "OPTIONS":
+            return None
+        g.request_id = (
+            request.headers.get("CF-RAY")
+            or request.headers.get("X-Request-Id")
+            or str(uuid.uuid4())
+        )
+        g.request_start = time.perf_counter()
+        forbidden = contact_http.origin_verify_failure(request.method, request.path, request.headers, settings)
+        return _respond(forbidden) if forbidden is not None else None
+
+    # Profiling bajo demanda: solo requests con X-Profile (cprofile | sample) y X-Profile-Token válido.
+    @app.before_request
+    def start_request_profile():
+        "Middleware que inicia el profiler si el request lo pide y está autorizado."
+        profiler = services.request_profiler
+        if profiler is None:
+            return None
+        mode = request.headers.get("X-Profile")
+        if mode is None:
+            return None
+        if mode not in PROFILE_MODES or not profile_authorized(settings):
+            logger.warning("Solicitud de profiling rechazada path=%s mode=%s", request.path, mode)
+            return None
+        g.profile_state = profiler.start(mode)
         return None
-    if request.path.startswith("/v1/contact/"):
-        return require_cf_header()
-    return None
-
-@app.route('/')
-def hello_world():
-    "Ruta principal de la aplicación."
-    logger.info("Ruta principal accedida")
-    return 'Hola desde Flask!'
-
-@app.route('/health', methods=['GET'])
-def health_check():
-    "Health check endpoint."
-    logger.info("Health check solicitado")
-    return jsonify({'success': True, 'ok': True}), 200
-
-@app.route('/health/db', methods=['GET'])
-def health_check_db():
-    "DB health check endpoint."
-    try:
-        mysql_client.ensure_connection()
-        return jsonify({'success': True, 'ok': True}), 200
-    except (ConnectionError, TimeoutError, ValueError) as exc:
-        logger.warning("DB health check failed: %s", exc.__class__.__name__)
-        return jsonify({
-            'success': False,
-            'error': 'DB unavailable',
-            'error_code': 'DB_UNAVAILABLE'
-        }), 503
-
-# Instancia única de dependencias
-mysql_client = MySQLClient()
-
-contact_repository = ContactRepositoryAdapter(mysql_client)
-id_generator = UUIDGenerator()
-register_contact_use_case = RegisterContactUseCase(contact_repository, id_generator)
-contact_controller = ContactController(register_contact_use_case)
-list_contacts_use_case = ListContactsUseCase(contact_repository)
-
-# Preflight explícito para la ruta crítica de contacto
-@app.route('/v1/contact/email', methods=['OPTIONS'])
-def preflight_contact():
-    "Manejo de preflight CORS para /v1/contact/email."
-    return '', 204
-
-# Nuevo endpoint para registrar datos de contacto
-@app.route('/v1/contact/email', methods=['POST'])
-def registrar_contacto():
-    "Endpoint para registrar datos de contacto."
-    logger.info("Solicitud a /v1/contact/email")
-    if request.content_type != "application/json":
-        return jsonify({
-            "success": False,
-            "error": "Unsupported Media Type",
-            "error_code": "UNSUPPORTED_MEDIA_TYPE"
-        }), 415
-    if request.content_length is not None and request.content_length > 20 * 1024:
-        return jsonify({
-            "success": False,
-            "error": "Payload Too Large",
-            "error_code": "PAYLOAD_TOO_LARGE"
-        }), 413
-    response, status = contact_controller.registrar_contacto(request)
-    if response.get('success') and 'contact' in response:
-        contact = response.pop('contact')
-        return jsonify(ContactPresenter.to_response(contact)), status
-    return jsonify(response), status
-
-@app.after_request
-def log_request(response):
-    "Middleware para loguear detalles de la solicitud."
-    if request.path.startswith("/v1/contact/"):
-        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        request_id = getattr(g, "request_id", None)
-        elapsed_ms = None
-        if getattr(g, "request_start", None) is not None:
-            elapsed_ms = int((time.time() - g.request_start) * 1000)
-        ip = request.headers.get("CF-Connecting-IP", request.remote_addr)
-        ua = request.headers.get("User-Agent", "")
-        origin = request.headers.get("Origin", "")
-        logger.info(
-            "Request log ts=%s path=%s status=%s ip=%s origin=%s ua=%s referer=%s req_id=%s ms=%s",
-            timestamp,
-            request.path,
-            response.status_code,
-            ip,
-            origin,
-            ua,
-            request.headers.get("Referer"),
-            request_id,
-            elapsed_ms,
+
+    @app.after_request
+    def finish_request_profile(response):
+        "Middleware que guarda el perfil del request y devuelve su nombre en X-Profile-Id."
+        state = g.pop("profile_state", None)
+        if state is not None:
+            response.headers["X-Profile-Id"] = services.request_profiler.finish(
+                state, f"{request.method}_{request.path}"
+            )
+        return response
+
+    @app.after_request
+    def apply_cors(response):
+        "Middleware que agrega los headers CORS de /v1/contact/* (los mismos que la app ASGI)."
+        response.headers.update(
+            contact_http.cors_headers(request.method, request.path, request.headers.get("Origin"))
+        )
+        return response
+
+    @app.after_request
+    def record_request_metrics(response):
+        "Middleware para contar requests y medir su latencia por ruta y status."
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        contact_http.record_request(services.metrics, request.method, route, response.status_code, _elapsed())
+        return response
+
+    @app.after_request
+    def log_request(response):
+        "Middleware para loguear detalles de la solicitud."
+        contact_http.log_request(
+            logger, request, response.status_code, log_sample_rate, getattr(g, "request_id", None), _elapsed()
+        )
+        if getattr(g, "request_id", None):
+            response.headers["X-Request-Id"] = g.request_id
+        return response
+
+
+def _elapsed():
+    start = getattr(g, "request_start", None)
+    return time.perf_counter() - start if start is not None else None
+
+
+def _register_contact_routes(app, services):
+    # Preflight explícito para la ruta crítica de contacto
+    @app.route('/v1/contact/email', methods=['OPTIONS'])
+    def preflight_contact():
+        "Manejo de preflight CORS para /v1/contact/email."
+        return '', 204
+
+    # Nuevo endpoint para registrar datos de contacto
+    @app.route('/v1/contact/email', methods=['POST'])
+    def registrar_contacto():
+        "Endpoint para registrar datos de contacto."
+        logger.info("Solicitud a /v1/contact/email")
+        too_large = request.content_length is not None and request.content_length > MAX_CONTENT_LENGTH
+        rejection = contact_http.contact_request_rejection(request.content_type, too_large, services.metrics)
+        if rejection is not None:
+            return _respond(rejection)
+        response, status = services.contact_controller.registrar_contacto(request)
+        return _respond(contact_http.contact_response(response, status, services.metrics))
+
+    # Endpoint para listar contactos registrados (paginado por keyset, con ETag y cache por worker)
+    @app.route('/v1/contact/list', methods=['GET'])
+    def listar_contactos():
+        "Devuelve una página de contactos registrados, del más reciente al más antiguo."
+        logger.info("Solicitud a /v1/contact/list")
+        try:
+            limit, after = parse_page_params(request.args)
+        except ValueError:
+            return _respond(contact_http.invalid_pagination())
+        cache_key = contact_http.list_cache_key(limit, request.args)
+        list_contacts_use_case = services.list_contacts_use_case
+        list_response_cache = services.list_response_cache
+        try:
+            # El watermark (max(id), count) es mucho más barato que la página completa y alcanza
+            # para validar el cache y responder 304.
+            etag = make_etag(list_contacts_use_case.watermark(), cache_key)
+            if contact_http.etag_matches(request.headers.get("If-None-Match"), etag):
+                response = Response(status=304)
+            else:
+                body = list_response_cache.get(cache_key, etag)
+                if body is None:
+                    page = list_contacts_use_case.execute_page(limit=limit, after=after)
+                    body = app.json.dumps_bytes(contact_http.page_body(page))
+                    list_response_cache.put(cache_key, etag, body)
+                response = Response(body, status=200, mimetype="application/json")
+            response.set_etag(etag)
+            response.headers.update(contact_http.LIST_CACHE_HEADERS)
+            return response
+        except DatabaseUnavailable:
+            return _respond(contact_http.db_unavailable())
+        except ContactListFailed as e:
+            return _respond(contact_http.read_failed(e, "obtener contactos", 'Error al obtener los contactos'))
+
+    # Búsqueda por texto (FULLTEXT / FTS5) o prefijo de email, por relevancia y con keyset (score, id)
+    @app.route('/v1/contact/search', methods=['GET'])
+    def buscar_contactos():
+        "Devuelve una página de contactos que coinciden con `q`, del más relevante al menos relevante."
+        logger.info("Solicitud a /v1/contact/search")
+        try:
+            limit, after = parse_search_params(request.args)
+        except ValueError:
+            return _respond(contact_http.invalid_pagination())
+        list_contacts_use_case = services.list_contacts_use_case
+        try:
+            # Mismo watermark que el listado: una búsqueda repetida sin altas nuevas responde 304.
+            etag = make_etag(
+                list_contacts_use_case.watermark(),
+                f"search|{request.args.get('q', '')}|{limit}|{request.args.get('cursor', '')}",
+            )
+            if contact_http.etag_matches(request.headers.get("If-None-Match"), etag):
+                response = Response(status=304)
+            else:
+                page = list_contacts_use_case.search(request.args.get('q'), limit=limit, after=after)
+                body = app.json.dumps_bytes(contact_http.page_body(page))
+                response = Response(body, status=200, mimetype="application/json")
+            response.set_etag(etag)
+            response.headers.update(contact_http.LIST_CACHE_HEADERS)
+            return response
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'La búsqueda debe tener entre 3 y 100 caracteres',
+                'error_code': 'INVALID_QUERY'
+            }), 400
+        except DatabaseUnavailable:
+            return _respond(contact_http.db_unavailable())
+        except ContactListFailed as e:
+            return _respond(contact_http.read_failed(e, "buscar contactos", 'Error al buscar los contactos'))
+
+    # Contactos por día, sitio y fuente de tráfico, desde el rollup contact_daily_stats
+    @app.route('/v1/contact/stats', methods=['GET'])
+    def estadisticas_contactos():
+        "Devuelve el rollup diario entre `from` y `to` (YYYY-MM-DD, por defecto los últimos 30 días)."
+        logger.info("Solicitud a /v1/contact/stats")
+        try:
+            stats = services.contact_stats_use_case.execute(
+                _optional_date(request.args.get("from")),
+                _optional_date(request.args.get("to")),
+                request.args.get("site"),
+            )
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Rango de fechas inválido (YYYY-MM-DD, hasta 366 días)',
+                'error_code': 'INVALID_DATE_RANGE'
+            }), 400
+        except DatabaseUnavailable:
+            return _respond(contact_http.db_unavailable())
+        except ContactListFailed as e:
+            return _respond(contact_http.read_failed(e, "obtener estadísticas", 'Error al obtener las estadísticas'))
+        return jsonify({'success': True, **ContactPresenter.stats_to_response(stats)}), 200
+
+    # Exportación en streaming de todos los contactos (NDJSON o CSV)
+    @app.route('/v1/contact/export', methods=['GET'])
+    def exportar_contactos():
+        "Exporta todos los contactos en streaming, en NDJSON o CSV según `format` o `Accept`."
+        logger.info("Solicitud a /v1/contact/export")
+        export_format = request.args.get("format")
+        if export_format is None:
+            best = request.accept_mimetypes.best_match(["application/x-ndjson", "text/csv"])
+            export_format = "csv" if best == "text/csv" else "ndjson"
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': 'Formato de exportación no soportado',
+                'error_code': 'INVALID_FORMAT'
+            }), 400
+        mimetype, render_lines = EXPORT_FORMATS[export_format]
+
+        contacts = services.list_contacts_use_case.iter_all()
+        try:
+            # Se adelanta la primera fila para que un error de DB se responda con un status real
+            # en lugar de cortar un stream ya iniciado.
+            first = next(contacts, None)
+        except DatabaseUnavailable:
+            return _respond(contact_http.db_unavailable())
+        except ContactListFailed as e:
+            return _respond(contact_http.read_failed(e, "exportar contactos", 'Error al obtener los contactos'))
+        rows = itertools.chain([first], contacts) if first is not None else iter(())
+
+        return Response(
+            render_lines(rows),
+            mimetype=mimetype,
+            headers={
+                "Content-Disposition": f"attachment; filename=contactos.{export_format}",
+                "X-Accel-Buffering": "no",
+            },
         )
-    if getattr(g, "request_id", None):
-        response.headers["X-Request-Id"] = g.request_id
-    return response
-
-# Nuevo endpoint para listar contactos registrados
-@app.route('/v1/contact/list', methods=['GET'])
-def listar_contactos():
-    "Devuelve la lista de todos los contactos registrados."
-    logger.info("Solicitud a /v1/contact/list")
-    try:
-        contactos = list_contacts_use_case.execute()
-        response_items = [ContactPresenter.to_response_with_created_at(c) for c in contactos]
-        return jsonify({'success': True, 'contactos': response_items}), 200
-    except ContactListFailed as e:
-        logger.exception("Error al obtener contactos: %s", str(e))
-        return jsonify({'success': False, 'error': 'Error al obtener los contactos'}), 500
-
-# Servir archivos estáticos para visualizar contactos
-@app.route('/tabla')
-def tabla_index():
-    "Ruta para servir el archivo index.html de la tabla de contactos."
-    ruta_real = os.path.join(app.static_folder, 'tabla')
-    return send_from_directory(ruta_real, 'index.html')
-
-@app.errorhandler(404)
+
+
+def _optional_date(value):
+    "Fecha YYYY-MM-DD de un query param, o None si falta; ValueError si es inválida."
+    return date.fromisoformat(value) if value else None
+
+
+def _register_ops_routes(app, settings, services):
+    @app.route('/')
+    def hello_world():
+        "Ruta principal de la aplicación."
+        logger.info("Ruta principal accedida")
+        return 'Hola desde Flask!'
+
+    @app.route('/health', methods=['GET'])
+    def health_check():
+        "Health check endpoint."
+        logger.info("Health check solicitado")
+        return _respond(contact_http.health())
+
+    @app.route('/health/db', methods=['GET'])
+    def health_check_db():
+        "DB health check endpoint."
+        try:
+            services.contact_repository.ping()
+        except (DatabaseUnavailable, ConnectionError, TimeoutError, ValueError) as exc:
+            return _respond(contact_http.db_health_failed(exc))
+        return _respond(contact_http.db_health(settings.contact_repository, services.contact_repository.pool_stats()))
+
+    @app.route('/health/ready', methods=['GET'])
+    def health_check_ready():
+        "Readiness: 200 una vez que el worker terminó el warm-up (lo reintenta si todavía no)."
+        return _respond(contact_http.readiness(services.ready or services.warm_up()))
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics_endpoint():
+        "Métricas en formato de texto Prometheus (agregadas entre workers si METRICS_DIR está configurado)."
+        forbidden = require_cf_header(settings.origin_verify_secret)
+        if forbidden is not None:
+            return forbidden
+        return Response(services.metrics.render(), mimetype="text/plain; version=0.0.4")
+
+    @app.route('/debug/profiles', methods=['GET'])
+    def list_profiles():
+        "Lista los perfiles guardados (requiere X-Profile-Token)."
+        if services.request_profiler is None:
+            return not_found_error("Profiling deshabilitado")
+        if not profile_authorized(settings):
+            return _respond(contact_http.forbidden())
+        return jsonify({'success': True, 'profiles': services.request_profiler.store.list()}), 200
+
+    @app.route('/debug/profiles/<name>', methods=['GET'])
+    def download_profile(name):
+        "Descarga un perfil (.prof para pstats/snakeviz, .speedscope.json para speedscope)."
+        if services.request_profiler is None:
+            return not_found_error("Profiling deshabilitado")
+        if not profile_authorized(settings):
+            return _respond(contact_http.forbidden())
+        store = services.request_profiler.store
+        if store.path(name) is None:
+            return not_found_error(f"Perfil inexistente: {name}")
+        return send_from_directory(store.directory, name, as_attachment=True)
+
+    # Servir archivos estáticos para visualizar contactos
+    @app.route('/tabla')
+    def tabla_index():
+        "Ruta para servir el archivo index.html de la tabla de contactos."
+        ruta_real = os.path.join(app.static_folder, 'tabla')
+        return send_from_directory(ruta_real, 'index.html')
+
+
 def not_found_error(e):
     "Manejo de errores 404."
-    logger.warning("Recurso no encontrado: %s", str(e))
-    return jsonify({
-        'success': False,
-        'error': 'Recurso no encontrado (404)',
-        'error_code': 'NOT_FOUND'
-    }), 404
-
-@app.errorhandler(Exception)
-def handle_exception(e):
-    "Manejo global de excepciones no capturadas."
-    logger.exception("Error inesperado: %s", str(e))
-    is_dev = os.getenv("FLASK_ENV") == "development"
-    error_message = (
-        f'Ocurrió un error técnico. Detalle: {str(e)}'
-        if is_dev
-        else 'Ocurrió un error técnico.'
-    )
-    response = jsonify({
-        'success': False,
-        'error': error_message,
-        'error_code': 'INTERNAL_ERROR'
-    })
-    response.status_code = 500
-    return response
+    return _respond(contact_http.not_found(e))
+
+
+def _register_error_handlers(app, settings):
+    app.register_error_handler(404, not_found_error)
+
+    @app.errorhandler(Exception)
+    def handle_exception(e):
+        "Manejo global de excepciones no capturadas."
+        return _respond(contact_http.internal_error(e, settings.development))
+
+
+def __getattr__(name):
+    # Compatibilidad con `from src.infrastructure.flask.flask_app import app`: la app por
+    # defecto se crea (desde el entorno) recién cuando alguien la pide.
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,99 @@
+"""
+Path: src/infrastructure/flask/json_provider.py
+"""
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, timezone
+from functools import lru_cache
+
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+def _default(o):
+    "Tipos que ninguno de los encoders resuelve por sí mismo."
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls):
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _stdlib_default(o):
+    # Los DATETIME de MySQL llegan naive y están en UTC: se emite el offset para que
+    # `new Date()` en el frontend no los interprete como hora local.
+    if isinstance(o, datetime):
+        if o.tzinfo is None:
+            o = o.replace(tzinfo=timezone.utc)
+        return o.isoformat()
+    if isinstance(o, date):
+        return o.isoformat()
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return {name: getattr(o, name) for name in _field_names(type(o))}
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    return _default(o)
+
+
+def dumps_bytes(obj, use_orjson=True, sort_keys=False):
+    "Serializa a bytes UTF-8 con orjson (o json como fallback); compartido con el entrypoint ASGI."
+    if use_orjson and orjson is not None:
+        option = orjson.OPT_NAIVE_UTC
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+    return _stdlib_dumps(obj, sort_keys=sort_keys).encode("utf-8")
+
+
+def _stdlib_dumps(obj, **kwargs):
+    kwargs.setdefault("default", _stdlib_default)
+    kwargs.setdefault("ensure_ascii", False)
+    kwargs.setdefault("separators", (",", ":"))
+    return json.dumps(obj, **kwargs)
+
+
+class FastJSONProvider(JSONProvider):
+    "JSONProvider con orjson (fallback a json) que codifica datetime en ISO-8601 y dataclasses sin dicts intermedios."
+    sort_keys = False
+    mimetype = "application/json"
+
+    def __init__(self, app, use_orjson=True):
+        super().__init__(app)
+        self.use_orjson = use_orjson and orjson is not None
+
+    def dumps_bytes(self, obj):
+        "Serializa directamente a bytes UTF-8 (evita el encode extra en respuestas grandes)."
+        return dumps_bytes(obj, use_orjson=self.use_orjson, sort_keys=self.sort_keys)
+
+    def dumps(self, obj, **kwargs):
+        "Serializa a str; argumentos propios del módulo json fuerzan el encoder estándar."
+        if kwargs or not self.use_orjson:
+            return self._stdlib_dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        "Deserializa JSON desde str o bytes."
+        if kwargs or not self.use_orjson:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        "Equivalente a jsonify() pero sin pasar por str."
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+    def _stdlib_dumps(self, obj, **kwargs):
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        return _stdlib_dumps(obj, **kwargs)
@@ -0,0 +1,47 @@
+"""
+Path: src/infrastructure/flask/list_response_cache.py
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def make_etag(watermark, key):
+    "ETag fuerte derivado del watermark (max(id), count) y de los parámetros de la consulta."
+    raw = f"{watermark[0]}:{watermark[1]}:{key}".encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:20]
+
+
+class ListResponseCache:
+    "Cache por worker de respuestas de listado ya codificadas, validadas por ETag."
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, etag):
+        "Devuelve los bytes cacheados si siguen correspondiendo al ETag actual."
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, etag, body):
+        "Guarda la respuesta codificada para la clave."
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        "Descarta todas las respuestas cacheadas (se llama tras cada alta)."
+        with self._lock:
+            self._entries.clear()
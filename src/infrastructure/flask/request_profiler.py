@@ -0,0 +1,166 @@
+"""
+Path: src/infrastructure/flask/request_profiler.py
+"""
+
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+PROFILE_NAME = re.compile(r"^[A-Za-z0-9_.-]+\.(prof|speedscope\.json)$")
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class ProfileStore:
+    "Anillo acotado de perfiles en disco: al superar `max_files` se borran los más viejos."
+    def __init__(self, directory, max_files=20):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, name, write):
+        "Escribe un perfil de forma atómica; `write(path)` genera el archivo temporal."
+        final_path = os.path.join(self.directory, name)
+        tmp_path = final_path + ".tmp"
+        write(tmp_path)
+        os.replace(tmp_path, final_path)
+        self._prune()
+        return name
+
+    def list(self):
+        "Perfiles guardados, del más reciente al más antiguo."
+        entries = []
+        for name in os.listdir(self.directory):
+            if not PROFILE_NAME.match(name):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append({"name": name, "size": stat.st_size, "created_at": stat.st_mtime})
+        entries.sort(key=lambda entry: entry["created_at"], reverse=True)
+        return entries
+
+    def path(self, name):
+        "Ruta de un perfil existente, o None si el nombre no es válido o no existe."
+        if not PROFILE_NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+    def _prune(self):
+        with self._lock:
+            for entry in self.list()[self.max_files:]:
+                try:
+                    os.remove(os.path.join(self.directory, entry["name"]))
+                except FileNotFoundError:
+                    pass
+
+
+class StackSampler:
+    "Muestrea la pila de un hilo cada `interval` segundos y la exporta en formato speedscope."
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self._frames = []
+        self._frame_index = {}
+        self._samples = []
+        self._weights = []
+        self._stopping = threading.Event()
+        self._thread = None
+        self._started = None
+        self._elapsed = 0.0
+
+    def start(self):
+        "Arranca el hilo de muestreo."
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        "Detiene el muestreo."
+        self._stopping.set()
+        self._thread.join()
+        self._elapsed = time.perf_counter() - self._started
+
+    def to_speedscope(self, name):
+        "Perfil muestreado en el formato de archivo de speedscope."
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "shared": {"frames": self._frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self._elapsed,
+                "samples": self._samples,
+                "weights": self._weights,
+            }],
+            "name": name,
+            "exporter": "profebustos-request-profiler",
+        }
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stopping.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+            now = time.perf_counter()
+            if frame is not None:
+                self._samples.append(self._stack(frame))
+                self._weights.append(now - last)
+            last = now
+
+    def _stack(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = len(self._frames)
+                self._frame_index[key] = index
+                self._frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+
+class RequestProfiler:
+    "Perfila un request bajo cProfile (determinístico) o muestreo y lo guarda en el ProfileStore."
+    MODES = ("cprofile", "sample")
+
+    def __init__(self, store, sample_interval=0.001):
+        self.store = store
+        self.sample_interval = sample_interval
+
+    def start(self, mode):
+        "Comienza a perfilar el hilo actual; retorna el estado a pasar a `finish`."
+        if mode == "sample":
+            sampler = StackSampler(threading.get_ident(), self.sample_interval)
+            sampler.start()
+            return mode, sampler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return "cprofile", profiler
+
+    def finish(self, state, label):
+        "Detiene el perfil y lo guarda; retorna el nombre del archivo."
+        mode, profiler = state
+        base = f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{re.sub(r'[^A-Za-z0-9_-]+', '_', label)[:60]}"
+        if mode == "sample":
+            profiler.stop()
+            document = profiler.to_speedscope(label)
+
+            def write(path):
+                with open(path, "w", encoding="utf-8") as handle:
+                    json.dump(document, handle)
+
+            return self.store.save(base + ".speedscope.json", write)
+        profiler.disable()
+        return self.store.save(base + ".prof", profiler.dump_stats)
@@ -0,0 +1,290 @@
+"""
+Path: src/infrastructure/flask/services.py
+"""
+
+# Los adaptadores se importan dentro de cada propiedad: un worker solo paga el import
+# (pymysql, sqlite3, cProfile, ...) de lo que efectivamente usa, y recién en el primer uso.
+# pylint: disable=import-outside-toplevel
+
+from functools import cached_property
+
+from src.application.errors import DatabaseUnavailable
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.services")
+
+# Sobreviven a reset_after_fork: la configuración y el registro de métricas (que ya abre un
+# archivo por pid).
+_FORK_SAFE = ("settings", "metrics")
+
+
+class AppServices:
+    "Dependencias de la app, construidas a demanda a partir de Settings (una instancia por app)."
+    def __init__(self, settings):
+        self.settings = settings
+        self.ready = False
+
+    @cached_property
+    def metrics(self):
+        "Registro de métricas; con METRICS_DIR agrega los valores de todos los workers."
+        from src.infrastructure.metrics.app_metrics import build_metrics_registry
+
+        registry = build_metrics_registry(self.settings.metrics_dir)
+        registry.add_gauge_collector(self.collect_runtime_gauges)
+        return registry
+
+    @cached_property
+    def mysql_client(self):
+        "Cliente MySQL (pool lazy); None con otros backends."
+        if self.settings.contact_repository != "mysql":
+            return None
+        from src.infrastructure.pymysql.mysql_client import MySQLClient
+
+        return MySQLClient(
+            metrics=self.metrics,
+            outbox=self.settings.contact_outbox,
+            daily_stats=self.settings.contact_stats_inline,
+        )
+
+    @cached_property
+    def contact_repository(self):
+        "Repositorio de contactos según CONTACT_REPOSITORY (mysql, sqlite o memory)."
+        backend = self.settings.contact_repository
+        if backend == "sqlite":
+            from src.infrastructure.sqlite.sqlite_contact_repository import SQLiteContactRepository
+
+            repository = SQLiteContactRepository(self.settings.contact_sqlite_path)
+        elif backend == "memory":
+            from src.infrastructure.memory.in_memory_contact_repository import InMemoryContactRepository
+
+            repository = InMemoryContactRepository()
+        else:
+            from src.interface_adapters.gateways.contact_repository_adapter import ContactRepositoryAdapter
+
+            repository = ContactRepositoryAdapter(self.mysql_client)
+        repository.add_change_listener(self.list_response_cache.invalidate)
+        return repository
+
+    @cached_property
+    def contact_spool(self):
+        "Spool local opcional: si la base no responde, los contactos se guardan en disco (202)."
+        if not self.settings.contact_spool_dir:
+            return None
+        from src.infrastructure.common.contact_spool import ContactSpool
+
+        return ContactSpool(
+            self.settings.contact_spool_dir,
+            segment_max_bytes=self.settings.contact_spool_segment_bytes,
+        )
+
+    @cached_property
+    def contact_spool_replayer(self):
+        "Hilo que reproduce el spool cuando la base vuelve; None sin spool."
+        if self.contact_spool is None:
+            return None
+        from src.infrastructure.common.contact_spool import ContactSpoolReplayer
+
+        replayer = ContactSpoolReplayer(
+            self.contact_spool,
+            self.contact_repository,
+            interval=self.settings.contact_spool_replay_interval,
+        )
+        replayer.start()
+        return replayer
+
+    @cached_property
+    def contact_write_queue(self):
+        "Cola write-behind opcional: los POST encolan y un hilo persiste en lotes (202)."
+        if not self.settings.write_behind:
+            return None
+        from src.infrastructure.common.contact_write_behind_queue import ContactWriteBehindQueue
+
+        queue = ContactWriteBehindQueue(
+            self.contact_repository,
+            max_size=self.settings.contact_queue_max_size,
+            batch_size=self.settings.contact_batch_size,
+            flush_interval=self.settings.contact_flush_interval,
+            fallback=self.contact_spool,
+        )
+        queue.start()
+        return queue
+
+    @cached_property
+    def outbox_handlers(self):
+        "Handlers de outbox_worker.py por event_type."
+        settings = self.settings
+        from src.infrastructure.common.outbox_worker import log_event
+        from src.infrastructure.pymysql.mysql_client import CONTACT_CREATED
+
+        if not (settings.notify_email_to and settings.smtp_host):
+            return {CONTACT_CREATED: log_event}
+        from src.infrastructure.smtp.email_notification_dispatcher import EmailNotificationHandler
+
+        return {CONTACT_CREATED: EmailNotificationHandler(
+            self._smtp_mailer_factory(), settings.notify_email_from, settings.notify_email_to
+        )}
+
+    def _smtp_mailer_factory(self):
+        settings = self.settings
+        from src.infrastructure.smtp.email_notification_dispatcher import SMTPMailer
+
+        return lambda: SMTPMailer(
+            settings.smtp_host,
+            settings.smtp_port,
+            username=settings.smtp_username or None,
+            password=settings.smtp_password or None,
+            starttls=settings.smtp_starttls,
+        )
+
+    @cached_property
+    def contact_notifier(self):
+        "Aviso por email de cada consulta (pool de hilos SMTP); None sin CONTACT_NOTIFY_TO/SMTP_HOST."
+        settings = self.settings
+        if not (settings.notify_email_to and settings.smtp_host):
+            return None
+        if settings.contact_outbox and settings.contact_repository == "mysql":
+            # Con outbox el aviso lo envía outbox_worker.py a partir del evento contact.created.
+            return None
+        from src.infrastructure.smtp.email_notification_dispatcher import EmailNotificationDispatcher
+
+        dispatcher = EmailNotificationDispatcher(
+            self._smtp_mailer_factory(),
+            sender=settings.notify_email_from,
+            recipient=settings.notify_email_to,
+            workers=settings.notify_workers,
+            max_size=settings.notify_queue_max_size,
+            digest_threshold=settings.notify_digest_threshold,
+            batch_window=settings.notify_batch_window,
+        )
+        dispatcher.start()
+        return dispatcher
+
+    @cached_property
+    def submission_cache(self):
+        "Detección de reenvíos dentro de DUPLICATE_WINDOW_SECONDS, por worker."
+        if self.settings.duplicate_window_seconds <= 0:
+            return None
+        from src.infrastructure.common.ttl_lru_cache import TTLLRUCache
+
+        return TTLLRUCache(
+            max_entries=self.settings.duplicate_cache_size,
+            ttl_seconds=self.settings.duplicate_window_seconds,
+        )
+
+    @cached_property
+    def rate_limiter(self):
+        "Rate limiting por IP y por email, compartido entre workers del host vía SQLite (WAL)."
+        if not self.settings.rate_limit_enabled:
+            return None
+        from src.infrastructure.sqlite.rate_limiter import SQLiteRateLimiter, parse_rate
+
+        return SQLiteRateLimiter(
+            self.settings.rate_limit_db,
+            rules={
+                "ip": parse_rate(self.settings.rate_limit_ip),
+                "email": parse_rate(self.settings.rate_limit_email),
+            },
+        )
+
+    @cached_property
+    def contact_controller(self):
+        "Controller del alta de contactos."
+        from src.infrastructure.common.uuid_generator import UUIDGenerator
+        from src.interface_adapters.controllers.contact_controller import ContactController
+        from src.use_cases.register_contact import RegisterContactUseCase
+
+        use_case = RegisterContactUseCase(
+            self.contact_repository,
+            UUIDGenerator(),
+            self.contact_write_queue,
+            self.contact_spool,
+            self.submission_cache,
+            self.contact_notifier,
+        )
+        return ContactController(use_case, self.rate_limiter, debug=self.settings.development)
+
+    @cached_property
+    def list_contacts_use_case(self):
+        "Caso de uso del listado y la exportación."
+        from src.use_cases.list_contacts import ListContactsUseCase
+
+        return ListContactsUseCase(self.contact_repository)
+
+    @cached_property
+    def contact_stats_use_case(self):
+        "Caso de uso de /v1/contact/stats (rollup diario)."
+        from src.infrastructure.common.utc_clock import UTCClock
+        from src.use_cases.contact_stats import ContactStatsUseCase
+
+        return ContactStatsUseCase(self.contact_repository, UTCClock())
+
+    @cached_property
+    def list_response_cache(self):
+        "Cache por worker de las páginas del listado, invalidado en cada alta."
+        from src.infrastructure.flask.list_response_cache import ListResponseCache
+
+        return ListResponseCache()
+
+    @cached_property
+    def request_profiler(self):
+        "Profiler bajo demanda; None si PROFILING_ENABLED no está activo."
+        if not self.settings.profiling_enabled:
+            return None
+        from src.infrastructure.flask.request_profiler import ProfileStore, RequestProfiler
+
+        return RequestProfiler(
+            ProfileStore(self.settings.profile_dir, max_files=self.settings.profile_max_files),
+            sample_interval=self.settings.profile_sample_interval,
+        )
+
+    def start_background_workers(self):
+        "Arranca el replay del spool, la cola write-behind y las notificaciones si están configurados."
+        # Deben correr aunque el worker todavía no haya recibido un POST.
+        return self.contact_spool_replayer, self.contact_write_queue, self.contact_notifier
+
+    def stop_background_workers(self):
+        "Vuelca la cola write-behind y los avisos pendientes, detiene el replay del spool y cierra el pool (solo lo ya construido)."
+        built = self.__dict__
+        if built.get("contact_write_queue") is not None:
+            built["contact_write_queue"].stop()
+        if built.get("contact_spool_replayer") is not None:
+            built["contact_spool_replayer"].stop()
+        if built.get("contact_notifier") is not None:
+            built["contact_notifier"].stop()
+        if built.get("mysql_client") is not None:
+            built["mysql_client"].close()
+
+    def reset_after_fork(self):
+        "Descarta lo construido en el proceso padre: conexiones, hilos y caches no cruzan un fork."
+        for name in list(self.__dict__):
+            if name not in _FORK_SAFE:
+                del self.__dict__[name]
+        self.ready = False
+
+    def warm_up(self):
+        "Construye el hot path y abre conexiones antes del primer request; marca `ready` si la base responde."
+        # pylint: disable=pointless-statement
+        self.contact_controller
+        self.list_contacts_use_case
+        self.metrics
+        try:
+            self.contact_repository.warm(self.settings.mysql_pool_warm)
+        except DatabaseUnavailable as exc:
+            logger.warning("Warm-up incompleto, la base no responde: %s", exc.__class__.__name__)
+            return False
+        self.ready = True
+        return True
+
+    def collect_runtime_gauges(self, registry):
+        "Actualiza los gauges de pool y colas de este worker (solo de lo ya construido)."
+        built = self.__dict__
+        if built.get("mysql_client") is not None:
+            pool = built["mysql_client"].pool_stats()
+            registry.set_gauge("mysql_pool_connections", pool["idle"], {"state": "idle"})
+            registry.set_gauge("mysql_pool_connections", pool["in_use"], {"state": "in_use"})
+        if built.get("contact_write_queue") is not None:
+            registry.set_gauge("contact_write_queue_depth", built["contact_write_queue"].stats()["depth"])
+        if built.get("contact_spool") is not None:
+            registry.set_gauge("contact_spool_pending_bytes", built["contact_spool"].pending_bytes())
+        if built.get("contact_notifier") is not None:
+            registry.set_gauge("contact_notification_queue_depth", built["contact_notifier"].stats()["depth"])
@@ -16,17 +16,34 @@ class App {
     }
 
     async init() {
+        document.getElementById('search-form').addEventListener('submit', (event) => {
+            event.preventDefault();
+            const term = document.getElementById('search-input').value.trim();
+            this.loadContactos(term.length >= 2 ? term : '');
+        });
         await this.loadContactos();
     }
 
-    async loadContactos() {
+    async loadContactos(term = '') {
+        // Con un término se consulta /v1/contact/search (índice en el servidor) en lugar de
+        // descargar toda la tabla.
+        const endpoint = term
+            ? `/v1/contact/search?q=${encodeURIComponent(term)}&limit=200`
+            : '/v1/contact/list?limit=200';
         try {
-            const response = await this.apiService.get('/v1/contact/list');
-            if (response.success && Array.isArray(response.contactos)) {
-                this.contactTable.render(response.contactos);
-            } else {
-                this.contactTable.showError('No se pudieron cargar los contactos.');
-            }
+            const contactos = [];
+            let cursor = null;
+            do {
+                const query = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+                const response = await this.apiService.get(`${endpoint}${query}`);
+                if (!response.success || !Array.isArray(response.contactos)) {
+                    this.contactTable.showError('No se pudieron cargar los contactos.');
+                    return;
+                }
+                contactos.push(...response.contactos);
+                cursor = response.next_cursor;
+            } while (cursor);
+            this.contactTable.render(contactos);
         } catch (error) {
             console.error('Error al cargar contactos:', error);
             this.contactTable.showError('Error al cargar contactos.');
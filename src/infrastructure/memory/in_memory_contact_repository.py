@@ -0,0 +1,131 @@
+"""
+Path: src/infrastructure/memory/in_memory_contact_repository.py
+"""
+
+import bisect
+import threading
+from collections import Counter
+
+from src.application.dtos.contact_daily_stat import ContactDailyStat
+from src.application.dtos.contact_row import ContactRow
+from src.entities.contact import Contact
+from src.entities.traffic_attribution import traffic_attribution
+from src.infrastructure.common.utc_clock import utc_now
+from src.interface_adapters.gateways.contact_repository import ContactRepository
+
+
+def _sort_key(row):
+    return (row.created_at, row.id)
+
+
+def _score(row, query):
+    "Ocurrencias de los términos en name/company/message (None si falta alguno); 0 para prefijo de email."
+    if query.email_prefix is not None:
+        return 0.0 if row.email.lower().startswith(query.email_prefix) else None
+    text = " ".join(value for value in (row.name, row.company, row.message) if value).lower()
+    counts = [text.count(term) for term in query.terms]
+    return float(sum(counts)) if all(counts) else None
+
+
+class InMemoryContactRepository(ContactRepository):
+    "Repositorio en memoria del proceso (desarrollo, pruebas de carga); mismo orden y keyset que MySQL."
+    def __init__(self):
+        self._rows = []  # ordenadas por (created_at, id) ascendente
+        self._ticket_ids = set()
+        self._next_id = 1
+        self._daily_stats = Counter()  # (day, site, traffic_source) -> contactos
+        self._lock = threading.Lock()
+
+    def save(self, contact):
+        "Guarda un contacto y lo retorna."
+        with self._lock:
+            self._insert_locked(contact)
+        self._notify_change()
+        return contact
+
+    def save_many(self, contacts):
+        "Guarda varios contactos; omite ticket_id ya existentes (idempotente como en MySQL)."
+        with self._lock:
+            for contact in contacts:
+                if contact.ticket_id not in self._ticket_ids:
+                    self._insert_locked(contact)
+        self._notify_change()
+
+    def get_all(self):
+        "Devuelve todos los contactos, del más reciente al más antiguo."
+        with self._lock:
+            rows = list(reversed(self._rows))
+        return [Contact(*row[:-1]) for row in rows]
+
+    def get_page(self, limit, after=None):
+        "Devuelve una página de filas ContactRow y el keyset de la siguiente."
+        with self._lock:
+            end = len(self._rows) if after is None else bisect.bisect_left(self._rows, tuple(after), key=_sort_key)
+            start = max(end - limit - 1, 0)
+            rows = self._rows[start:end][::-1]
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1].created_at, rows[-1].id)
+        return rows, next_after
+
+    def search(self, query, limit, after=None):
+        "Búsqueda por substring (sin índice, recorre todo): mismo contrato y keyset (score, id) que MySQL."
+        with self._lock:
+            rows = list(self._rows)
+        matches = []
+        for row in rows:
+            score = _score(row, query)
+            if score is not None and (after is None or (score, row.id) < tuple(after)):
+                matches.append((score, row.id, row))
+        matches.sort(key=lambda match: match[:2], reverse=True)
+        next_after = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            next_after = matches[-1][:2]
+        return [row for _, _, row in matches], next_after
+
+    def iter_all(self):
+        "Recorre todos los contactos sobre un snapshot."
+        with self._lock:
+            rows = list(reversed(self._rows))
+        for row in rows:
+            yield Contact(*row[:-1])
+
+    def get_daily_stats(self, start, end, site=None):
+        "Devuelve el rollup diario entre `start` y `end` inclusive."
+        with self._lock:
+            items = list(self._daily_stats.items())
+        return sorted(
+            ContactDailyStat(*key, contacts)
+            for key, contacts in items
+            if start <= key[0] <= end and (site is None or key[1] == site)
+        )
+
+    def get_watermark(self):
+        "Devuelve (max(id), count)."
+        with self._lock:
+            return self._next_id - 1, len(self._rows)
+
+    def ping(self):
+        "Siempre disponible."
+
+    def _insert_locked(self, contact):
+        created_at = contact.created_at or utc_now()
+        row = ContactRow(
+            contact.ticket_id,
+            contact.name,
+            contact.email,
+            contact.company,
+            contact.message,
+            contact.page_location,
+            contact.traffic_source,
+            contact.ip,
+            contact.user_agent,
+            created_at,
+            self._next_id,
+        )
+        self._next_id += 1
+        self._ticket_ids.add(contact.ticket_id)
+        self._daily_stats[(created_at.date(), *traffic_attribution(contact.page_location, contact.traffic_source))] += 1
+        bisect.insort(self._rows, row, key=_sort_key)
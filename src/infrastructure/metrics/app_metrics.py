@@ -0,0 +1,22 @@
+"""
+Path: src/infrastructure/metrics/app_metrics.py
+"""
+
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+def build_metrics_registry(directory=None):
+    "Crea el registro con las métricas de la aplicación ya declaradas."
+    registry = MetricsRegistry(directory=directory)
+    registry.counter("http_requests_total", "Requests HTTP atendidos.", ("method", "route", "status"))
+    registry.histogram(
+        "http_request_duration_seconds", "Latencia de requests HTTP.", ("method", "route", "status")
+    )
+    registry.histogram("mysql_query_duration_seconds", "Latencia de operaciones MySQL (incluye checkout).", ("operation",))
+    registry.counter("mysql_query_errors_total", "Operaciones MySQL fallidas.", ("operation", "error"))
+    registry.counter("contact_validation_failures_total", "Payloads de contacto rechazados.", ("error_code",))
+    registry.gauge("mysql_pool_connections", "Conexiones del pool por estado.", ("state",))
+    registry.gauge("contact_write_queue_depth", "Contactos pendientes en la cola write-behind.")
+    registry.gauge("contact_spool_pending_bytes", "Bytes pendientes de reproducir en el spool local.")
+    registry.gauge("contact_notification_queue_depth", "Avisos por email pendientes de envío.")
+    return registry
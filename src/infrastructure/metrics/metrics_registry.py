@@ -0,0 +1,356 @@
+"""
+Path: src/infrastructure/metrics/metrics_registry.py
+"""
+
+import bisect
+import glob
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STORE_FILE = re.compile(r"^metrics-(\d+)\.db$")
+# Contadores e histogramas de workers ya terminados, sumados por mark_process_dead.
+AGGREGATE_FILE = "metrics-aggregate.db"
+
+_HEADER = struct.Struct("<i4x")
+_LENGTH = struct.Struct("<i")
+_VALUE = struct.Struct("<d")
+
+
+class InMemoryValues:
+    "Valores por clave de este proceso, en memoria (sin agregación entre workers)."
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def add(self, key, amount):
+        "Suma `amount` al valor de la clave."
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, key, value):
+        "Reemplaza el valor de la clave."
+        with self._lock:
+            self._values[key] = value
+
+    def items(self):
+        "Snapshot de (clave, valor)."
+        with self._lock:
+            return list(self._values.items())
+
+    def close(self):
+        "Sin recursos que liberar."
+
+
+class MmapValues:
+    "Valores float64 de un proceso en un archivo mmap, legibles por los demás workers."
+    INITIAL_SIZE = 64 * 1024
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a+b")  # pylint: disable=consider-using-with
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.INITIAL_SIZE:
+            self._file.truncate(self.INITIAL_SIZE)
+            size = self.INITIAL_SIZE
+        self._capacity = size
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._used = _HEADER.unpack_from(self._map, 0)[0] or _HEADER.size
+        self._positions = {key: pos for key, _, pos in _iter_entries(self._map, self._used)}
+
+    def add(self, key, amount):
+        "Suma `amount` al valor de la clave."
+        with self._lock:
+            pos = self._positions.get(key)
+            if pos is None:
+                pos = self._append_key(key)
+            _VALUE.pack_into(self._map, pos, _VALUE.unpack_from(self._map, pos)[0] + amount)
+
+    def set(self, key, value):
+        "Reemplaza el valor de la clave."
+        with self._lock:
+            pos = self._positions.get(key)
+            if pos is None:
+                pos = self._append_key(key)
+            _VALUE.pack_into(self._map, pos, value)
+
+    def items(self):
+        "Snapshot de (clave, valor)."
+        with self._lock:
+            return [(key, value) for key, value, _ in _iter_entries(self._map, self._used)]
+
+    def close(self):
+        "Cierra el mmap y el archivo."
+        with self._lock:
+            self._map.close()
+            self._file.close()
+
+    def _append_key(self, key):
+        encoded = key.encode("utf-8")
+        padding = -(_LENGTH.size + len(encoded)) % 8
+        entry = _LENGTH.pack(len(encoded)) + encoded + b" " * padding + _VALUE.pack(0.0)
+        if self._used + len(entry) > self._capacity:
+            self._grow(self._used + len(entry))
+        self._map[self._used:self._used + len(entry)] = entry
+        self._used += len(entry)
+        # El header se actualiza al final: un lector concurrente nunca ve una entrada a medias.
+        _HEADER.pack_into(self._map, 0, self._used)
+        pos = self._used - _VALUE.size
+        self._positions[key] = pos
+        return pos
+
+    def _grow(self, needed):
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        self._map.close()
+        self._file.truncate(capacity)
+        self._capacity = capacity
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+
+
+def _iter_entries(buffer, used):
+    pos = _HEADER.size
+    while pos < used:
+        length = _LENGTH.unpack_from(buffer, pos)[0]
+        key_start = pos + _LENGTH.size
+        key = bytes(buffer[key_start:key_start + length]).decode("utf-8")
+        pos = key_start + length + (-(_LENGTH.size + length) % 8)
+        yield key, _VALUE.unpack_from(buffer, pos)[0], pos
+        pos += _VALUE.size
+
+
+def read_store(path):
+    "Lee todas las claves de un archivo de métricas (de cualquier proceso)."
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < _HEADER.size:
+        return []
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    return [(key, value) for key, value, _ in _iter_entries(data, used)]
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    "Registro de métricas (counter, gauge, histogram) con exposición en formato de texto Prometheus."
+    def __init__(self, directory=None, gauge_refresh_interval=1.0):
+        # Con `directory`, cada proceso escribe su propio archivo mmap y /metrics agrega los
+        # de todos los workers; sin él, los valores quedan en memoria del proceso.
+        self.directory = directory
+        self.gauge_refresh_interval = gauge_refresh_interval
+        self._families = {}
+        self._keys = {}
+        self._collectors = []
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._store = None
+        self._store_pid = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def counter(self, name, documentation, labels=()):
+        "Declara un contador."
+        self._families[name] = ("counter", documentation, tuple(labels), None)
+
+    def gauge(self, name, documentation, labels=()):
+        "Declara un gauge (por worker: se expone con la etiqueta `pid`)."
+        self._families[name] = ("gauge", documentation, tuple(labels), None)
+
+    def histogram(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        "Declara un histograma."
+        self._families[name] = ("histogram", documentation, tuple(labels), tuple(sorted(buckets)))
+
+    def inc(self, name, labels=None, amount=1.0):
+        "Incrementa un contador."
+        self._values().add(self._key(name, "", labels), amount)
+
+    def set_gauge(self, name, value, labels=None):
+        "Fija el valor de un gauge para este proceso."
+        self._values().set(self._key(name, "", labels), value)
+
+    def observe(self, name, value, labels=None):
+        "Registra una observación en un histograma."
+        buckets = self._families[name][3]
+        index = bisect.bisect_left(buckets, value)
+        le = _format_value(buckets[index]) if index < len(buckets) else "+Inf"
+        values = self._values()
+        values.add(self._key(name, "_bucket", labels, le), 1.0)
+        values.add(self._key(name, "_sum", labels), value)
+        values.add(self._key(name, "_count", labels), 1.0)
+
+    def add_gauge_collector(self, collector):
+        "Registra una función que actualiza gauges (pool, colas) al refrescar."
+        self._collectors.append(collector)
+
+    def refresh_gauges(self, force=False):
+        "Ejecuta los collectors, como máximo una vez por `gauge_refresh_interval`."
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.gauge_refresh_interval:
+            return
+        self._last_refresh = now
+        for collector in self._collectors:
+            collector(self)
+
+    def render(self):
+        "Genera la exposición en texto agregando los valores de todos los procesos."
+        self.refresh_gauges(force=True)
+        samples = {}
+        for pid, items in self._collect():
+            for key, value in items:
+                family, suffix, label_items = json.loads(key)
+                kind = self._families.get(family, ("untyped",))[0]
+                if kind == "gauge":
+                    if pid is not None and not _pid_alive(pid):
+                        continue
+                    label_items = label_items + [["pid", str(pid or os.getpid())]]
+                sample_key = (family, suffix, tuple(map(tuple, label_items)))
+                samples[sample_key] = samples.get(sample_key, 0.0) + value
+        return self._exposition(samples)
+
+    def reset(self):
+        "Descarta los valores de este proceso, los de workers muertos y el agregado."
+        with self._lock:
+            if self._store is not None:
+                self._store.close()
+            self._store = None
+            self._store_pid = None
+        if self.directory:
+            for path in glob.glob(os.path.join(self.directory, "metrics-*.db")):
+                name = os.path.basename(path)
+                match = STORE_FILE.match(name)
+                if name == AGGREGATE_FILE or (
+                    match and (int(match.group(1)) == os.getpid() or not _pid_alive(int(match.group(1))))
+                ):
+                    os.remove(path)
+
+    def mark_process_dead(self, pid):
+        "Suma contadores e histogramas de un worker terminado al agregado y borra su archivo (y sus gauges)."
+        # Lo llama solo el master de gunicorn (child_exit), de a un worker por vez: no hay dos escritores del agregado.
+        if not self.directory:
+            return
+        path = os.path.join(self.directory, f"metrics-{pid}.db")
+        try:
+            items = read_store(path)
+        except FileNotFoundError:
+            return
+        aggregate = MmapValues(os.path.join(self.directory, AGGREGATE_FILE))
+        try:
+            for key, value in items:
+                if self._families.get(json.loads(key)[0], ("untyped",))[0] != "gauge":
+                    aggregate.add(key, value)
+        finally:
+            aggregate.close()
+        os.remove(path)
+
+    def _values(self):
+        pid = os.getpid()
+        store = self._store
+        if store is not None and self._store_pid == pid:
+            return store
+        with self._lock:
+            # Tras un fork (gunicorn --preload) cada worker abre su propio archivo.
+            if self._store is None or self._store_pid != pid:
+                if self.directory:
+                    self._store = MmapValues(os.path.join(self.directory, f"metrics-{pid}.db"))
+                else:
+                    self._store = InMemoryValues()
+                self._store_pid = pid
+            return self._store
+
+    def _collect(self):
+        if not self.directory:
+            return [(None, self._values().items())]
+        self._values()
+        collected = []
+        for path in glob.glob(os.path.join(self.directory, "metrics-*.db")):
+            name = os.path.basename(path)
+            match = STORE_FILE.match(name)
+            if match or name == AGGREGATE_FILE:
+                try:
+                    collected.append((int(match.group(1)) if match else None, read_store(path)))
+                except OSError:
+                    continue
+        return collected
+
+    def _key(self, name, suffix, labels, le=None):
+        label_names = self._families[name][2]
+        values = tuple(str((labels or {}).get(label, "")) for label in label_names)
+        cache_key = (name, suffix, values, le)
+        key = self._keys.get(cache_key)
+        if key is None:
+            items = [[label, value] for label, value in zip(label_names, values)]
+            if le is not None:
+                items.append(["le", le])
+            key = json.dumps([name, suffix, items])
+            self._keys[cache_key] = key
+        return key
+
+    def _exposition(self, samples):
+        lines = []
+        for family in sorted({family for family, _, _ in samples}):
+            kind, documentation, _, buckets = self._families.get(family, ("untyped", "", (), None))
+            lines.append(f"# HELP {family} {documentation}")
+            lines.append(f"# TYPE {family} {kind}")
+            family_samples = {key: value for key, value in samples.items() if key[0] == family}
+            if kind == "histogram":
+                lines.extend(_histogram_lines(family, buckets, family_samples))
+                continue
+            for (_, suffix, label_items), value in sorted(family_samples.items()):
+                lines.append(f"{family}{suffix}{_format_labels(label_items)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(family, buckets, samples):
+    series = {}
+    for (_, suffix, label_items), value in samples.items():
+        if suffix == "_bucket":
+            base = tuple(item for item in label_items if item[0] != "le")
+            le = dict(label_items)["le"]
+            series.setdefault(base, {}).setdefault("buckets", {})[le] = value
+        else:
+            series.setdefault(label_items, {})[suffix] = value
+    bounds = [_format_value(bound) for bound in buckets] + ["+Inf"]
+    lines = []
+    for base in sorted(series):
+        data = series[base]
+        cumulative = 0.0
+        for le in bounds:
+            cumulative += data.get("buckets", {}).get(le, 0.0)
+            lines.append(f"{family}_bucket{_format_labels(base + (('le', le),))} {_format_value(cumulative)}")
+        lines.append(f"{family}_sum{_format_labels(base)} {_format_value(data.get('_sum', 0.0))}")
+        lines.append(f"{family}_count{_format_labels(base)} {_format_value(data.get('_count', 0.0))}")
+    return lines
+
+
+def _format_labels(label_items):
+    if not label_items:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in label_items) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value):
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,188 @@
+"""
+Path: src/infrastructure/pymysql/connection_pool.py
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pymysql
+
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.pool")
+
+
+class PoolTimeout(pymysql.err.OperationalError):
+    "Raised when no connection could be checked out before the timeout."
+
+
+class PoolUnavailable(pymysql.err.OperationalError):
+    "Raised without connecting while a recent connection failure is still fresh."
+
+
+class MySQLConnectionPool:
+    "Pool acotado de conexiones PyMySQL, seguro para hilos (uno por worker)."
+    def __init__(self, connect, max_size=4, max_idle_seconds=300, checkout_timeout=5, retry_after=0):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._connect = connect
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.checkout_timeout = checkout_timeout
+        # Tras un fallo de conexión, durante `retry_after` segundos se falla de inmediato
+        # en lugar de pagar el connect_timeout en cada request.
+        self.retry_after = retry_after
+        self._down_until = 0.0
+        self._idle = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._stats = {
+            "created": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "evicted": 0,
+            "discarded": 0,
+            "fast_failures": 0,
+        }
+
+    @contextmanager
+    def connection(self):
+        "Presta una conexión del pool y la devuelve al salir del bloque."
+        conn = self.checkout()
+        try:
+            yield conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            self.discard(conn)
+            raise
+        except BaseException:
+            try:
+                conn.rollback()
+            except pymysql.Error:
+                self.discard(conn)
+                raise
+            self.checkin(conn)
+            raise
+        else:
+            self.checkin(conn)
+
+    def checkout(self):
+        "Obtiene una conexión viva, creando una nueva si hay lugar en el pool."
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._cond:
+            self._evict_idle_locked()
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(2013, "Timed out waiting for a MySQL connection")
+                self._stats["waits"] += 1
+                self._cond.wait(remaining)
+            self._stats["checkouts"] += 1
+            if self._idle:
+                conn, _ = self._idle.pop()
+            elif time.monotonic() < self._down_until:
+                self._stats["fast_failures"] += 1
+                raise PoolUnavailable(2003, "MySQL marked unavailable after a recent connection failure")
+            else:
+                conn = None
+                self._size += 1
+
+        if conn is not None and self._is_alive(conn):
+            return conn
+        if conn is not None:
+            self._close_quietly(conn)
+            with self._cond:
+                self._stats["discarded"] += 1
+        try:
+            conn = self._connect()
+        except BaseException as exc:
+            if isinstance(exc, (pymysql.err.OperationalError, OSError)) and self.retry_after:
+                with self._cond:
+                    self._down_until = time.monotonic() + self.retry_after
+            self._release_slot()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+            self._down_until = 0.0
+        return conn
+
+    def warm(self, count):
+        "Abre hasta `count` conexiones por adelantado y las deja ociosas en el pool."
+        conns = []
+        try:
+            for _ in range(min(count, self.max_size)):
+                conns.append(self.checkout())
+        finally:
+            for conn in conns:
+                self.checkin(conn)
+        return len(conns)
+
+    def checkin(self, conn):
+        "Devuelve una conexión sana al pool."
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def discard(self, conn):
+        "Cierra una conexión rota y libera su lugar en el pool."
+        self._close_quietly(conn)
+        with self._cond:
+            self._stats["discarded"] += 1
+        self._release_slot()
+
+    def close(self):
+        "Cierra todas las conexiones ociosas del pool."
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        "Devuelve un snapshot de las métricas del pool."
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot.update({
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "available": time.monotonic() >= self._down_until,
+            })
+        return snapshot
+
+    def _evict_idle_locked(self):
+        if not self.max_idle_seconds:
+            return
+        cutoff = time.monotonic() - self.max_idle_seconds
+        # Las conexiones más viejas quedan a la izquierda (checkin hace append).
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            self._stats["evicted"] += 1
+            self._close_quietly(conn)
+
+    def _release_slot(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _is_alive(conn):
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except (pymysql.Error, OSError, AttributeError):
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Error al cerrar conexión MySQL descartada")
@@ -0,0 +1,93 @@
+"""
+Path: src/infrastructure/pymysql/contact_stats_rollup.py
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from src.entities.traffic_attribution import traffic_attribution
+from src.infrastructure.common.utc_clock import UTCClock
+from src.infrastructure.pymysql.mysql_client import STATS_INCREMENT
+from src.shared.logger_flask_v0 import get_logger
+
+LOCK_NAME = "profebustos_contact_stats"
+WATERMARK_NAME = "contact_daily_stats"
+
+
+class ContactStatsRollup:
+    "Job de catch-up de contact_daily_stats: consolida los contactos posteriores al high-water mark."
+    # Recalcula completos los días tocados (reemplaza sus filas), así convive con los incrementos
+    # en línea (CONTACT_STATS_INLINE) sin contar dos veces. El día actual se recalcula siempre para
+    # absorber altas con id menor al mark que confirmaron tarde.
+
+    def __init__(self, connect, batch_size=5000, lock_timeout=0, clock=None):
+        self.logger = get_logger("profebustos.stats")
+        self._connect = connect
+        self.batch_size = batch_size
+        self.lock_timeout = lock_timeout
+        # "Hoy" en el reloj de created_at (UTCClock), no CURRENT_DATE() del servidor MySQL.
+        self.clock = clock or UTCClock()
+
+    def run(self):
+        "Consolida lo pendiente; devuelve {'days', 'last_id'} o None si otro proceso tiene el lock."
+        connection = self._connect()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (LOCK_NAME, self.lock_timeout))
+                if not cursor.fetchone()["acquired"]:
+                    self.logger.info("Rollup de estadísticas en curso en otro proceso")
+                    return None
+            try:
+                return self._catch_up(connection)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+        finally:
+            connection.close()
+
+    def _catch_up(self, connection):
+        last_id = self._watermark(connection)
+        days = {self.clock.now().date()}
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id, DATE(created_at) AS day FROM contactos WHERE id > %s ORDER BY id LIMIT %s",
+                    (last_id, self.batch_size),
+                )
+                rows = cursor.fetchall()
+            connection.commit()
+            if not rows:
+                break
+            days.update(row["day"] for row in rows)
+            last_id = rows[-1]["id"]
+        for day in sorted(days):
+            self._rebuild_day(connection, day)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO contact_stats_watermark (name, last_id) VALUES (%s, %s) "
+                "ON DUPLICATE KEY UPDATE last_id = GREATEST(last_id, VALUES(last_id))",
+                (WATERMARK_NAME, last_id),
+            )
+        connection.commit()
+        self.logger.info("Rollup de estadísticas: %d días recalculados hasta id %d", len(days), last_id)
+        return {"days": len(days), "last_id": last_id}
+
+    def _watermark(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT last_id FROM contact_stats_watermark WHERE name = %s", (WATERMARK_NAME,))
+            row = cursor.fetchone()
+        connection.commit()
+        return row["last_id"] if row else 0
+
+    def _rebuild_day(self, connection, day):
+        "Reemplaza las filas de `day` con los conteos recalculados desde contactos (idx por created_at)."
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT page_location, traffic_source FROM contactos WHERE created_at >= %s AND created_at < %s",
+                (day, day + timedelta(days=1)),
+            )
+            counts = Counter(traffic_attribution(row["page_location"], row["traffic_source"]) for row in cursor.fetchall())
+            cursor.execute("DELETE FROM contact_daily_stats WHERE day = %s", (day,))
+            if counts:
+                cursor.executemany(STATS_INCREMENT, [(day, *key, count) for key, count in sorted(counts.items())])
+        connection.commit()
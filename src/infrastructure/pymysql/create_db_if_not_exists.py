@@ -3,7 +3,7 @@ Crea la base de datos si no existe.
 """
 
 import pymysql
-from src.shared.config import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB
+from src.infrastructure.pymysql.db_config import load_db_config
 from src.shared.logger_flask_v0 import get_logger
 
 class DatabaseCreator:
@@ -13,21 +13,23 @@ class DatabaseCreator:
 
     def create_database_if_not_exists(self):
         "Crea la base de datos MySQL si no existe y diferencia si fue creada o ya existía."
+        config = load_db_config()
         try:
             connection = pymysql.connect(
-                host=MYSQL_HOST,
-                user=MYSQL_USER,
-                password=MYSQL_PASSWORD,
+                host=config["host"],
+                user=config["user"],
+                password=config["password"],
+                port=config["port"],
                 cursorclass=pymysql.cursors.DictCursor
             )
             with connection.cursor() as cursor:
-                cursor.execute("SHOW DATABASES LIKE %s", (MYSQL_DB,))
+                cursor.execute("SHOW DATABASES LIKE %s", (config["db"],))
                 result = cursor.fetchone()
                 if result:
-                    self.logger.info("La base de datos '%s' ya existía.", MYSQL_DB)
+                    self.logger.info("La base de datos '%s' ya existía.", config["db"])
                 else:
-                    cursor.execute(f"CREATE DATABASE `{MYSQL_DB}`;")
-                    self.logger.info("La base de datos '%s' fue creada correctamente.", MYSQL_DB)
+                    cursor.execute(f"CREATE DATABASE `{config['db']}`;")
+                    self.logger.info("La base de datos '%s' fue creada correctamente.", config["db"])
             connection.close()
         except Exception as e:
             self.logger.error("Error al crear la base de datos: %s", e)
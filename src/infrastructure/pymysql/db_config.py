@@ -5,11 +5,16 @@ Path: src/infrastructure/pymysql/db_config.py
 import os
 from urllib.parse import urlparse
 
-from src.shared.config import MYSQL_HOST, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB
+from src.shared.config import load_env
+
+# Sesiones en UTC: created_at se escribe desde Python con utc_now(); así DATE(created_at), los NOW()
+# del outbox y las consultas manuales quedan en el mismo huso que el rollup diario.
+SESSION_INIT_COMMAND = "SET time_zone = '+00:00'"
 
 
 def load_db_config(host=None, user=None, password=None, db=None, port=None):
     "Carga la configuración de la base de datos MySQL desde variables de entorno o parámetros."
+    load_env()
     env_url = os.getenv("MYSQL_PRIVATE_URL") or os.getenv("MYSQL_URL")
     if env_url:
         parsed = urlparse(env_url)
@@ -22,21 +27,19 @@ def load_db_config(host=None, user=None, password=None, db=None, port=None):
         }
 
     return {
-        "host": host or os.getenv("MYSQLHOST") or os.getenv("MYSQL_HOST") or MYSQL_HOST,
-        "user": user or os.getenv("MYSQLUSER") or os.getenv("MYSQL_USER") or MYSQL_USER,
+        "host": host or os.getenv("MYSQLHOST") or os.getenv("MYSQL_HOST"),
+        "user": user or os.getenv("MYSQLUSER") or os.getenv("MYSQL_USER"),
         "password": (
             password
             or os.getenv("MYSQLPASSWORD")
             or os.getenv("MYSQL_PASSWORD")
             or os.getenv("MYSQL_ROOT_PASSWORD")
-            or MYSQL_PASSWORD
         ),
         "db": (
             db
             or os.getenv("MYSQLDATABASE")
             or os.getenv("MYSQL_DATABASE")
             or os.getenv("MYSQL_DB")
-            or MYSQL_DB
         ),
         "port": int(port or os.getenv("MYSQLPORT") or os.getenv("MYSQL_PORT") or 3306),
     }
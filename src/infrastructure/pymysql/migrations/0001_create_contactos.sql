@@ -0,0 +1,14 @@
+-- Tabla base de contactos. IF NOT EXISTS respeta instalaciones creadas por versiones previas a las migraciones.
+CREATE TABLE IF NOT EXISTS contactos (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    ticket_id VARCHAR(36) NOT NULL,
+    name VARCHAR(120) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    company VARCHAR(160) NULL,
+    message VARCHAR(1200) NOT NULL,
+    page_location VARCHAR(512) NULL,
+    traffic_source VARCHAR(128) NULL,
+    ip VARCHAR(45) NULL,
+    user_agent VARCHAR(512) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
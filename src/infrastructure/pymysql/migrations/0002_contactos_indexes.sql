@@ -0,0 +1,6 @@
+-- Índices para las consultas calientes:
+-- listado/paginación por (created_at, id), búsqueda y deduplicación por ticket_id y email.
+ALTER TABLE contactos
+    ADD INDEX idx_contactos_created_at_id (created_at, id),
+    ADD UNIQUE INDEX uq_contactos_ticket_id (ticket_id),
+    ADD INDEX idx_contactos_email (email);
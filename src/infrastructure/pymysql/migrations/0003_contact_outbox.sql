@@ -0,0 +1,15 @@
+-- Outbox transaccional: cada alta de contacto deja un evento en la misma transacción que la fila.
+-- outbox_worker.py los reclama en lotes con FOR UPDATE SKIP LOCKED (MySQL 8.0+).
+CREATE TABLE IF NOT EXISTS contact_outbox (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(64) NOT NULL,
+    ticket_id VARCHAR(36) NOT NULL,
+    payload JSON NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    attempts INT NOT NULL DEFAULT 0,
+    available_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    processed_at DATETIME NULL,
+    last_error VARCHAR(255) NULL,
+    INDEX idx_contact_outbox_claim (status, available_at, id)
+);
@@ -0,0 +1,4 @@
+-- Búsqueda de /v1/contact/search: índice FULLTEXT (InnoDB) sobre los campos de texto libre.
+-- El prefijo de email (email LIKE 'ada@%') ya lo resuelve idx_contactos_email de 0002.
+ALTER TABLE contactos
+    ADD FULLTEXT INDEX ft_contactos_search (name, company, message);
@@ -0,0 +1,14 @@
+-- Rollup diario de /v1/contact/stats: un contador por (día, sitio, fuente de tráfico), así el
+-- endpoint lee a lo sumo días x fuentes filas, sin importar el tamaño de contactos.
+CREATE TABLE IF NOT EXISTS contact_daily_stats (
+    day DATE NOT NULL,
+    site VARCHAR(255) NOT NULL,
+    traffic_source VARCHAR(128) NOT NULL,
+    contacts INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, site, traffic_source)
+);
+-- High-water mark del job de catch-up (stats_rollup.py): último id de contactos ya consolidado.
+CREATE TABLE IF NOT EXISTS contact_stats_watermark (
+    name VARCHAR(32) NOT NULL PRIMARY KEY,
+    last_id INT NOT NULL
+);
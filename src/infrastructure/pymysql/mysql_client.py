@@ -2,35 +2,73 @@
 Path: src/infrastructure/pymysql/mysql_client.py
 """
 
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
 import pymysql
 from src.shared.logger_flask_v0 import get_logger
-from src.infrastructure.pymysql.db_config import load_db_config
-from src.infrastructure.pymysql.contact_table_provisioner import ContactTableProvisioner
+from src.infrastructure.pymysql.db_config import SESSION_INIT_COMMAND, load_db_config
+from src.entities.traffic_attribution import traffic_attribution
+from src.infrastructure.common.utc_clock import utc_now
+from src.infrastructure.pymysql.connection_pool import MySQLConnectionPool
 
 logger = get_logger()
 
+OUTBOX_INSERT = "INSERT INTO contact_outbox (event_type, ticket_id, payload) VALUES (%s, %s, %s)"
+CONTACT_CREATED = "contact.created"
+OUTBOX_FIELDS = ("ticket_id", "name", "email", "company", "message", "page_location", "traffic_source", "ip", "user_agent")
+STATS_INCREMENT = (
+    "INSERT INTO contact_daily_stats (day, site, traffic_source, contacts) VALUES (%s, %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE contacts = contacts + VALUES(contacts)"
+)
+# MATCH() es un FLOAT del servidor que llega redondeado por el protocolo de texto: el keyset usa un
+# rango entero (relevancia * SEARCH_SCORE_SCALE, truncada en la base) que vuelve en el cursor sin pérdida.
+SEARCH_SCORE_SCALE = 1_000_000
+
 
 class MySQLClient:
     "Cliente MySQL para operaciones de base de datos."
-    def __init__(self, host=None, user=None, password=None, db=None, port=None, provisioner=None):
+    def __init__(
+        self,
+        host=None,
+        user=None,
+        password=None,
+        db=None,
+        port=None,
+        pool_size=None,
+        metrics=None,
+        outbox=False,
+        daily_stats=False,
+    ):
         config = load_db_config(host=host, user=user, password=password, db=db, port=port)
         self.host = config["host"]
         self.user = config["user"]
         self.password = config["password"]
         self.db = config["db"]
         self.port = config["port"]
-        self.connection = None
-        self.provisioner = provisioner or ContactTableProvisioner()
-        # Lazy init: connect on first use to avoid boot failure when DB is down.
+        self.metrics = metrics
+        # Con outbox, cada alta escribe también un evento en contact_outbox (misma transacción).
+        self.outbox = outbox
+        # Con daily_stats, cada alta incrementa contact_daily_stats en la misma transacción.
+        self.daily_stats = daily_stats
+        # Lazy init: el pool conecta en el primer uso para no fallar al boot si la DB está caída.
+        self.pool = MySQLConnectionPool(
+            self.connect,
+            max_size=pool_size or int(os.getenv("MYSQL_POOL_SIZE", "4")),
+            max_idle_seconds=int(os.getenv("MYSQL_POOL_MAX_IDLE", "300")),
+            checkout_timeout=float(os.getenv("MYSQL_POOL_TIMEOUT", "5")),
+            retry_after=float(os.getenv("MYSQL_RETRY_AFTER", "5")),
+        )
 
     def connect(self):
-        "Establece una nueva conexión a MySQL."
+        "Abre una nueva conexión a MySQL (usada por el pool)."
         try:
             if not self.host or not self.user or not self.db:
                 raise ConnectionError("Missing MySQL configuration")
-            if self.connection:
-                self.connection.close()
-            self.connection = pymysql.connect(
+            connection = pymysql.connect(
                 host=self.host,
                 user=self.user,
                 password=self.password,
@@ -38,65 +76,270 @@ class MySQLClient:
                 port=self.port,
                 connect_timeout=5,
                 cursorclass=pymysql.cursors.DictCursor,
+                init_command=SESSION_INIT_COMMAND,
             )
             logger.info("Conexión a MySQL exitosa")
+            return connection
         except Exception as e:
             logger.error("Error de conexión a MySQL: %s", e)
             raise
 
     def ensure_connection(self):
-        "Verifica si la conexión está abierta y la restablece si es necesario."
+        "Verifica que el pool pueda entregar una conexión viva."
+        with self._query("ping"):
+            pass
+
+    @contextmanager
+    def _query(self, operation):
+        "Presta una conexión del pool registrando latencia y errores de `operation`."
+        start = time.perf_counter()
         try:
-            if not self.connection:
-                self.connect()
-                return
-            self.connection.ping(reconnect=True)
-        except (pymysql.Error, AttributeError):
-            self.connect()
-
-    def insert_contacto(self, ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent):
+            with self.pool.connection() as connection:
+                yield connection
+        except Exception as exc:
+            if self.metrics is not None:
+                self.metrics.inc("mysql_query_errors_total", {"operation": operation, "error": exc.__class__.__name__})
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe(
+                    "mysql_query_duration_seconds", time.perf_counter() - start, {"operation": operation}
+                )
+
+    def warm_pool(self, connections):
+        "Abre `connections` conexiones antes del primer request (p. ej. en post_fork)."
+        return self.pool.warm(connections)
+
+    def pool_stats(self):
+        "Devuelve las métricas del pool de conexiones."
+        return self.pool.stats()
+
+    def close(self):
+        "Cierra las conexiones ociosas del pool."
+        self.pool.close()
+
+    def insert_contacto(
+        self, ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at=None
+    ):
         "Inserta un registro de contacto en la base de datos."
-        self.ensure_connection()
         try:
-            with self.connection.cursor() as cursor:
-                sql = (
-                    "INSERT INTO contactos ("
-                    "ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at"
-                    ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
-                )
-                cursor.execute(sql, (
-                    ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent
-                ))
-                self.connection.commit()
+            with self._query("insert") as connection:
+                with connection.cursor() as cursor:
+                    sql = (
+                        "INSERT INTO contactos ("
+                        "ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at"
+                        ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+                    )
+                    # created_at (y con él el día del rollup) sale de utc_now(), no de NOW(): el mismo
+                    # reloj que usan las altas diferidas y ContactStatsUseCase.
+                    values = (
+                        ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent,
+                        created_at or utc_now(),
+                    )
+                    cursor.execute(sql, values)
+                    if self.outbox:
+                        cursor.execute(OUTBOX_INSERT, outbox_event(values))
+                    if self.daily_stats:
+                        cursor.executemany(STATS_INCREMENT, daily_stats_increments([values]))
+                connection.commit()
                 logger.info("Contacto insertado correctamente")
-        except pymysql.err.ProgrammingError as e:
-            if e.args and e.args[0] == 1146:
-                logger.warning("Tabla 'contactos' inexistente, intentando crearla")
-                self.provisioner.ensure_contactos_table()
-                return self.insert_contacto(
-                    ticket_id, name, email, company, message,
-                    page_location, traffic_source, ip, user_agent
-                )
+        except Exception as e:
             logger.error("Error al insertar contacto: %s", e)
             raise
+
+    def insert_contactos(self, rows):
+        "Inserta varios contactos con un único INSERT multi-fila y un solo commit; omite ticket_id ya existentes."
+        if not rows:
+            return
+        try:
+            with self._query("insert_batch") as connection:
+                with connection.cursor() as cursor:
+                    # Idempotente por ticket_id: los reintentos (write-behind, spool) no duplican filas.
+                    placeholders = ", ".join(["%s"] * len(rows))
+                    cursor.execute(
+                        f"SELECT ticket_id FROM contactos WHERE ticket_id IN ({placeholders})",
+                        [row[0] for row in rows],
+                    )
+                    existing = {found["ticket_id"] for found in cursor.fetchall()}
+                    pending = [row for row in rows if row[0] not in existing]
+                    if pending:
+                        # executemany reescribe el INSERT como multi-fila (solo admite placeholders en VALUES).
+                        cursor.executemany(
+                            "INSERT INTO contactos ("
+                            "ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at"
+                            ") VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                            pending,
+                        )
+                        if self.outbox:
+                            cursor.executemany(OUTBOX_INSERT, [outbox_event(row) for row in pending])
+                        if self.daily_stats:
+                            cursor.executemany(STATS_INCREMENT, daily_stats_increments(pending))
+                connection.commit()
+            logger.info("%d contactos insertados en lote (%d ya existían)", len(pending), len(existing))
         except Exception as e:
-            logger.error("Error al insertar contacto: %s", e)
+            logger.error("Error al insertar lote de contactos: %s", e)
             raise
 
     def get_all_contactos(self):
         "Devuelve una lista de todos los contactos registrados en la base de datos."
-        self.ensure_connection()
         try:
-            with self.connection.cursor() as cursor:
-                sql = (
-                    "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at "
-                    "FROM contactos "
-                    "ORDER BY created_at DESC"
-                )
-                cursor.execute(sql)
-                contactos = cursor.fetchall()
-                logger.info("%d contactos recuperados", len(contactos))
-                return contactos
+            with self._query("select_all") as connection:
+                with connection.cursor() as cursor:
+                    sql = (
+                        "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at "
+                        "FROM contactos "
+                        "ORDER BY created_at DESC"
+                    )
+                    cursor.execute(sql)
+                    contactos = cursor.fetchall()
+            logger.info("%d contactos recuperados", len(contactos))
+            return contactos
         except Exception as e:
             logger.error("Error al obtener contactos: %s", e)
             raise
+
+    def get_contactos_page(self, limit, after=None):
+        "Devuelve una página de contactos (tuplas, `id` al final) ordenada por (created_at, id) descendente usando keyset."
+        # Orden de columnas = CONTACT_ROW_FIELDS: las tuplas del cursor se usan tal cual como read-model.
+        columns = (
+            "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at, id "
+            "FROM contactos "
+        )
+        order = "ORDER BY created_at DESC, id DESC LIMIT %s"
+        try:
+            with self._query("select_page") as connection:
+                with connection.cursor(pymysql.cursors.Cursor) as cursor:
+                    if after is None:
+                        cursor.execute(columns + order, (limit,))
+                    else:
+                        created_at, last_id = after
+                        cursor.execute(
+                            columns
+                            + "WHERE created_at < %s OR (created_at = %s AND id < %s) "
+                            + order,
+                            (created_at, created_at, last_id, limit),
+                        )
+                    contactos = cursor.fetchall()
+            logger.info("%d contactos recuperados (página)", len(contactos))
+            return contactos
+        except Exception as e:
+            logger.error("Error al obtener página de contactos: %s", e)
+            raise
+
+    def search_contactos(self, query, limit, after=None):
+        "Busca contactos (tuplas ContactRow + score al final) por relevancia FULLTEXT o prefijo de email, con keyset (score, id)."
+        columns = (
+            "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at, id"
+        )
+        if query.email_prefix is not None:
+            # Usa idx_contactos_email; todas las coincidencias puntúan igual y se ordenan por id.
+            sql = columns + ", 0 AS score FROM contactos WHERE email LIKE %s "
+            params = [_like_prefix(query.email_prefix)]
+            if after is not None:
+                sql += "AND id < %s "
+                params.append(after[1])
+            sql += "ORDER BY id DESC LIMIT %s"
+        else:
+            match = "MATCH(name, company, message) AGAINST (%s IN BOOLEAN MODE)"
+            # Todas las palabras (+) y como prefijo (*), para buscar mientras se escribe.
+            terms = " ".join(f"+{term}*" for term in query.terms)
+            score = f"CAST(FLOOR({match} * {SEARCH_SCORE_SCALE}) AS SIGNED)"
+            sql = columns + f", {score} AS score FROM contactos WHERE {match} "
+            params = [terms, terms]
+            if after is not None:
+                sql += "HAVING score < %s OR (score = %s AND id < %s) "
+                params.extend((after[0], after[0], after[1]))
+            sql += "ORDER BY score DESC, id DESC LIMIT %s"
+        params.append(limit)
+        try:
+            with self._query("search") as connection:
+                with connection.cursor(pymysql.cursors.Cursor) as cursor:
+                    cursor.execute(sql, params)
+                    contactos = cursor.fetchall()
+            logger.info("%d contactos encontrados", len(contactos))
+            return contactos
+        except Exception as e:
+            logger.error("Error al buscar contactos: %s", e)
+            raise
+
+    def get_daily_stats(self, start, end, site=None):
+        "Devuelve las filas (day, site, traffic_source, contacts) del rollup entre `start` y `end` inclusive."
+        sql = "SELECT day, site, traffic_source, contacts FROM contact_daily_stats WHERE day BETWEEN %s AND %s "
+        params = [start, end]
+        if site is not None:
+            sql += "AND site = %s "
+            params.append(site)
+        sql += "ORDER BY day, site, traffic_source"
+        try:
+            with self._query("select_daily_stats") as connection:
+                with connection.cursor(pymysql.cursors.Cursor) as cursor:
+                    cursor.execute(sql, params)
+                    return cursor.fetchall()
+        except Exception as e:
+            logger.error("Error al obtener estadísticas diarias: %s", e)
+            raise
+
+    def get_contactos_watermark(self):
+        "Devuelve (max(id), count) de contactos: cambia con cada alta o baja."
+        try:
+            with self._query("watermark") as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT COALESCE(MAX(id), 0) AS max_id, COUNT(*) AS total FROM contactos")
+                    row = cursor.fetchone()
+            return row["max_id"], row["total"]
+        except Exception as e:
+            logger.error("Error al obtener watermark de contactos: %s", e)
+            raise
+
+    def iter_contactos(self, batch_size=500):
+        "Recorre todos los contactos con un cursor sin buffer (SSDictCursor), en lotes de `batch_size`."
+        connection = self.pool.checkout()
+        completed = False
+        try:
+            cursor = connection.cursor(pymysql.cursors.SSDictCursor)
+            cursor.execute(
+                "SELECT ticket_id, name, email, company, message, page_location, traffic_source, ip, user_agent, created_at "
+                "FROM contactos "
+                "ORDER BY created_at DESC, id DESC"
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+            cursor.close()
+            completed = True
+        except Exception as e:
+            logger.error("Error al exportar contactos: %s", e)
+            raise
+        finally:
+            # Si el consumidor abandona el stream, cerrar el cursor drenaría todas las filas
+            # pendientes; es más barato descartar la conexión.
+            if completed:
+                self.pool.checkin(connection)
+            else:
+                self.pool.discard(connection)
+
+
+def _like_prefix(prefix):
+    "Patrón LIKE para `prefix` con los comodines escapados."
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def daily_stats_increments(rows):
+    "Parámetros de STATS_INCREMENT para filas (ticket_id, ..., user_agent, created_at), agrupadas por clave."
+    counts = Counter(
+        (row[9].date(), *traffic_attribution(row[5], row[6]))
+        for row in rows
+    )
+    # Orden fijo de claves: dos lotes concurrentes bloquean las filas del rollup en el mismo orden.
+    return [(*key, count) for key, count in sorted(counts.items())]
+
+
+def outbox_event(values):
+    "Parámetros de OUTBOX_INSERT para una fila (ticket_id, name, ..., user_agent[, created_at])."
+    payload = dict(zip(OUTBOX_FIELDS, values))
+    created_at = values[len(OUTBOX_FIELDS)] if len(values) > len(OUTBOX_FIELDS) else None
+    if created_at is not None:
+        payload["created_at"] = created_at.isoformat()
+    return CONTACT_CREATED, values[0], json.dumps(payload, ensure_ascii=False)
@@ -0,0 +1,121 @@
+"""
+Path: src/infrastructure/pymysql/outbox_store.py
+"""
+
+import json
+from contextlib import contextmanager
+
+import pymysql
+
+from src.application.dtos.outbox_event import OutboxEvent
+
+# El índice (status, available_at, id) sirve al filtro y al orden; SKIP LOCKED hace que varios
+# workers reclamen lotes disjuntos sin esperarse entre sí.
+CLAIM_SQL = (
+    "SELECT id, event_type, ticket_id, payload, attempts FROM contact_outbox "
+    "WHERE status = 'pending' AND available_at <= NOW() "
+    "ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+)
+MAX_ERROR_LENGTH = 255
+
+
+class ClaimedBatch:
+    "Eventos reclamados (bloqueados) en una transacción abierta, con su resultado pendiente de escribir."
+    def __init__(self, events):
+        self.events = events
+        self._done = []
+        self._retry = []
+        self._dead = []
+
+    def done(self, event):
+        "Marca el evento como procesado."
+        self._done.append(event.id)
+
+    def retry(self, event, error, delay_seconds):
+        "Devuelve el evento a la cola, disponible de nuevo en `delay_seconds`."
+        self._retry.append((int(delay_seconds), error[:MAX_ERROR_LENGTH], event.id))
+
+    def dead(self, event, error):
+        "Descarta el evento tras agotar los reintentos (queda con status 'dead' para revisión)."
+        self._dead.append((error[:MAX_ERROR_LENGTH], event.id))
+
+    def write(self, cursor):
+        "Escribe los resultados en la transacción del reclamo."
+        if self._done:
+            placeholders = ", ".join(["%s"] * len(self._done))
+            cursor.execute(
+                "UPDATE contact_outbox SET status = 'done', attempts = attempts + 1, processed_at = NOW() "
+                f"WHERE id IN ({placeholders})",
+                self._done,
+            )
+        if self._retry:
+            cursor.executemany(
+                "UPDATE contact_outbox SET attempts = attempts + 1, "
+                "available_at = NOW() + INTERVAL %s SECOND, last_error = %s WHERE id = %s",
+                self._retry,
+            )
+        if self._dead:
+            cursor.executemany(
+                "UPDATE contact_outbox SET status = 'dead', attempts = attempts + 1, "
+                "processed_at = NOW(), last_error = %s WHERE id = %s",
+                self._dead,
+            )
+
+
+class MySQLOutboxStore:
+    "contact_outbox: reclamo de lotes con FOR UPDATE SKIP LOCKED y cierre del lote en la misma transacción."
+    def __init__(self, connect):
+        self._connect = connect
+        self._connection = None
+
+    @contextmanager
+    def claim(self, batch_size):
+        "Bloquea hasta `batch_size` eventos pendientes; al salir escribe los resultados y hace commit."
+        # Si el proceso muere a mitad de lote, la transacción se revierte y los eventos vuelven a
+        # quedar disponibles: entrega at-least-once.
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(CLAIM_SQL, (batch_size,))
+                batch = ClaimedBatch([_to_event(row) for row in cursor.fetchall()])
+            yield batch
+            with connection.cursor() as cursor:
+                batch.write(cursor)
+            connection.commit()
+        except Exception:
+            self._rollback_quietly(connection)
+            raise
+
+    def close(self):
+        "Cierra la conexión del worker."
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except pymysql.Error:
+                pass
+
+    def _get_connection(self):
+        if self._connection is None:
+            self._connection = self._connect()
+        else:
+            self._connection.ping(reconnect=True)
+        return self._connection
+
+    def _rollback_quietly(self, connection):
+        try:
+            connection.rollback()
+        except (pymysql.Error, OSError):
+            # Conexión rota: se descarta y la próxima vuelta reconecta.
+            self.close()
+
+
+def _to_event(row):
+    payload = row["payload"]
+    return OutboxEvent(
+        id=row["id"],
+        event_type=row["event_type"],
+        ticket_id=row["ticket_id"],
+        payload=json.loads(payload) if isinstance(payload, (str, bytes)) else payload,
+        attempts=row["attempts"],
+    )
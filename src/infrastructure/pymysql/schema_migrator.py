@@ -0,0 +1,121 @@
+"""
+Path: src/infrastructure/pymysql/schema_migrator.py
+"""
+
+import os
+import re
+
+import pymysql
+from src.infrastructure.pymysql.db_config import load_db_config
+from src.shared.logger_flask_v0 import get_logger
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_([a-z0-9_]+)\.sql$")
+LOCK_NAME = "profebustos_schema_migrations"
+
+
+class Migration:
+    "Script SQL versionado de la carpeta migrations/."
+    def __init__(self, version, name, statements):
+        self.version = version
+        self.name = name
+        self.statements = statements
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    "Carga los scripts NNNN_nombre.sql ordenados por versión."
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as handle:
+            sql = handle.read()
+        migrations.append(Migration(int(match.group(1)), match.group(2), split_statements(sql)))
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError("Duplicate migration versions in %s" % directory)
+    return migrations
+
+
+def split_statements(sql):
+    "Separa un script en sentencias (terminadas en ';' al final de línea), sin comentarios '--'."
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    statements = re.split(r";\s*$", "\n".join(lines), flags=re.MULTILINE)
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+class SchemaMigrator:
+    "Aplica migraciones pendientes una sola vez, serializadas con un advisory lock de MySQL."
+    def __init__(self, connect=None, migrations=None, lock_timeout=30):
+        self.logger = get_logger("profebustos.migrator")
+        self._connect = connect or _default_connect
+        self.migrations = migrations if migrations is not None else load_migrations()
+        self.lock_timeout = lock_timeout
+
+    def migrate(self):
+        "Aplica las migraciones pendientes y retorna las versiones aplicadas."
+        connection = self._connect()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT GET_LOCK(%s, %s) AS acquired", (LOCK_NAME, self.lock_timeout))
+                row = cursor.fetchone()
+                if not row or not _first_value(row):
+                    raise RuntimeError("No se pudo obtener el lock de migraciones")
+            try:
+                return self._apply_pending(connection)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+        finally:
+            connection.close()
+
+    def _apply_pending(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version INT NOT NULL PRIMARY KEY, "
+                "name VARCHAR(255) NOT NULL, "
+                "applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            )
+            cursor.execute("SELECT version FROM schema_migrations")
+            applied = {_first_value(row) for row in cursor.fetchall()}
+        connection.commit()
+
+        newly_applied = []
+        for migration in self.migrations:
+            if migration.version in applied:
+                continue
+            self.logger.info("Aplicando migración %04d_%s", migration.version, migration.name)
+            # DDL en MySQL hace commit implícito: cada script debe poder reintentarse o ser atómico.
+            with connection.cursor() as cursor:
+                for statement in migration.statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name),
+                )
+            connection.commit()
+            newly_applied.append(migration.version)
+        if not newly_applied:
+            self.logger.info("Esquema al día (sin migraciones pendientes)")
+        return newly_applied
+
+
+def _first_value(row):
+    if isinstance(row, dict):
+        return next(iter(row.values()))
+    return row[0]
+
+
+def _default_connect():
+    config = load_db_config()
+    return pymysql.connect(
+        host=config["host"],
+        user=config["user"],
+        password=config["password"],
+        database=config["db"],
+        port=config["port"],
+        connect_timeout=5,
+        cursorclass=pymysql.cursors.DictCursor,
+    )
@@ -0,0 +1,87 @@
+"""
+Path: src/infrastructure/smtp/debug_smtp_server.py
+"""
+
+import socketserver
+import threading
+from email import message_from_bytes, policy
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    "Diálogo SMTP mínimo (EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT), sin TLS ni AUTH."
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 debug-smtp ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self._reply("250-debug-smtp", "250-8BITMIME", "250 SMTPUTF8")
+            elif verb in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self._receive_data()
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _receive_data(self):
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        server = self.server
+        with server.lock:
+            if server.fail_next > 0:
+                server.fail_next -= 1
+                self._reply("451 Temporary failure")
+                return
+        server.deliver(message_from_bytes(b"".join(lines), policy=policy.default))
+        self._reply("250 OK: queued")
+
+    def _reply(self, *lines):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode("utf-8"))
+
+
+class DebugSMTPServer(socketserver.ThreadingTCPServer):
+    "Servidor SMTP local para desarrollo y tests: acepta todo y guarda los mensajes sin entregarlos."
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 1025), on_message=None, fail_next=0):
+        super().__init__(address, _SMTPHandler)
+        self.on_message = on_message
+        self.messages = []
+        self.connections = 0
+        # Responde 451 a los próximos `fail_next` DATA, para probar los reintentos.
+        self.fail_next = fail_next
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def deliver(self, message):
+        "Registra un mensaje recibido."
+        with self.lock:
+            self.messages.append(message)
+        if self.on_message is not None:
+            self.on_message(message)
+
+    def start(self):
+        "Atiende conexiones en un hilo de fondo."
+        self._thread = threading.Thread(target=self.serve_forever, name="debug-smtp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        "Detiene el servidor y libera el puerto."
+        self.shutdown()
+        self.server_close()
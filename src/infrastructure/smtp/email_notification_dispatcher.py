@@ -0,0 +1,244 @@
+"""
+Path: src/infrastructure/smtp/email_notification_dispatcher.py
+"""
+
+import atexit
+import queue
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from src.application.dtos.contact_dto import ContactDTO
+from src.application.ports.contact_notifier import ContactNotifier
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.notifications")
+
+
+class SMTPMailer:
+    "Conexión SMTP persistente: se abre en el primer envío y se reutiliza hasta que falla."
+    def __init__(self, host, port=587, username=None, password=None, starttls=True, timeout=10):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp = None
+
+    def send(self, message):
+        "Envía `message`; ante un error cierra la conexión para que el próximo envío reconecte."
+        try:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            self._smtp.send_message(message)
+        except (smtplib.SMTPException, OSError):
+            self.close()
+            raise
+
+    def close(self):
+        "Cierra la conexión (QUIT) si está abierta."
+        smtp, self._smtp = self._smtp, None
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        return smtp
+
+
+def build_contact_message(contact, sender, recipient):
+    "Correo transaccional de una consulta; Reply-To apunta al remitente del formulario."
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = recipient
+    message["Reply-To"] = contact.email
+    message["Subject"] = f"Nueva consulta de {contact.name} [{contact.ticket_id}]"
+    message.set_content(_describe(contact))
+    return message
+
+
+def build_digest_message(contacts, sender, recipient):
+    "Un único correo con varias consultas, para ráfagas."
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = recipient
+    message["Subject"] = f"{len(contacts)} nuevas consultas"
+    message.set_content("\n\n---\n\n".join(_describe(contact) for contact in contacts))
+    return message
+
+
+def _describe(contact):
+    return "\n".join((
+        f"Ticket: {contact.ticket_id}",
+        f"Nombre: {contact.name}",
+        f"Email: {contact.email}",
+        f"Empresa: {contact.company or '-'}",
+        f"Página: {contact.page_location or '-'}",
+        f"Origen: {contact.traffic_source or '-'}",
+        "",
+        contact.message,
+    ))
+
+
+class EmailNotificationDispatcher(ContactNotifier):
+    "Pool de hilos que envía las notificaciones de contactos por SMTP, fuera del request."
+    def __init__(
+        self,
+        mailer_factory,
+        sender,
+        recipient,
+        workers=2,
+        max_size=1000,
+        digest_threshold=5,
+        batch_window=1.0,
+        max_batch=50,
+        max_retries=3,
+        retry_backoff=1.0,
+    ):
+        self.mailer_factory = mailer_factory
+        self.sender = sender
+        self.recipient = recipient
+        self.workers = workers
+        # Con `digest_threshold` o más notificaciones juntas dentro de `batch_window` se manda
+        # un solo correo resumen en lugar de uno por contacto.
+        self.digest_threshold = digest_threshold
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stopping = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._stats = {"queued": 0, "dropped": 0, "sent": 0, "digests": 0, "failed": 0}
+
+    def start(self):
+        "Inicia los hilos de envío (idempotente)."
+        with self._lock:
+            if any(thread.is_alive() for thread in self._threads):
+                return
+            self._stopping.clear()
+            self._threads = [
+                threading.Thread(target=self._run, name=f"contact-notifier-{index}", daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+        atexit.register(self.stop)
+
+    def notify(self, contact):
+        "Encola la notificación sin bloquear; con la cola llena se descarta y se registra."
+        try:
+            self._queue.put_nowait(contact)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            logger.warning("Notificaciones: cola llena, se descarta el aviso de %s", contact.ticket_id)
+            return
+        with self._lock:
+            self._stats["queued"] += 1
+
+    def stop(self, timeout=10):
+        "Deja de aceptar trabajo, envía lo pendiente y cierra las conexiones SMTP."
+        self._stopping.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(max(deadline - time.monotonic(), 0))
+        if not self._queue.empty():
+            logger.warning("Notificaciones: quedaron %d avisos sin enviar", self._queue.qsize())
+
+    def stats(self):
+        "Devuelve contadores y profundidad actual de la cola."
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["depth"] = self._queue.qsize()
+        return snapshot
+
+    def _run(self):
+        # Cada hilo reutiliza su propia conexión SMTP entre envíos.
+        mailer = self.mailer_factory()
+        try:
+            while not (self._stopping.is_set() and self._queue.empty()):
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                if len(batch) >= self.digest_threshold:
+                    self._deliver(mailer, build_digest_message(batch, self.sender, self.recipient), batch)
+                else:
+                    for contact in batch:
+                        self._deliver(mailer, build_contact_message(contact, self.sender, self.recipient), [contact])
+        finally:
+            mailer.close()
+
+    def _next_batch(self):
+        try:
+            first = self._queue.get(timeout=self.batch_window)
+        except queue.Empty:
+            return []
+        batch = [first]
+        # Solo se espera la ventana si ya hay más avisos encolados (ráfaga); un aviso aislado
+        # sale de inmediato.
+        if self._queue.empty():
+            return batch
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0 or self._stopping.is_set():
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _deliver(self, mailer, message, contacts):
+        for attempt in range(self.max_retries + 1):
+            try:
+                mailer.send(message)
+                with self._lock:
+                    self._stats["sent"] += len(contacts)
+                    if len(contacts) > 1:
+                        self._stats["digests"] += 1
+                return
+            except (smtplib.SMTPException, OSError) as exc:
+                if attempt == self.max_retries:
+                    with self._lock:
+                        self._stats["failed"] += len(contacts)
+                    logger.error(
+                        "Notificaciones: envío descartado tras %d reintentos (%s): %s",
+                        self.max_retries, exc.__class__.__name__, [c.ticket_id for c in contacts],
+                    )
+                    return
+                logger.warning(
+                    "Notificaciones: fallo al enviar (%d avisos, intento %d): %s",
+                    len(contacts), attempt + 1, exc.__class__.__name__,
+                )
+                time.sleep(self.retry_backoff * (2 ** attempt))
+
+
+class EmailNotificationHandler:
+    "Handler de outbox_worker.py para contact.created: envía el aviso en el hilo del worker."
+    def __init__(self, mailer_factory, sender, recipient):
+        self.mailer_factory = mailer_factory
+        self.sender = sender
+        self.recipient = recipient
+        # Una conexión SMTP por hilo del worker, reutilizada entre lotes.
+        self._local = threading.local()
+
+    def __call__(self, event):
+        mailer = getattr(self._local, "mailer", None)
+        if mailer is None:
+            mailer = self._local.mailer = self.mailer_factory()
+        contact = ContactDTO(**event.payload)
+        mailer.send(build_contact_message(contact, self.sender, self.recipient))
@@ -0,0 +1,114 @@
+"""
+Path: src/infrastructure/sqlite/rate_limiter.py
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from src.application.ports.rate_limiter import RateLimiter
+from src.shared.logger_flask_v0 import get_logger
+
+logger = get_logger("profebustos.ratelimit")
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(value):
+    "Convierte '5/hour' en (capacidad, período en segundos)."
+    count, _, unit = value.partition("/")
+    unit = unit.strip().lower().rstrip("s")
+    if unit not in PERIODS:
+        raise ValueError(f"Invalid rate: {value!r}")
+    capacity = int(count)
+    if capacity < 1:
+        raise ValueError(f"Invalid rate: {value!r}")
+    return capacity, PERIODS[unit]
+
+
+class SQLiteRateLimiter(RateLimiter):
+    "Token bucket por clave, persistido en SQLite (WAL) y compartido entre los workers del host."
+    CLEANUP_EVERY = 1000
+
+    def __init__(self, path, rules, clock=time.time):
+        self.path = path
+        self.rules = rules
+        self._clock = clock
+        self._local = threading.local()
+        self._hits = 0
+        self._init_schema()
+
+    def hit(self, keys):
+        "Consume un token de cada bucket; si alguno está vacío no consume ninguno."
+        buckets = [
+            (f"{scope}:{value}",) + self.rules[scope]
+            for scope, value in keys.items()
+            if value and scope in self.rules
+        ]
+        if not buckets:
+            return 0
+        now = self._clock()
+        conn = self._connection()
+        try:
+            # BEGIN IMMEDIATE toma el lock de escritura: la lectura y el descuento son atómicos
+            # entre procesos.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                updates = []
+                retry_after = 0.0
+                for key, capacity, period in buckets:
+                    rate = capacity / period
+                    row = conn.execute(
+                        "SELECT tokens, updated_at FROM rate_buckets WHERE key = ?", (key,)
+                    ).fetchone()
+                    tokens = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate)
+                    if tokens < 1:
+                        retry_after = max(retry_after, (1 - tokens) / rate)
+                    updates.append((key, tokens - 1))
+                if retry_after:
+                    conn.execute("ROLLBACK")
+                    return math.ceil(retry_after)
+                conn.executemany(
+                    "INSERT INTO rate_buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                    [(key, tokens, now) for key, tokens in updates],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as exc:
+            # Si el backend local falla se deja pasar la solicitud: el límite es best-effort.
+            logger.warning("Rate limiter no disponible: %s", exc)
+            return 0
+        self._maybe_cleanup(now)
+        return 0
+
+    def _maybe_cleanup(self, now):
+        self._hits += 1
+        if self._hits % self.CLEANUP_EVERY:
+            return
+        longest = max(period for _, period in self.rules.values())
+        try:
+            self._connection().execute("DELETE FROM rate_buckets WHERE updated_at < ?", (now - longest,))
+        except sqlite3.Error as exc:
+            logger.warning("No se pudo limpiar el rate limiter: %s", exc)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        # Una conexión SQLite no debe cruzar un fork (gunicorn --preload).
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self):
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS rate_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
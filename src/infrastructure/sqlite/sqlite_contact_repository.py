@@ -0,0 +1,275 @@
+"""
+Path: src/infrastructure/sqlite/sqlite_contact_repository.py
+"""
+
+import os
+import sqlite3
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from src.application.dtos.contact_daily_stat import ContactDailyStat
+from src.application.dtos.contact_row import CONTACT_ROW_FIELDS, ContactRow
+from src.application.errors import ContactCreateFailed, ContactListFailed, DatabaseUnavailable
+from src.entities.contact import Contact
+from src.entities.traffic_attribution import traffic_attribution
+from src.infrastructure.common.utc_clock import utc_now
+from src.interface_adapters.gateways.contact_repository import ContactRepository
+
+# Mismo esquema e índices que las migraciones MySQL (0001 y 0002).
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS contactos ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "ticket_id TEXT NOT NULL, "
+    "name TEXT NOT NULL, "
+    "email TEXT NOT NULL, "
+    "company TEXT NULL, "
+    "message TEXT NOT NULL, "
+    "page_location TEXT NULL, "
+    "traffic_source TEXT NULL, "
+    "ip TEXT NULL, "
+    "user_agent TEXT NULL, "
+    "created_at TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_contactos_created_at_id ON contactos (created_at, id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_contactos_ticket_id ON contactos (ticket_id)",
+    "CREATE INDEX IF NOT EXISTS idx_contactos_email ON contactos (email)",
+)
+# Equivalente al FULLTEXT de 0004: índice FTS5 de contenido externo, mantenido por triggers.
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS contactos_fts USING fts5("
+    "name, company, message, content='contactos', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS contactos_fts_ai AFTER INSERT ON contactos BEGIN "
+    "INSERT INTO contactos_fts (rowid, name, company, message) VALUES (new.id, new.name, new.company, new.message); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS contactos_fts_ad AFTER DELETE ON contactos BEGIN "
+    "INSERT INTO contactos_fts (contactos_fts, rowid, name, company, message) "
+    "VALUES ('delete', old.id, old.name, old.company, old.message); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS contactos_fts_au AFTER UPDATE ON contactos BEGIN "
+    "INSERT INTO contactos_fts (contactos_fts, rowid, name, company, message) "
+    "VALUES ('delete', old.id, old.name, old.company, old.message); "
+    "INSERT INTO contactos_fts (rowid, name, company, message) VALUES (new.id, new.name, new.company, new.message); "
+    "END",
+)
+# Rollup diario de 0005, mantenido en la misma transacción de cada alta (un solo nodo, sin job).
+STATS_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS contact_daily_stats ("
+    "day TEXT NOT NULL, "
+    "site TEXT NOT NULL, "
+    "traffic_source TEXT NOT NULL, "
+    "contacts INTEGER NOT NULL DEFAULT 0, "
+    "PRIMARY KEY (day, site, traffic_source))"
+)
+STATS_INCREMENT = (
+    "INSERT INTO contact_daily_stats (day, site, traffic_source, contacts) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (day, site, traffic_source) DO UPDATE SET contacts = contacts + excluded.contacts"
+)
+COLUMNS = ", ".join(CONTACT_ROW_FIELDS)
+# bm25() es menor cuanto más relevante: se niega para ordenar igual que MATCH() de MySQL.
+SEARCH_SQL = (
+    "SELECT * FROM ("
+    f"SELECT {', '.join(f'c.{field}' for field in CONTACT_ROW_FIELDS)}, -bm25(contactos_fts) AS score "
+    "FROM contactos_fts JOIN contactos c ON c.id = contactos_fts.rowid WHERE contactos_fts MATCH ?"
+    ")"
+)
+INSERT_COLUMNS = ", ".join(CONTACT_ROW_FIELDS[:-1])
+# created_at se guarda como texto de ancho fijo (precisión de segundos, como DATETIME):
+# el orden lexicográfico coincide con el cronológico y el índice sirve para el keyset.
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _to_db(value):
+    return (value or utc_now()).strftime(DATETIME_FORMAT)
+
+
+def _to_row(raw):
+    return ContactRow(*raw[:-2], datetime.strptime(raw[-2], DATETIME_FORMAT), raw[-1])
+
+
+def _stats_increments(rows):
+    "Parámetros de STATS_INCREMENT para filas (page_location, traffic_source, created_at), agrupadas por clave."
+    counts = Counter((created_at[:10], *traffic_attribution(page_location, traffic_source))
+                     for page_location, traffic_source, created_at in rows)
+    return [(*key, count) for key, count in counts.items()]
+
+
+def _like_prefix(prefix):
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+@contextmanager
+def _translate_errors(failure):
+    "Traduce errores de sqlite3 a errores de aplicación, como el adaptador MySQL."
+    try:
+        yield
+    except sqlite3.OperationalError as exc:
+        # Base bloqueada, archivo inaccesible o disco lleno: el almacenamiento no está disponible.
+        raise DatabaseUnavailable() from exc
+    except sqlite3.Error as exc:
+        raise failure() from exc
+
+
+class SQLiteContactRepository(ContactRepository):
+    "Repositorio de contactos en un archivo SQLite (WAL), para despliegues de un solo nodo."
+    ITER_BATCH_SIZE = 500
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        try:
+            with self._connection() as conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                indexed = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'contactos_fts'").fetchone()
+                for statement in FTS_SCHEMA:
+                    conn.execute(statement)
+                if indexed is None:
+                    # Archivo creado antes de la búsqueda: indexa los contactos existentes.
+                    conn.execute("INSERT INTO contactos_fts (contactos_fts) VALUES ('rebuild')")
+                rolled_up = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'contact_daily_stats'").fetchone()
+                conn.execute(STATS_SCHEMA)
+                if rolled_up is None:
+                    self._rebuild_daily_stats(conn)
+        except sqlite3.Error as exc:
+            raise DatabaseUnavailable() from exc
+
+    def save(self, contact):
+        "Guarda un contacto y lo retorna."
+        with _translate_errors(ContactCreateFailed):
+            with self._connection() as conn:
+                values = self._values(contact)
+                conn.execute(f"INSERT INTO contactos ({INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+                conn.executemany(STATS_INCREMENT, _stats_increments([(values[5], values[6], values[9])]))
+        self._notify_change()
+        return contact
+
+    def save_many(self, contacts):
+        "Guarda varios contactos en una transacción; omite ticket_id ya existentes."
+        with _translate_errors(ContactCreateFailed):
+            with self._connection() as conn:
+                inserted = []
+                for contact in contacts:
+                    values = self._values(contact)
+                    cursor = conn.execute(
+                        f"INSERT OR IGNORE INTO contactos ({INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        values,
+                    )
+                    # Los ticket_id ya existentes se omiten y no cuentan en el rollup.
+                    if cursor.rowcount:
+                        inserted.append((values[5], values[6], values[9]))
+                conn.executemany(STATS_INCREMENT, _stats_increments(inserted))
+        self._notify_change()
+
+    def get_all(self):
+        "Devuelve todos los contactos, del más reciente al más antiguo."
+        return list(self.iter_all())
+
+    def get_page(self, limit, after=None):
+        "Devuelve una página de filas ContactRow y el keyset (created_at, id) de la siguiente."
+        sql = f"SELECT {COLUMNS} FROM contactos"
+        params = []
+        if after is not None:
+            sql += " WHERE (created_at, id) < (?, ?)"
+            params.extend((after[0].strftime(DATETIME_FORMAT), after[1]))
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        with _translate_errors(ContactListFailed):
+            rows = [_to_row(raw) for raw in self._connection().execute(sql, params)]
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (rows[-1].created_at, rows[-1].id)
+        return rows, next_after
+
+    def search(self, query, limit, after=None):
+        "Busca con FTS5 (todas las palabras, como prefijo) o por prefijo de email, con keyset (score, id)."
+        if query.email_prefix is not None:
+            sql = f"SELECT {COLUMNS}, 0.0 AS score FROM contactos WHERE email LIKE ? ESCAPE '\\'"
+            params = [_like_prefix(query.email_prefix)]
+            if after is not None:
+                sql += " AND id < ?"
+                params.append(after[1])
+            sql += " ORDER BY id DESC LIMIT ?"
+        else:
+            sql = SEARCH_SQL
+            params = [" ".join(f'"{term}"*' for term in query.terms)]
+            if after is not None:
+                sql += " WHERE score < ? OR (score = ? AND id < ?)"
+                params.extend((after[0], after[0], after[1]))
+            sql += " ORDER BY score DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        with _translate_errors(ContactListFailed):
+            raw = self._connection().execute(sql, params).fetchall()
+        rows = [_to_row(row[:-1]) for row in raw]
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_after = (raw[limit - 1][-1], rows[-1].id)
+        return rows, next_after
+
+    def iter_all(self):
+        "Recorre todos los contactos por páginas de keyset, sin cargarlos completos en memoria."
+        after = None
+        while True:
+            rows, after = self.get_page(self.ITER_BATCH_SIZE, after)
+            for row in rows:
+                yield Contact(*row[:-1])
+            if after is None:
+                return
+
+    def get_daily_stats(self, start, end, site=None):
+        "Devuelve el rollup diario entre `start` y `end` inclusive."
+        sql = "SELECT day, site, traffic_source, contacts FROM contact_daily_stats WHERE day BETWEEN ? AND ?"
+        params = [start.isoformat(), end.isoformat()]
+        if site is not None:
+            sql += " AND site = ?"
+            params.append(site)
+        sql += " ORDER BY day, site, traffic_source"
+        with _translate_errors(ContactListFailed):
+            rows = self._connection().execute(sql, params).fetchall()
+        return [ContactDailyStat(date.fromisoformat(day), *rest) for day, *rest in rows]
+
+    def get_watermark(self):
+        "Devuelve (max(id), count)."
+        with _translate_errors(ContactListFailed):
+            max_id, total = self._connection().execute(
+                "SELECT COALESCE(MAX(id), 0), COUNT(*) FROM contactos"
+            ).fetchone()
+        return max_id, total
+
+    def ping(self):
+        "Verifica que el archivo SQLite responda."
+        with _translate_errors(DatabaseUnavailable):
+            self._connection().execute("SELECT 1").fetchone()
+
+    def _rebuild_daily_stats(self, conn):
+        "Recalcula el rollup desde contactos (archivos creados antes de las estadísticas); idempotente."
+        conn.execute("DELETE FROM contact_daily_stats")
+        rows = conn.execute("SELECT page_location, traffic_source, created_at FROM contactos")
+        conn.executemany(STATS_INCREMENT, _stats_increments(rows))
+
+    def _values(self, contact):
+        return (
+            contact.ticket_id,
+            contact.name,
+            contact.email,
+            contact.company,
+            contact.message,
+            contact.page_location,
+            contact.traffic_source,
+            contact.ip,
+            contact.user_agent,
+            _to_db(contact.created_at),
+        )
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        # Una conexión SQLite no debe cruzar un fork (gunicorn --preload).
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
@@ -2,121 +2,197 @@
 Path: interface_adapters/controllers/contact_controller.py
 """
 
-import os
-import re
+import asyncio
 
 from src.shared.logger_flask_v0 import get_logger
-from src.application.errors import ContactCreateFailed, DatabaseUnavailable
+from src.application.errors import ContactCreateFailed, ContactQueueFull, DatabaseUnavailable, IdempotencyKeyReused
+from src.interface_adapters.controllers.contact_validation import primary_error, validate_contact_payload
 
 logger = get_logger("contact_controller")
 
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+# Ancho de contactos.user_agent (VARCHAR(512)); en modo estricto MySQL rechaza uno más largo.
+MAX_USER_AGENT_LENGTH = 512
+
+_ERROR_MESSAGES = {
+    'INVALID_TYPE': 'Tipo de campo inválido',
+    'MISSING_FIELDS': 'Faltan campos requeridos',
+    'FIELD_LENGTH_EXCEEDED': 'Longitud de campos excedida',
+    'FIELD_TOO_SHORT': 'Longitud de campos insuficiente',
+    'INVALID_EMAIL': 'El correo electrónico tiene un formato inválido',
+    'PAYLOAD_TOO_LARGE': 'El contenido del formulario excede el tamaño permitido',
+}
+
 
 class ContactController:
-    "Controller para manejar la lÃ³gica de entrada de contactos."
-    def __init__(self, register_contact_use_case):
+    "Controller para manejar la lógica de entrada de contactos."
+    def __init__(self, register_contact_use_case, rate_limiter=None, debug=False):
         self.register_contact_use_case = register_contact_use_case
+        self.rate_limiter = rate_limiter
+        # En desarrollo las respuestas 503 incluyen el tipo de error.
+        self.debug = debug
 
     def registrar_contacto(self, request):
         "Maneja la solicitud para registrar un nuevo contacto."
+        error_response, status, command = self._prepare(request)
+        if command is None:
+            return error_response, status
+        try:
+            limited = self._rate_limited(request, command)
+            if limited is not None:
+                return limited
+            contact = self.register_contact_use_case.execute(**command)
+        except (ContactQueueFull, ContactCreateFailed, DatabaseUnavailable, IdempotencyKeyReused) as exc:
+            return self._failure(exc, request)
+        return _accepted(contact)
+
+    async def registrar_contacto_async(self, request):
+        "Igual que registrar_contacto, con un caso de uso asíncrono (entrypoint ASGI)."
+        error_response, status, command = self._prepare(request)
+        if command is None:
+            return error_response, status
+        try:
+            limited = await self._rate_limited_async(request, command)
+            if limited is not None:
+                return limited
+            contact = await self.register_contact_use_case.execute(**command)
+        except (ContactQueueFull, ContactCreateFailed, DatabaseUnavailable, IdempotencyKeyReused) as exc:
+            return self._failure(exc, request)
+        return _accepted(contact)
+
+    def _prepare(self, request):
+        "Valida el request; devuelve (respuesta, status, None) o (None, None, argumentos del caso de uso)."
         if not request.is_json:
             return {
                 'success': False,
                 'error': 'Formato JSON requerido',
                 'error_code': 'JSON_REQUIRED'
-            }, 400
+            }, 400, None
 
         data = request.get_json()
         error_response, error_status, normalized = sanitize_and_validate_contact_payload(data)
         if error_response is not None:
-            return error_response, error_status
-
-        name = normalized["name"]
-        email = normalized["email"]
-        company = normalized["company"]
-        message = normalized["message"]
-        page_location = normalized["page_location"]
-        traffic_source = normalized["traffic_source"]
+            return error_response, error_status, None
 
-        try:
-            contact = self.register_contact_use_case.execute(
-                name=name,
-                email=email,
-                company=company,
-                message=message,
-                page_location=page_location,
-                traffic_source=traffic_source,
-                ip=request.remote_addr,
-                user_agent=request.headers.get('User-Agent', '')
-            )
-            return {'success': True, 'ticket_id': contact.ticket_id, 'contact': contact}, 201
-        except ContactCreateFailed:
+        idempotency_key = request.headers.get('Idempotency-Key', '').strip()
+        if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            return {
+                'success': False,
+                'error': 'Idempotency-Key inválido',
+                'error_code': 'INVALID_IDEMPOTENCY_KEY'
+            }, 400, None
+
+        return None, None, {
+            "name": normalized["name"],
+            "email": normalized["email"],
+            "company": normalized["company"],
+            "message": normalized["message"],
+            "page_location": normalized["page_location"],
+            "traffic_source": normalized["traffic_source"],
+            "ip": request.remote_addr,
+            "user_agent": request.headers.get('User-Agent', '')[:MAX_USER_AGENT_LENGTH],
+            "idempotency_key": idempotency_key or None,
+        }
+
+    def _rate_limited(self, request, command):
+        "Aplica el rate limit; devuelve (respuesta, 429) si se superó o None."
+        if self.rate_limiter is None or self._is_replay(command):
+            return None
+        return _too_many_requests(self.rate_limiter.hit(_rate_limit_keys(request, command)))
+
+    async def _rate_limited_async(self, request, command):
+        "Igual que _rate_limited, fuera del event loop: SQLiteRateLimiter.hit bloquea (BEGIN IMMEDIATE)."
+        if self.rate_limiter is None or self._is_replay(command):
+            return None
+        retry_after = await asyncio.to_thread(self.rate_limiter.hit, _rate_limit_keys(request, command))
+        return _too_many_requests(retry_after)
+
+    def _is_replay(self, command):
+        "Un reenvío (Idempotency-Key o contenido repetido) devuelve el ticket original sin gastar el cupo."
+        return self.register_contact_use_case.find_replay(
+            command["name"], command["email"], command["message"], command["idempotency_key"]
+        ) is not None
+
+    def _failure(self, exc, request):
+        "Traduce los errores del caso de uso a la respuesta HTTP."
+        if isinstance(exc, ContactQueueFull):
+            logger.warning("Cola de escritura llena al registrar contacto path=%s", request.path)
+            return {
+                'success': False,
+                'error': 'Servicio temporalmente saturado',
+                'error_code': 'CONTACT_QUEUE_FULL'
+            }, 503
+        if isinstance(exc, IdempotencyKeyReused):
+            return {
+                'success': False,
+                'error': 'Idempotency-Key ya usada con otro contenido',
+                'error_code': 'IDEMPOTENCY_KEY_REUSED'
+            }, 422
+        if isinstance(exc, ContactCreateFailed):
             return {
                 'success': False,
                 'error': 'Error al registrar el contacto',
                 'error_code': 'CONTACT_CREATE_FAILED'
             }, 500
-        except DatabaseUnavailable as exc:
-            logger.warning(
-                "DB no disponible al registrar contacto origin=%s path=%s ip=%s ua=%s err=%s",
-                request.headers.get("Origin"),
-                request.path,
-                request.remote_addr,
-                request.headers.get("User-Agent"),
-                exc.__class__.__name__,
-            )
-            response = {
-                'success': False,
-                'error': 'Servicio temporalmente no disponible',
-                'error_code': 'DB_UNAVAILABLE'
-            }
-            if os.getenv("FLASK_ENV") == "development":
-                response["error_detail"] = exc.__class__.__name__
-            return response, 503
+        logger.warning(
+            "DB no disponible al registrar contacto origin=%s path=%s ip=%s ua=%s err=%s",
+            request.headers.get("Origin"),
+            request.path,
+            request.remote_addr,
+            request.headers.get("User-Agent"),
+            exc.__class__.__name__,
+        )
+        response = {
+            'success': False,
+            'error': 'Servicio temporalmente no disponible',
+            'error_code': 'DB_UNAVAILABLE'
+        }
+        if self.debug:
+            response["error_detail"] = exc.__class__.__name__
+        return response, 503
+
+
+def _rate_limit_keys(request, command):
+    return {
+        "ip": request.headers.get("CF-Connecting-IP") or request.remote_addr,
+        "email": command["email"].casefold(),
+    }
+
+
+def _too_many_requests(retry_after):
+    if not retry_after:
+        return None
+    return {
+        'success': False,
+        'error': 'Límite de solicitudes alcanzado, reintentar más tarde',
+        'error_code': 'RATE_LIMITED',
+        'retry_after': retry_after
+    }, 429
+
+
+def _accepted(contact):
+    # 200: reenvío reconocido (se devuelve el ticket original); 202: aceptado para
+    # persistencia diferida (write-behind/spool); 201: ya persistido.
+    if contact.replayed:
+        status = 200
+    elif contact.deferred:
+        status = 202
+    else:
+        status = 201
+    return {'success': True, 'ticket_id': contact.ticket_id, 'contact': contact}, status
 
 
 def sanitize_and_validate_contact_payload(data):
     "Normaliza y valida los datos de contacto desde un payload JSON."
-    name = str(data.get('name', '')).strip()
-    email = str(data.get('email', '')).strip()
-    company = str(data.get('company', '')).strip()
-    message = str(data.get('message', '')).strip()
-    page_location = str(data.get('page_location', '')).strip()
-    traffic_source = str(data.get('traffic_source', '')).strip()
-
-    # Normalizar espacios
-    name = re.sub(r'\s+', ' ', name)
-    company = re.sub(r'\s+', ' ', company)
-
-    # Validaciones mÃ­nimas
-    if not name or not email:
-        return {
-            'success': False,
-            'error': 'Faltan campos requeridos',
-            'error_code': 'MISSING_FIELDS'
-        }, 400, None
-    if len(name) > 120 or len(company) > 160 or len(message) > 1200:
-        return {
-            'success': False,
-            'error': 'Longitud de campos excedida',
-            'error_code': 'FIELD_LENGTH_EXCEEDED'
-        }, 400, None
-
-    email_regex = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
-    if not re.match(email_regex, email):
-        return {
-            'success': False,
-            'error': 'El correo electrÃ³nico tiene un formato invÃ¡lido'
-        }, 400, None
-
-    # Limpiar message de HTML bÃ¡sico
-    message = re.sub(r'<[^>]+>', '', message)
-
-    normalized = {
-        "name": name,
-        "email": email,
-        "company": company,
-        "message": message,
-        "page_location": page_location,
-        "traffic_source": traffic_source,
-    }
-    return None, None, normalized
+    normalized, errors = validate_contact_payload(data)
+    if not errors:
+        return None, None, normalized
+
+    error_code = primary_error(errors)["error_code"]
+    status = 413 if error_code == 'PAYLOAD_TOO_LARGE' else 400
+    response = {'success': False, 'error': _ERROR_MESSAGES[error_code]}
+    # Compatibilidad: el email inválido nunca expuso error_code en la raíz.
+    if error_code != 'INVALID_EMAIL':
+        response['error_code'] = error_code
+    response['errors'] = errors
+    return response, status, None
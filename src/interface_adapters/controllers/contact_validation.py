@@ -0,0 +1,111 @@
+"""
+Path: src/interface_adapters/controllers/contact_validation.py
+"""
+
+import re
+from dataclasses import dataclass
+
+_WHITESPACE = re.compile(r"\s+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Prioridad de los códigos al elegir el error principal de la respuesta.
+ERROR_PRIORITY = (
+    "INVALID_TYPE", "MISSING_FIELDS", "FIELD_LENGTH_EXCEEDED", "FIELD_TOO_SHORT", "INVALID_EMAIL", "PAYLOAD_TOO_LARGE",
+)
+_ERROR_RANK = {code: rank for rank, code in enumerate(ERROR_PRIORITY)}
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    "Regla declarativa para un campo del payload."
+    name: str
+    required: bool = False
+    min_length: int = 0
+    max_length: int = None
+    collapse_whitespace: bool = False
+    strip_html: bool = False
+    pattern: re.Pattern = None
+    pattern_error: str = None
+
+
+CONTACT_FIELDS = (
+    FieldSpec("name", required=True, max_length=120, collapse_whitespace=True),
+    FieldSpec("email", required=True, max_length=255, pattern=_EMAIL, pattern_error="INVALID_EMAIL"),
+    FieldSpec("company", max_length=160, collapse_whitespace=True),
+    FieldSpec("message", required=True, max_length=1200, strip_html=True),
+    FieldSpec("page_location", max_length=512),
+    FieldSpec("traffic_source", max_length=128),
+)
+MAX_PAYLOAD_BYTES = 4 * 1024
+
+
+def compile_validator(specs, max_payload_bytes=None):
+    "Compila las reglas en una función que valida y normaliza el payload en una sola pasada."
+    plan = tuple(
+        (
+            spec.name,
+            spec.required,
+            spec.min_length,
+            spec.max_length,
+            _WHITESPACE.sub if spec.collapse_whitespace else None,
+            _HTML_TAG.sub if spec.strip_html else None,
+            spec.pattern.match if spec.pattern is not None else None,
+            spec.pattern_error,
+        )
+        for spec in specs
+    )
+
+    def validate(data):
+        "Retorna (normalized, errors); errors es una lista de {'field', 'error_code'}."
+        if not isinstance(data, dict):
+            data = {}
+        normalized = {}
+        errors = []
+        total_bytes = 0
+        for name, required, min_length, max_length, collapse, strip_html, match, pattern_error in plan:
+            value = data.get(name)
+            if value is None:
+                value = ""
+            elif isinstance(value, str):
+                value = value.strip()
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = str(value)
+            else:
+                errors.append({"field": name, "error_code": "INVALID_TYPE"})
+                continue
+            if collapse is not None:
+                value = collapse(" ", value)
+            if max_length is not None and len(value) > max_length:
+                errors.append({"field": name, "error_code": "FIELD_LENGTH_EXCEEDED"})
+                continue
+            if strip_html is not None:
+                value = strip_html("", value)
+            if not value:
+                if required:
+                    errors.append({"field": name, "error_code": "MISSING_FIELDS"})
+                normalized[name] = value
+                continue
+            if len(value) < min_length:
+                errors.append({"field": name, "error_code": "FIELD_TOO_SHORT"})
+                continue
+            if match is not None and match(value) is None:
+                errors.append({"field": name, "error_code": pattern_error})
+                continue
+            total_bytes += len(value.encode("utf-8")) if not value.isascii() else len(value)
+            normalized[name] = value
+        if max_payload_bytes is not None and total_bytes > max_payload_bytes:
+            errors.append({"field": None, "error_code": "PAYLOAD_TOO_LARGE"})
+        return normalized, errors
+
+    return validate
+
+
+validate_contact_payload = compile_validator(CONTACT_FIELDS, MAX_PAYLOAD_BYTES)
+
+
+def primary_error(errors):
+    "Elige el error más prioritario para el mensaje principal de la respuesta."
+    if len(errors) == 1:
+        return errors[0]
+    return min(errors, key=lambda error: _ERROR_RANK[error["error_code"]])
@@ -0,0 +1,65 @@
+"""
+Path: src/interface_adapters/controllers/pagination.py
+"""
+
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(after):
+    "Codifica el keyset (created_at, id) o (score, id) como un cursor opaco para el cliente."
+    if after is None:
+        return None
+    created_at, last_id = after
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    elif isinstance(created_at, (int, float)):
+        # Relevancia de una búsqueda: en hexadecimal es exacta, sin depender de cómo se imprima el float.
+        created_at = float(created_at).hex()
+    raw = json.dumps([created_at, last_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    "Decodifica un cursor opaco; lanza ValueError si es inválido."
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, last_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(last_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def decode_search_cursor(token):
+    "Decodifica un cursor de búsqueda (score, id); lanza ValueError si es inválido."
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        score, last_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float.fromhex(score), int(last_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def parse_page_params(args):
+    "Lee `limit` y `cursor` de los query params; lanza ValueError si son inválidos."
+    return _parse_limit(args), decode_cursor(args.get("cursor"))
+
+
+def parse_search_params(args):
+    "Lee `limit` y `cursor` (score, id) de una búsqueda; lanza ValueError si son inválidos."
+    return _parse_limit(args), decode_search_cursor(args.get("cursor"))
+
+
+def _parse_limit(args):
+    raw_limit = args.get("limit")
+    limit = None
+    if raw_limit not in (None, ""):
+        limit = int(raw_limit)
+        if limit < 1:
+            raise ValueError("Invalid limit")
+    return limit
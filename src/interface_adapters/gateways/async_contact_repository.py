@@ -0,0 +1,50 @@
+"""
+Path: src/interface_adapters/gateways/async_contact_repository.py
+"""
+
+from abc import ABC, abstractmethod
+
+from src.application.dtos.contact_row import ContactRow
+from src.entities.contact import Contact
+
+
+class AsyncContactRepository(ABC):
+    "Variante asíncrona de ContactRepository, para el entrypoint ASGI (alta, listado y health)."
+    def add_change_listener(self, listener) -> None:
+        "Registra un callback que se invoca después de cada alta de contactos."
+        if not hasattr(self, "_change_listeners"):
+            self._change_listeners = []
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in getattr(self, "_change_listeners", ()):
+            listener()
+
+    async def ping(self) -> None:
+        "Verifica que el almacenamiento responda; lanza DatabaseUnavailable si no."
+
+    async def warm(self, connections: int) -> None:
+        "Prepara el almacenamiento antes del primer request; por defecto equivale a ping()."
+        await self.ping()
+
+    async def close(self) -> None:
+        "Libera conexiones al apagar el proceso."
+
+    def pool_stats(self) -> dict | None:
+        "Métricas del pool de conexiones, si el backend usa uno."
+        return None
+
+    @abstractmethod
+    async def save(self, contact: Contact) -> Contact:
+        "Guarda un contacto y retorna el contacto guardado."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: tuple = None) -> tuple[list[ContactRow], tuple]:
+        "Devuelve hasta `limit` filas (forma ContactRow) posteriores al keyset `after` y el keyset siguiente (o None)."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    async def get_watermark(self) -> tuple[int, int]:
+        "Devuelve (max(id), cantidad) de contactos; cambia cuando cambia la tabla."
+        pass # pylint: disable=unnecessary-pass
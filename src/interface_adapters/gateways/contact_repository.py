@@ -3,16 +3,73 @@ Path: interface_adapters/gateways/contact_repository.py
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterator
+
+from src.application.dtos.contact_daily_stat import ContactDailyStat
+from src.application.dtos.contact_row import ContactRow
+from src.application.dtos.contact_search_query import ContactSearchQuery
 from src.entities.contact import Contact
 
 class ContactRepository(ABC):
     "Interfaz para operaciones de acceso a datos de contactos."
+    def add_change_listener(self, listener) -> None:
+        "Registra un callback que se invoca después de cada alta de contactos."
+        if not hasattr(self, "_change_listeners"):
+            self._change_listeners = []
+        self._change_listeners.append(listener)
+
+    def _notify_change(self) -> None:
+        for listener in getattr(self, "_change_listeners", ()):
+            listener()
+
+    def ping(self) -> None:
+        "Verifica que el almacenamiento responda; lanza DatabaseUnavailable si no."
+
+    def warm(self, connections: int) -> None:
+        "Prepara el almacenamiento antes del primer request; por defecto equivale a ping()."
+        self.ping()
+
+    def pool_stats(self) -> dict | None:
+        "Métricas del pool de conexiones, si el backend usa uno."
+        return None
+
     @abstractmethod
     def save(self, contact: Contact) -> Contact:
         "Guarda un contacto y retorna el contacto guardado (puede incluir ID generado, etc)."
         pass # pylint: disable=unnecessary-pass
 
     @abstractmethod
-    def get_all(self) -> list[Contact]:
-        "Devuelve una lista de todos los contactos."
-        pass # pylint: disable=unnecessary-pass
+    def save_many(self, contacts: list[Contact]) -> None:
+        "Guarda varios contactos en una sola operación."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def get_all(self) -> list[Contact]:
+        "Devuelve una lista de todos los contactos."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def get_page(self, limit: int, after: tuple = None) -> tuple[list[ContactRow], tuple]:
+        "Devuelve hasta `limit` filas (forma ContactRow) posteriores al keyset `after` y el keyset siguiente (o None)."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def search(self, query: ContactSearchQuery, limit: int, after: tuple = None) -> tuple[list[ContactRow], tuple]:
+        "Devuelve hasta `limit` filas que coinciden con `query`, por relevancia, y el keyset (score, id) siguiente (o None)."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[Contact]:
+        "Recorre todos los contactos sin cargarlos completos en memoria."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def get_watermark(self) -> tuple[int, int]:
+        "Devuelve (max(id), cantidad) de contactos; cambia cuando cambia la tabla."
+        pass # pylint: disable=unnecessary-pass
+
+    @abstractmethod
+    def get_daily_stats(self, start: date, end: date, site: str = None) -> list[ContactDailyStat]:
+        "Devuelve el rollup diario (day, site, traffic_source, contacts) entre `start` y `end` inclusive."
+        pass # pylint: disable=unnecessary-pass
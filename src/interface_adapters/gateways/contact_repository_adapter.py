@@ -4,6 +4,7 @@ Path: src/interface_adapters/gateways/contact_repository_adapter.py
 
 import pymysql
 
+from src.application.dtos.contact_daily_stat import ContactDailyStat
 from src.application.errors import ContactCreateFailed, ContactListFailed, DatabaseUnavailable
 from src.entities.contact import Contact
 from src.interface_adapters.gateways.contact_repository import ContactRepository
@@ -25,37 +26,90 @@ class ContactRepositoryAdapter(ContactRepository):
                 page_location=contact.page_location,
                 traffic_source=contact.traffic_source,
                 ip=contact.ip,
-                user_agent=contact.user_agent
+                user_agent=contact.user_agent,
+                created_at=contact.created_at,
             )
+            self._notify_change()
             return contact
         except (ConnectionError, TimeoutError, ValueError) as exc:
             raise ContactCreateFailed() from exc
-        except pymysql.Error as exc:
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as exc:
             raise DatabaseUnavailable() from exc
+        except pymysql.Error as exc:
+            # DataError/IntegrityError: el registro nunca va a entrar, reintentarlo no sirve.
+            raise ContactCreateFailed() from exc
         except RuntimeError as exc:
             if "cryptography" in str(exc).lower():
                 raise DatabaseUnavailable() from exc
             raise
 
+    def save_many(self, contacts):
+        "Guarda un lote de contactos con un único INSERT y commit."
+        try:
+            self.mysql_client.insert_contactos([
+                (
+                    contact.ticket_id,
+                    contact.name,
+                    contact.email,
+                    contact.company,
+                    contact.message,
+                    contact.page_location,
+                    contact.traffic_source,
+                    contact.ip,
+                    contact.user_agent,
+                    contact.created_at,
+                )
+                for contact in contacts
+            ])
+            self._notify_change()
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactCreateFailed() from exc
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError) as exc:
+            raise DatabaseUnavailable() from exc
+        except pymysql.Error as exc:
+            # DataError/IntegrityError: el registro nunca va a entrar, reintentarlo no sirve.
+            raise ContactCreateFailed() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+    def get_watermark(self):
+        "Devuelve (max(id), count) de contactos usando mysql_client."
+        try:
+            return self.mysql_client.get_contactos_watermark()
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactListFailed() from exc
+        except pymysql.Error as exc:
+            raise DatabaseUnavailable() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+    def ping(self):
+        "Verifica que el pool de mysql_client pueda entregar una conexión viva."
+        try:
+            self.mysql_client.ensure_connection()
+        except (ConnectionError, TimeoutError, ValueError, pymysql.Error) as exc:
+            raise DatabaseUnavailable() from exc
+
+    def warm(self, connections):
+        "Abre `connections` conexiones del pool de mysql_client antes del primer request."
+        try:
+            self.mysql_client.warm_pool(connections)
+        except (ConnectionError, TimeoutError, ValueError, pymysql.Error) as exc:
+            raise DatabaseUnavailable() from exc
+
+    def pool_stats(self):
+        "Expone las métricas del pool de conexiones del cliente MySQL."
+        return self.mysql_client.pool_stats()
+
     def get_all(self):
         "Devuelve una lista de todos los contactos usando mysql_client."
         try:
             rows = self.mysql_client.get_all_contactos()
-            contactos = []
-            for row in rows:
-                contactos.append(Contact(
-                    ticket_id=row.get("ticket_id"),
-                    name=row.get("name"),
-                    email=row.get("email"),
-                    company=row.get("company"),
-                    message=row.get("message"),
-                    page_location=row.get("page_location"),
-                    traffic_source=row.get("traffic_source"),
-                    ip=row.get("ip"),
-                    user_agent=row.get("user_agent"),
-                    created_at=row.get("created_at"),
-                ))
-            return contactos
+            return [_row_to_contact(row) for row in rows]
         except (ConnectionError, TimeoutError, ValueError) as exc:
             raise ContactListFailed() from exc
         except pymysql.Error as exc:
@@ -64,3 +118,84 @@ class ContactRepositoryAdapter(ContactRepository):
             if "cryptography" in str(exc).lower():
                 raise DatabaseUnavailable() from exc
             raise
+
+    def get_page(self, limit, after=None):
+        "Devuelve una página de contactos y el keyset (created_at, id) para pedir la siguiente."
+        try:
+            # Se pide una fila extra para saber si existe una página siguiente.
+            rows = self.mysql_client.get_contactos_page(limit + 1, after)
+            next_after = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                next_after = (last[-2], last[-1])
+            return rows, next_after
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactListFailed() from exc
+        except pymysql.Error as exc:
+            raise DatabaseUnavailable() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+    def search(self, query, limit, after=None):
+        "Busca contactos con mysql_client y devuelve las filas y el keyset (score, id) de la siguiente página."
+        try:
+            # Se pide una fila extra para saber si existe una página siguiente.
+            rows = self.mysql_client.search_contactos(query, limit + 1, after)
+            next_after = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_after = (float(rows[-1][-1]), rows[-1][-2])
+            return [row[:-1] for row in rows], next_after
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactListFailed() from exc
+        except pymysql.Error as exc:
+            raise DatabaseUnavailable() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+    def get_daily_stats(self, start, end, site=None):
+        "Devuelve el rollup diario de contactos usando mysql_client."
+        try:
+            return [ContactDailyStat(*row) for row in self.mysql_client.get_daily_stats(start, end, site)]
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactListFailed() from exc
+        except pymysql.Error as exc:
+            raise DatabaseUnavailable() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+    def iter_all(self):
+        "Recorre todos los contactos en streaming desde mysql_client."
+        try:
+            for row in self.mysql_client.iter_contactos():
+                yield _row_to_contact(row)
+        except (ConnectionError, TimeoutError, ValueError) as exc:
+            raise ContactListFailed() from exc
+        except pymysql.Error as exc:
+            raise DatabaseUnavailable() from exc
+        except RuntimeError as exc:
+            if "cryptography" in str(exc).lower():
+                raise DatabaseUnavailable() from exc
+            raise
+
+
+def _row_to_contact(row):
+    return Contact(
+        ticket_id=row.get("ticket_id"),
+        name=row.get("name"),
+        email=row.get("email"),
+        company=row.get("company"),
+        message=row.get("message"),
+        page_location=row.get("page_location"),
+        traffic_source=row.get("traffic_source"),
+        ip=row.get("ip"),
+        user_agent=row.get("user_agent"),
+        created_at=row.get("created_at"),
+    )
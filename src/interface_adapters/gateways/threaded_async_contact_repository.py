@@ -0,0 +1,49 @@
+"""
+Path: src/interface_adapters/gateways/threaded_async_contact_repository.py
+"""
+
+import asyncio
+
+from src.interface_adapters.gateways.async_contact_repository import AsyncContactRepository
+
+
+class ThreadedAsyncContactRepository(AsyncContactRepository):
+    "Expone un ContactRepository síncrono como AsyncContactRepository (SQLite, memoria)."
+    def __init__(self, repository, offload=True):
+        self.repository = repository
+        # Con offload las llamadas corren en el thread pool del loop; sin él (repositorio en
+        # memoria) se ejecutan en línea porque no bloquean.
+        self.offload = offload
+
+    def add_change_listener(self, listener):
+        "Registra el listener en el repositorio envuelto, que es quien notifica las altas."
+        self.repository.add_change_listener(listener)
+
+    async def ping(self):
+        "Delegado a ContactRepository.ping."
+        await self._call(self.repository.ping)
+
+    async def warm(self, connections):
+        "Delegado a ContactRepository.warm."
+        await self._call(self.repository.warm, connections)
+
+    def pool_stats(self):
+        "Delegado a ContactRepository.pool_stats."
+        return self.repository.pool_stats()
+
+    async def save(self, contact):
+        "Delegado a ContactRepository.save."
+        return await self._call(self.repository.save, contact)
+
+    async def get_page(self, limit, after=None):
+        "Delegado a ContactRepository.get_page."
+        return await self._call(self.repository.get_page, limit, after)
+
+    async def get_watermark(self):
+        "Delegado a ContactRepository.get_watermark."
+        return await self._call(self.repository.get_watermark)
+
+    async def _call(self, method, *args):
+        if self.offload:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
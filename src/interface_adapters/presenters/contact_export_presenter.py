@@ -0,0 +1,65 @@
+"""
+Path: interface_adapters/presenters/contact_export_presenter.py
+"""
+
+import csv
+import json
+from datetime import datetime, timezone
+
+EXPORT_FIELDS = (
+    "ticket_id",
+    "name",
+    "email",
+    "company",
+    "message",
+    "page_location",
+    "traffic_source",
+    "ip",
+    "user_agent",
+    "created_at",
+)
+
+
+class _LineBuffer:
+    "Buffer mínimo para que csv.writer devuelva cada línea en lugar de escribirla."
+    def write(self, value):
+        return value
+
+
+class ContactExportPresenter:
+    "Serializa contactos línea por línea para respuestas en streaming."
+    @staticmethod
+    def to_ndjson_lines(contacts):
+        "Genera una línea JSON por contacto."
+        for contact in contacts:
+            yield json.dumps(_export_values(contact), ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def to_csv_lines(contacts):
+        "Genera el encabezado CSV y una fila por contacto."
+        writer = csv.writer(_LineBuffer())
+        yield writer.writerow(EXPORT_FIELDS)
+        for contact in contacts:
+            values = _export_values(contact)
+            yield writer.writerow([values[field] for field in EXPORT_FIELDS])
+
+
+def _export_values(contact):
+    created_at = contact.created_at
+    if isinstance(created_at, datetime):
+        # Naive = UTC (DATETIME de MySQL): mismo `+00:00` que /v1/contact/list (OPT_NAIVE_UTC).
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        created_at = created_at.isoformat()
+    return {
+        "ticket_id": contact.ticket_id,
+        "name": contact.name,
+        "email": contact.email,
+        "company": contact.company,
+        "message": contact.message,
+        "page_location": contact.page_location,
+        "traffic_source": contact.traffic_source,
+        "ip": contact.ip,
+        "user_agent": contact.user_agent,
+        "created_at": created_at,
+    }
@@ -2,6 +2,12 @@
 Path: interface_adapters/presenters/contact_presenter.py
 """
 
+from src.application.dtos.contact_row import CONTACT_ROW_FIELDS
+
+# Campos públicos del listado: todos los de ContactRow salvo el `id` interno (último).
+LIST_FIELDS = CONTACT_ROW_FIELDS[:-1]
+
+
 class ContactPresenter:
     "Convierte la entidad Contact a un formato serializable para la respuesta HTTP."
     @staticmethod
@@ -19,6 +25,30 @@ class ContactPresenter:
             "user_agent": contact.user_agent,
         }
 
+    @staticmethod
+    def rows_to_response(rows):
+        "Proyecta filas ContactRow directamente a los dicts de salida (zip descarta el `id`)."
+        fields = LIST_FIELDS
+        return [dict(zip(fields, row)) for row in rows]
+
+    @staticmethod
+    def stats_to_response(stats):
+        "Convierte un ContactStatsDTO en el cuerpo de /v1/contact/stats."
+        return {
+            "from": stats.start.isoformat(),
+            "to": stats.end.isoformat(),
+            "stats": [
+                {
+                    "day": row.day.isoformat(),
+                    "site": row.site,
+                    "traffic_source": row.traffic_source,
+                    "contacts": row.contacts,
+                }
+                for row in stats.rows
+            ],
+            "totals": stats.totals,
+        }
+
     @staticmethod
     def to_response_with_created_at(contact):
         "Convierte una instancia de Contact incluyendo created_at."
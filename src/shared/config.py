@@ -1,15 +1,168 @@
-"""
-Path: src/shared/config.py
-"""
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-load_dotenv(".env.remote", override=False)
-load_dotenv(".env.local", override=True)
-
-MYSQL_HOST = os.getenv("MYSQL_HOST")
-MYSQL_USER = os.getenv("MYSQL_USER")
-MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
-MYSQL_DB = os.getenv("MYSQL_DATABASE") or os.getenv("MYSQL_DB")
+"""
+Path: src/shared/config.py
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+
+CONTACT_REPOSITORIES = ("mysql", "sqlite", "memory")
+
+_env_loaded = False
+
+
+def _find_env_file(name, start):
+    "Busca `name` desde `start` hacia arriba (como find_dotenv desde este módulo)."
+    directory = os.path.abspath(start)
+    while True:
+        candidate = os.path.join(directory, name)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def load_env():
+    "Carga .env, .env.remote y .env.local una sola vez por proceso; .env.local tiene prioridad."
+    global _env_loaded  # pylint: disable=global-statement
+    if _env_loaded:
+        return
+    _env_loaded = True
+    base = _find_env_file(".env", os.path.dirname(__file__))
+    remote = ".env.remote" if os.path.isfile(".env.remote") else None
+    local = ".env.local" if os.path.isfile(".env.local") else None
+    if not (base or remote or local):
+        # Sin archivos (p. ej. Railway) no se paga el import de python-dotenv.
+        return
+    from dotenv import dotenv_values  # pylint: disable=import-outside-toplevel
+
+    # Misma precedencia que los tres load_dotenv previos: el entorno gana sobre .env y
+    # .env.remote, .env sobre .env.remote, y .env.local sobre todo.
+    defaults = {}
+    for path in (remote, base):
+        if path:
+            defaults.update(dotenv_values(path))
+    for key, value in defaults.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+    if local:
+        for key, value in dotenv_values(local).items():
+            if value is not None:
+                os.environ[key] = value
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    "Configuración de la app, leída una sola vez del entorno al crearla."
+    origin_verify_secret: str = ""
+    development: bool = False
+    log_sample_rate: float = 1.0
+    json_encoder: str = "orjson"
+    auto_create_db: bool = False
+    metrics_dir: str | None = None
+    contact_repository: str = "mysql"
+    mysql_pool_warm: int = 1
+    contact_sqlite_path: str = os.path.join(tempfile.gettempdir(), "profebustos-contacts.sqlite3")
+    contact_spool_dir: str | None = None
+    contact_spool_segment_bytes: int = 4 * 1024 * 1024
+    contact_spool_replay_interval: float = 5.0
+    write_behind: bool = False
+    contact_queue_max_size: int = 1000
+    contact_batch_size: int = 50
+    contact_flush_interval: float = 0.2
+    duplicate_window_seconds: int = 600
+    duplicate_cache_size: int = 10000
+    notify_email_to: str = ""
+    notify_email_from: str = "no-reply@profebustos.com.ar"
+    smtp_host: str = ""
+    smtp_port: int = 587
+    smtp_username: str = ""
+    smtp_password: str = ""
+    smtp_starttls: bool = True
+    notify_workers: int = 2
+    notify_queue_max_size: int = 1000
+    notify_digest_threshold: int = 5
+    notify_batch_window: float = 1.0
+    contact_outbox: bool = False
+    outbox_batch_size: int = 50
+    outbox_concurrency: int = 4
+    outbox_poll_interval: float = 1.0
+    outbox_max_attempts: int = 5
+    contact_stats_inline: bool = False
+    # Opt-in: con 5/hour por IP, una oficina detrás de un NAT se queda sin formulario.
+    rate_limit_enabled: bool = False
+    rate_limit_ip: str = "5/hour"
+    rate_limit_email: str = "5/hour"
+    rate_limit_db: str = os.path.join(tempfile.gettempdir(), "profebustos-ratelimit.sqlite3")
+    profiling_enabled: bool = False
+    profile_secret: str = ""
+    profile_dir: str = os.path.join(tempfile.gettempdir(), "profebustos-profiles")
+    profile_max_files: int = 20
+    profile_sample_interval: float = 0.001
+
+    @classmethod
+    def from_env(cls, environ=None):
+        "Construye la configuración desde `environ` (por defecto os.environ, tras cargar los .env)."
+        if environ is None:
+            load_env()
+            environ = os.environ
+        defaults = cls()
+
+        def get(name, default):
+            return environ.get(name) or default
+
+        contact_repository = get("CONTACT_REPOSITORY", defaults.contact_repository).lower()
+        if contact_repository not in CONTACT_REPOSITORIES:
+            raise ValueError(
+                f"Invalid CONTACT_REPOSITORY: {contact_repository!r} (expected mysql, sqlite or memory)"
+            )
+        return cls(
+            origin_verify_secret=environ.get("ORIGIN_VERIFY_SECRET", ""),
+            development=environ.get("FLASK_ENV") == "development",
+            log_sample_rate=float(get("LOG_SAMPLE_RATE", defaults.log_sample_rate)),
+            json_encoder=get("JSON_ENCODER", defaults.json_encoder),
+            auto_create_db=environ.get("AUTO_CREATE_DB") == "true",
+            metrics_dir=environ.get("METRICS_DIR") or None,
+            contact_repository=contact_repository,
+            mysql_pool_warm=int(get("MYSQL_POOL_WARM", defaults.mysql_pool_warm)),
+            contact_sqlite_path=get("CONTACT_SQLITE_PATH", defaults.contact_sqlite_path),
+            contact_spool_dir=environ.get("CONTACT_SPOOL_DIR") or None,
+            contact_spool_segment_bytes=int(get("CONTACT_SPOOL_SEGMENT_BYTES", defaults.contact_spool_segment_bytes)),
+            contact_spool_replay_interval=float(
+                get("CONTACT_SPOOL_REPLAY_INTERVAL", defaults.contact_spool_replay_interval)
+            ),
+            write_behind=environ.get("CONTACT_WRITE_MODE") == "write_behind",
+            contact_queue_max_size=int(get("CONTACT_QUEUE_MAX_SIZE", defaults.contact_queue_max_size)),
+            contact_batch_size=int(get("CONTACT_BATCH_SIZE", defaults.contact_batch_size)),
+            contact_flush_interval=int(get("CONTACT_FLUSH_INTERVAL_MS", "200")) / 1000,
+            duplicate_window_seconds=int(get("DUPLICATE_WINDOW_SECONDS", defaults.duplicate_window_seconds)),
+            duplicate_cache_size=int(get("DUPLICATE_CACHE_SIZE", defaults.duplicate_cache_size)),
+            notify_email_to=environ.get("CONTACT_NOTIFY_TO", ""),
+            notify_email_from=get("CONTACT_NOTIFY_FROM", defaults.notify_email_from),
+            smtp_host=environ.get("SMTP_HOST", ""),
+            smtp_port=int(get("SMTP_PORT", defaults.smtp_port)),
+            smtp_username=environ.get("SMTP_USERNAME", ""),
+            smtp_password=environ.get("SMTP_PASSWORD", ""),
+            smtp_starttls=environ.get("SMTP_STARTTLS", "true") == "true",
+            notify_workers=int(get("NOTIFY_WORKERS", defaults.notify_workers)),
+            notify_queue_max_size=int(get("NOTIFY_QUEUE_MAX_SIZE", defaults.notify_queue_max_size)),
+            notify_digest_threshold=int(get("NOTIFY_DIGEST_THRESHOLD", defaults.notify_digest_threshold)),
+            notify_batch_window=int(get("NOTIFY_BATCH_WINDOW_MS", "1000")) / 1000,
+            contact_outbox=environ.get("CONTACT_OUTBOX") == "true",
+            outbox_batch_size=int(get("OUTBOX_BATCH_SIZE", defaults.outbox_batch_size)),
+            outbox_concurrency=int(get("OUTBOX_CONCURRENCY", defaults.outbox_concurrency)),
+            outbox_poll_interval=int(get("OUTBOX_POLL_INTERVAL_MS", "1000")) / 1000,
+            outbox_max_attempts=int(get("OUTBOX_MAX_ATTEMPTS", defaults.outbox_max_attempts)),
+            contact_stats_inline=environ.get("CONTACT_STATS_INLINE") == "true",
+            rate_limit_enabled=environ.get("RATE_LIMIT_ENABLED") == "true",
+            rate_limit_ip=get("RATE_LIMIT_IP", defaults.rate_limit_ip),
+            rate_limit_email=get("RATE_LIMIT_EMAIL", defaults.rate_limit_email),
+            rate_limit_db=get("RATE_LIMIT_DB", defaults.rate_limit_db),
+            profiling_enabled=environ.get("PROFILING_ENABLED") == "true",
+            profile_secret=environ.get("PROFILE_SECRET", ""),
+            profile_dir=get("PROFILE_DIR", defaults.profile_dir),
+            profile_max_files=int(get("PROFILE_MAX_FILES", defaults.profile_max_files)),
+            profile_sample_interval=float(get("PROFILE_SAMPLE_INTERVAL_MS", "1")) / 1000,
+        )
@@ -2,8 +2,15 @@
 Path: src/shared/logger_flask_v0.py
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 class FlaskStyleFormatter(logging.Formatter):
     "Formateador de logs con estilo Flask."
@@ -24,12 +31,31 @@ class FlaskStyleFormatter(logging.Formatter):
 
     def format(self, record):
         msg = super().format(record)
+        ctx = getattr(record, "ctx", None)
+        if ctx:
+            msg = msg + " " + " ".join(f"{key}={value}" for key, value in ctx.items())
         if self.use_color and record.levelname in self.COLORS:
             color = self.COLORS[record.levelname]
             reset = self.COLORS['RESET']
             msg = f"{color}{msg}{reset}"
         return msg
 
+class JSONLineFormatter(logging.Formatter):
+    "Formateador de una línea JSON por registro; los campos de `ctx` van al primer nivel."
+    def format(self, record):
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        ctx = getattr(record, "ctx", None)
+        if ctx:
+            entry.update(ctx)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
 def supports_color():
     "Determina si el terminal soporta colores."
     # Windows terminal supports ANSI since Win10, but check for compatibility
@@ -42,13 +68,75 @@ def supports_color():
     except ImportError:
         return False
 
+class _EnqueueOnlyHandler(QueueHandler):
+    "QueueHandler que no formatea en el hilo del request: solo resuelve el mensaje y encola."
+    def prepare(self, record):
+        # Se fija el texto ahora (los args podrían mutar); fecha, JSON y traceback se
+        # formatean en el hilo del listener.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+def _build_output_handler():
+    handler = logging.StreamHandler()
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        handler.setFormatter(JSONLineFormatter())
+    else:
+        handler.setFormatter(FlaskStyleFormatter(use_color=supports_color()))
+    return handler
+
+def _start_listener():
+    global _listener  # pylint: disable=global-statement
+    _listener = QueueListener(_queue_handler.queue, _build_output_handler(), respect_handler_level=True)
+    _listener.start()
+
+def _stop_listener():
+    "Vuelca los registros pendientes y detiene el hilo del listener."
+    global _listener  # pylint: disable=global-statement
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+def _restart_listener_after_fork():
+    # El hilo del listener no sobrevive a fork() (p. ej. gunicorn --preload): el hijo
+    # arranca una cola y un listener propios.
+    global _lock, _listener  # pylint: disable=global-statement
+    _lock = threading.Lock()
+    _listener = None
+    if _queue_handler is not None:
+        _queue_handler.queue = queue.SimpleQueue()
+        _start_listener()
+
+def _get_queue_handler():
+    "Crea (una vez por proceso) el handler compartido y su QueueListener en segundo plano."
+    global _queue_handler  # pylint: disable=global-statement
+    with _lock:
+        if _queue_handler is None:
+            _queue_handler = _EnqueueOnlyHandler(queue.SimpleQueue())
+            _start_listener()
+            atexit.register(_stop_listener)
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=_restart_listener_after_fork)
+        return _queue_handler
+
+def log_level():
+    "Nivel de log desde LOG_LEVEL (por defecto INFO)."
+    level = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    return level if isinstance(level, int) else logging.INFO
+
 def get_logger(name="profebustos"):
     "Obtiene un logger configurado para la aplicación con estilo Flask."
     logger = logging.getLogger(name)
-    if not logger.hasHandlers():
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = FlaskStyleFormatter(use_color=supports_color())
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    handler = _get_queue_handler()
+    # Un único handler en el logger de primer nivel ("profebustos", "flask_app", ...):
+    # los hijos propagan hacia él, sin handlers duplicados.
+    top = logging.getLogger(name.split(".", 1)[0])
+    if handler not in top.handlers:
+        top.setLevel(log_level())
+        top.addHandler(handler)
     return logger
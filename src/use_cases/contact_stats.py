@@ -0,0 +1,38 @@
+"""
+Path: src/use_cases/contact_stats.py
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from src.application.dtos.contact_stats_dto import ContactStatsDTO
+from src.application.ports.clock import Clock
+
+DEFAULT_DAYS = 30
+MAX_DAYS = 366
+
+
+class ContactStatsUseCase:
+    "Contactos por día, sitio y fuente de tráfico, leídos del rollup diario (no de contactos)."
+    def __init__(self, contact_repository, clock: Clock, max_days=MAX_DAYS):
+        self.contact_repository = contact_repository
+        # Debe ser el reloj con el que se fija created_at: el rollup agrupa por su fecha.
+        self.clock = clock
+        self.max_days = max_days
+
+    def execute(self, start=None, end=None, site=None):
+        "Devuelve el rollup entre `start` y `end` (por defecto los últimos 30 días); ValueError si el rango es inválido."
+        end = end or self.clock.now().date()
+        start = start or end - timedelta(days=DEFAULT_DAYS - 1)
+        if start > end or (end - start).days >= self.max_days:
+            raise ValueError("Invalid date range")
+        rows = self.contact_repository.get_daily_stats(start, end, site)
+        totals = Counter()
+        for row in rows:
+            totals[row.traffic_source] += row.contacts
+        return ContactStatsDTO(
+            start=start,
+            end=end,
+            rows=rows,
+            totals=dict(totals.most_common()),
+        )
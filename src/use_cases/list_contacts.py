@@ -2,29 +2,108 @@
 Path: src/use_cases/list_contacts.py
 """
 
+import re
+
 from src.application.dtos.contact_dto import ContactDTO
+from src.application.dtos.contact_page_dto import ContactPageDTO
+from src.application.dtos.contact_search_query import ContactSearchQuery
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# ft_min_token_size de InnoDB: las palabras más cortas no están en el índice FULLTEXT y no matchean nunca.
+MIN_QUERY_LENGTH = 3
+MAX_QUERY_LENGTH = 100
+MAX_SEARCH_TERMS = 8
+_WORD = re.compile(r"\w+")
 
 
 class ListContactsUseCase:
     "Caso de uso para listar contactos."
-    def __init__(self, contact_repository):
+    def __init__(self, contact_repository, max_page_size=MAX_PAGE_SIZE):
         self.contact_repository = contact_repository
+        self.max_page_size = max_page_size
 
     def execute(self):
         "Obtiene todos los contactos del repositorio."
         contactos = self.contact_repository.get_all()
-        response = []
-        for contact in contactos:
-            response.append(ContactDTO(
-                ticket_id=contact.ticket_id,
-                name=contact.name,
-                email=contact.email,
-                company=contact.company,
-                message=contact.message,
-                page_location=contact.page_location,
-                traffic_source=contact.traffic_source,
-                ip=contact.ip,
-                user_agent=contact.user_agent,
-                created_at=getattr(contact, "created_at", None),
-            ))
-        return response
+        return [_to_dto(contact) for contact in contactos]
+
+    def execute_page(self, limit=None, after=None):
+        "Obtiene una página de filas ContactRow, acotando el tamaño al máximo permitido."
+        limit = self._clamp_limit(limit)
+        rows, next_after = self.contact_repository.get_page(limit, after)
+        # Read-model: las filas pasan tal cual al presenter, sin entidades ni DTOs intermedios.
+        return ContactPageDTO(
+            items=rows,
+            limit=limit,
+            next_after=next_after,
+        )
+
+    def search(self, text, limit=None, after=None):
+        "Busca contactos por texto o prefijo de email, por relevancia, con keyset (score, id)."
+        query = parse_search_query(text)
+        limit = self._clamp_limit(limit)
+        rows, next_after = self.contact_repository.search(query, limit, after)
+        return ContactPageDTO(
+            items=rows,
+            limit=limit,
+            next_after=next_after,
+        )
+
+    def watermark(self):
+        "Devuelve la marca (max(id), cantidad) que identifica el estado actual de los contactos."
+        return self.contact_repository.get_watermark()
+
+    def iter_all(self):
+        "Recorre todos los contactos como DTOs sin materializar la lista completa."
+        for contact in self.contact_repository.iter_all():
+            yield _to_dto(contact)
+
+    def _clamp_limit(self, limit):
+        return min(max(int(limit or DEFAULT_PAGE_SIZE), 1), self.max_page_size)
+
+
+class AsyncListContactsUseCase(ListContactsUseCase):
+    "Variante asíncrona (entrypoint ASGI) sobre un AsyncContactRepository: solo página y watermark."
+    async def execute_page(self, limit=None, after=None):  # pylint: disable=invalid-overridden-method
+        "Obtiene una página de filas ContactRow, acotando el tamaño al máximo permitido."
+        limit = self._clamp_limit(limit)
+        rows, next_after = await self.contact_repository.get_page(limit, after)
+        return ContactPageDTO(
+            items=rows,
+            limit=limit,
+            next_after=next_after,
+        )
+
+    async def watermark(self):  # pylint: disable=invalid-overridden-method
+        "Devuelve la marca (max(id), cantidad) que identifica el estado actual de los contactos."
+        return await self.contact_repository.get_watermark()
+
+
+def parse_search_query(text):
+    "Normaliza la consulta de búsqueda; lanza ValueError si es vacía, demasiado larga o sin palabras."
+    text = (text or "").strip()
+    if not MIN_QUERY_LENGTH <= len(text) <= MAX_QUERY_LENGTH:
+        raise ValueError("Invalid search query")
+    lowered = text.lower()
+    if "@" in lowered and not any(char.isspace() for char in lowered):
+        return ContactSearchQuery(email_prefix=lowered)
+    terms = tuple(dict.fromkeys(word for word in _WORD.findall(lowered) if len(word) >= MIN_QUERY_LENGTH))
+    if not terms:
+        raise ValueError("Invalid search query")
+    return ContactSearchQuery(terms=terms[:MAX_SEARCH_TERMS])
+
+
+def _to_dto(contact):
+    return ContactDTO(
+        ticket_id=contact.ticket_id,
+        name=contact.name,
+        email=contact.email,
+        company=contact.company,
+        message=contact.message,
+        page_location=contact.page_location,
+        traffic_source=contact.traffic_source,
+        ip=contact.ip,
+        user_agent=contact.user_agent,
+        created_at=getattr(contact, "created_at", None),
+    )
@@ -2,21 +2,94 @@
 Path: src/use_cases/register_contact.py
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import re
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
 from src.application.dtos.contact_dto import ContactDTO
+from src.application.errors import ContactQueueFull, DatabaseUnavailable, IdempotencyKeyReused
 from src.entities.contact import Contact
 from src.application.ports.id_generator import IdGenerator
+from src.application.ports.contact_notifier import ContactNotifier
+from src.application.ports.contact_queue import ContactQueue
+from src.application.ports.submission_cache import SubmissionCache
+
+_WHITESPACE = re.compile(r"\s+")
+IDEMPOTENCY_PREFIX = "idem:"
 
 class RegisterContactUseCase:
     "Caso de uso para registrar un contacto."
-    def __init__(self, contact_repository, id_generator: IdGenerator):
+    _lock_factory = staticmethod(threading.Lock)
+
+    def __init__(
+        self,
+        contact_repository,
+        id_generator: IdGenerator,
+        contact_queue: ContactQueue = None,
+        fallback_queue: ContactQueue = None,
+        submission_cache: SubmissionCache = None,
+        notifier: ContactNotifier = None,
+    ):
         self.contact_repository = contact_repository
         self.id_generator = id_generator
+        self.contact_queue = contact_queue
+        self.fallback_queue = fallback_queue
+        self.submission_cache = submission_cache
+        self.notifier = notifier
+        self._pending = _KeyedLocks(self._lock_factory)
+
+    def execute(
+        self, name, email, company, message, page_location, traffic_source, ip, user_agent,
+        idempotency_key=None,
+    ):
+        "Registra un nuevo contacto; los reenvíos recientes devuelven el registro original."
+        keys = self._submission_keys(name, email, message, idempotency_key)
+        # Las claves quedan reservadas hasta recordar el resultado: un envío idéntico
+        # concurrente espera y recibe el registro original en vez de insertar otro.
+        with self._pending.hold(keys):
+            previous = self._find_previous(keys)
+            if previous is not None:
+                return previous
+            contact = self._new_contact(
+                name, email, company, message, page_location, traffic_source, ip, user_agent
+            )
+            result = self._enqueue(contact)
+            if result is None:
+                result = self._save(contact)
+            self._remember(keys, result)
+        return self._notify(result)
+
+    def find_replay(self, name, email, message, idempotency_key=None):
+        "Registro original si el envío es un reenvío reciente; no reserva claves ni inserta."
+        return self._find_previous(self._submission_keys(name, email, message, idempotency_key))
+
+    def _save(self, contact):
+        try:
+            saved_contact = self.contact_repository.save(contact)
+        except DatabaseUnavailable:
+            if self.fallback_queue is None:
+                raise
+            return self._spool(contact)
+        return _to_dto(saved_contact)
+
+    def _submission_keys(self, name, email, message, idempotency_key):
+        if self.submission_cache is None:
+            return ()
+        return submission_keys(name, email, message, idempotency_key)
+
+    def _enqueue(self, contact):
+        "Modo write-behind: el contacto se persiste en lote desde un worker en segundo plano."
+        if self.contact_queue is None:
+            return None
+        self.contact_queue.submit(contact)
+        return _to_dto(contact, deferred=True)
 
-    def execute(self, name, email, company, message, page_location, traffic_source, ip, user_agent):
-        "Registra un nuevo contacto y lo guarda en el repositorio."
-        ticket_id = self.id_generator.new_id()
-        contact = Contact(
-            ticket_id=ticket_id,
+    def _new_contact(self, name, email, company, message, page_location, traffic_source, ip, user_agent):
+        return Contact(
+            ticket_id=self.id_generator.new_id(),
             name=name,
             email=email,
             company=company,
@@ -26,16 +99,159 @@ class RegisterContactUseCase:
             ip=ip,
             user_agent=user_agent
         )
-        saved_contact = self.contact_repository.save(contact)
-        return ContactDTO(
-            ticket_id=saved_contact.ticket_id,
-            name=saved_contact.name,
-            email=saved_contact.email,
-            company=saved_contact.company,
-            message=saved_contact.message,
-            page_location=saved_contact.page_location,
-            traffic_source=saved_contact.traffic_source,
-            ip=saved_contact.ip,
-            user_agent=saved_contact.user_agent,
-            created_at=getattr(saved_contact, "created_at", None),
-        )
+
+    def _spool(self, contact):
+        "Sin DB, el contacto queda en el spool local y se persiste cuando vuelva."
+        try:
+            self.fallback_queue.submit(contact)
+        except ContactQueueFull:
+            raise DatabaseUnavailable() from None
+        return _to_dto(contact, deferred=True)
+
+    def _find_previous(self, keys):
+        for key in keys:
+            previous = self.submission_cache.get(key)
+            if previous is not None:
+                # La misma Idempotency-Key con otro contenido no es un reintento: no se devuelve el ticket ajeno.
+                if key.startswith(IDEMPOTENCY_PREFIX) and _content_key_of(previous) != keys[-1]:
+                    raise IdempotencyKeyReused()
+                return dataclasses.replace(previous, replayed=True)
+        return None
+
+    def _remember(self, keys, result):
+        for key in keys:
+            self.submission_cache.put(key, result)
+
+    def _notify(self, result):
+        # Solo se encola: el envío (SMTP) corre fuera del request. Los reenvíos no notifican.
+        if self.notifier is not None:
+            self.notifier.notify(result)
+        return result
+
+
+class AsyncRegisterContactUseCase(RegisterContactUseCase):
+    "Variante asíncrona (entrypoint ASGI): persiste con un AsyncContactRepository."
+    _lock_factory = staticmethod(asyncio.Lock)
+
+    async def execute(  # pylint: disable=invalid-overridden-method
+        self, name, email, company, message, page_location, traffic_source, ip, user_agent,
+        idempotency_key=None,
+    ):
+        "Registra un nuevo contacto; los reenvíos recientes devuelven el registro original."
+        keys = self._submission_keys(name, email, message, idempotency_key)
+        async with self._pending.hold_async(keys):
+            previous = self._find_previous(keys)
+            if previous is not None:
+                return previous
+            contact = self._new_contact(
+                name, email, company, message, page_location, traffic_source, ip, user_agent
+            )
+            result = self._enqueue(contact)
+            if result is None:
+                result = await self._save_async(contact)
+            self._remember(keys, result)
+        return self._notify(result)
+
+    async def _save_async(self, contact):
+        try:
+            saved_contact = await self.contact_repository.save(contact)
+        except DatabaseUnavailable:
+            if self.fallback_queue is None:
+                raise
+            # El spool hace fsync por contacto: fuera del event loop.
+            return await asyncio.to_thread(self._spool, contact)
+        return _to_dto(saved_contact)
+
+
+class _KeyedLocks:
+    "Locks por clave de deduplicación, creados a demanda y descartados cuando nadie los espera."
+    def __init__(self, lock_factory):
+        self._lock_factory = lock_factory
+        self._guard = threading.Lock()
+        self._locks = {}
+
+    @contextmanager
+    def hold(self, keys):
+        "Toma los locks de todas las claves (en orden, para no cruzarse) mientras dura el bloque."
+        locks = self._checkout(keys)
+        acquired = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            self._checkin(keys)
+
+    @asynccontextmanager
+    async def hold_async(self, keys):
+        "Igual que hold, con locks de asyncio."
+        locks = self._checkout(keys)
+        acquired = []
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            self._checkin(keys)
+
+    def _checkout(self, keys):
+        with self._guard:
+            locks = []
+            for key in sorted(set(keys)):
+                entry = self._locks.setdefault(key, [self._lock_factory(), 0])
+                entry[1] += 1
+                locks.append(entry[0])
+            return locks
+
+    def _checkin(self, keys):
+        with self._guard:
+            for key in set(keys):
+                entry = self._locks[key]
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._locks[key]
+
+
+def submission_keys(name, email, message, idempotency_key=None):
+    "Claves de deduplicación de un envío: Idempotency-Key (si vino) y, al final, huella del contenido."
+    keys = [content_key(name, email, message)]
+    if idempotency_key:
+        keys.insert(0, IDEMPOTENCY_PREFIX + idempotency_key)
+    return keys
+
+
+def content_key(name, email, message):
+    "Huella de (email, name, message) normalizados para detectar envíos repetidos."
+    normalized = "\x1f".join((
+        email.strip().casefold(),
+        _WHITESPACE.sub(" ", name).strip().casefold(),
+        _WHITESPACE.sub(" ", message).strip(),
+    ))
+    return "content:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _content_key_of(previous):
+    "Huella del contenido de un registro ya recordado (el DTO guarda name, email y message originales)."
+    return content_key(previous.name, previous.email, previous.message)
+
+
+def _to_dto(contact, deferred=False):
+    return ContactDTO(
+        ticket_id=contact.ticket_id,
+        name=contact.name,
+        email=contact.email,
+        company=contact.company,
+        message=contact.message,
+        page_location=contact.page_location,
+        traffic_source=contact.traffic_source,
+        ip=contact.ip,
+        user_agent=contact.user_agent,
+        created_at=getattr(contact, "created_at", None),
+        deferred=deferred,
+    )
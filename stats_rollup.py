@@ -0,0 +1,22 @@
+"""
+Path: stats_rollup.py
+"""
+
+import argparse
+import time
+
+from src.infrastructure.pymysql.contact_stats_rollup import ContactStatsRollup
+from src.infrastructure.pymysql.mysql_client import MySQLClient
+from src.shared.config import load_env
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consolida contact_daily_stats desde el último id procesado.")
+    parser.add_argument("--interval", type=float, help="repite cada N segundos en lugar de correr una vez")
+    arguments = parser.parse_args()
+    load_env()
+    rollup = ContactStatsRollup(MySQLClient().connect)
+    while True:
+        rollup.run()
+        if not arguments.interval:
+            break
+        time.sleep(arguments.interval)
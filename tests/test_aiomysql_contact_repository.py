@@ -0,0 +1,279 @@
+import asyncio
+from datetime import datetime
+
+import pymysql
+import pytest
+
+from src.application.errors import ContactCreateFailed, ContactListFailed, DatabaseUnavailable
+from src.entities.contact import Contact
+from src.infrastructure.aiomysql import aiomysql_contact_repository
+from src.infrastructure.aiomysql.aiomysql_contact_repository import AioMySQLContactRepository
+from src.infrastructure.pymysql.mysql_client import OUTBOX_INSERT, STATS_INCREMENT
+
+CREATED_AT = datetime(2024, 5, 1, 12, 30, 0)
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, sql, params=None):
+        if self.connection.error is not None:
+            raise self.connection.error
+        self.connection.executed.append((sql, params))
+
+    async def executemany(self, sql, params):
+        self.connection.executed.append((sql, list(params)))
+
+    async def fetchall(self):
+        return self.connection.rows
+
+    async def fetchone(self):
+        return self.connection.rows[0]
+
+
+class FakeConnection:
+    def __init__(self, rows=(), error=None):
+        self.rows = list(rows)
+        self.error = error
+        self.executed = []
+        self.commits = 0
+        self.pings = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def ping(self, reconnect=True):
+        if self.error is not None:
+            raise self.error
+        self.pings.append(reconnect)
+
+
+class FakeAcquire:
+    "Como el _PoolAcquireContextManager de aiomysql: se puede esperar o usar con `async with`."
+    def __init__(self, pool):
+        self.pool = pool
+
+    def __await__(self):
+        return self.pool.checkout().__await__()
+
+    async def __aenter__(self):
+        self.connection = await self.pool.checkout()
+        return self.connection
+
+    async def __aexit__(self, *exc_info):
+        self.pool.release(self.connection)
+        return False
+
+
+class FakePool:
+    def __init__(self, connection, maxsize):
+        self.connection = connection
+        self.maxsize = maxsize
+        self.size = 0
+        self.freesize = 0
+        self.closed = False
+
+    def acquire(self):
+        return FakeAcquire(self)
+
+    async def checkout(self):
+        if self.freesize:
+            self.freesize -= 1
+        else:
+            self.size += 1
+        return self.connection
+
+    def release(self, connection):
+        self.freesize += 1
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        return None
+
+
+class FakeAiomysql:
+    def __init__(self, connection=None, error=None):
+        self.connection = connection or FakeConnection()
+        self.error = error
+        self.pools = []
+        self.kwargs = []
+
+    async def create_pool(self, **kwargs):
+        self.kwargs.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        pool = FakePool(self.connection, kwargs["maxsize"])
+        self.pools.append(pool)
+        return pool
+
+
+class RecordingMetrics:
+    def __init__(self):
+        self.counters = []
+        self.observations = []
+
+    def inc(self, name, labels=None):
+        self.counters.append((name, labels))
+
+    def observe(self, name, value, labels=None):
+        self.observations.append((name, labels))
+
+
+def _repository(monkeypatch, fake, **kwargs):
+    monkeypatch.setattr(aiomysql_contact_repository, "aiomysql", fake)
+    return AioMySQLContactRepository(host="db", user="app", password="pw", db="contactos", port=3306, **kwargs)
+
+
+def _contact(created_at=CREATED_AT):
+    return Contact(
+        "TICKET-1", "Ada", "ada@example.com", "Analytical Engines", "Hola",
+        "/contacto", "direct", "203.0.113.7", "pytest", created_at,
+    )
+
+
+def _row(ticket_id, row_id):
+    return (ticket_id, "Ada", "ada@example.com", "", "Hola", "/contacto", "direct", "203.0.113.7", "pytest",
+            CREATED_AT, row_id)
+
+
+def test_save_inserts_commits_and_creates_the_pool_once(monkeypatch):
+    fake = FakeAiomysql()
+    repository = _repository(monkeypatch, fake, pool_size=4)
+
+    async def scenario():
+        await repository.save(_contact())
+        await repository.save(_contact())
+
+    asyncio.run(scenario())
+
+    assert len(fake.pools) == 1
+    assert fake.kwargs[0]["maxsize"] == 4
+    assert fake.kwargs[0]["init_command"] == aiomysql_contact_repository.SESSION_INIT_COMMAND
+    sql, params = fake.connection.executed[0]
+    assert sql == aiomysql_contact_repository.INSERT_SQL
+    assert params[0] == "TICKET-1" and params[-1] == CREATED_AT
+    assert fake.connection.commits == 2
+
+
+def test_save_writes_outbox_and_daily_stats_in_the_same_transaction(monkeypatch):
+    fake = FakeAiomysql()
+    repository = _repository(monkeypatch, fake, outbox=True, daily_stats=True)
+
+    asyncio.run(repository.save(_contact()))
+
+    statements = [sql for sql, _ in fake.connection.executed]
+    assert statements == [aiomysql_contact_repository.INSERT_SQL, OUTBOX_INSERT, STATS_INCREMENT]
+    assert fake.connection.executed[2][1][0][0] == CREATED_AT.date()
+    assert fake.connection.commits == 1
+
+
+def test_save_stamps_created_at_when_the_contact_has_none(monkeypatch):
+    fake = FakeAiomysql()
+    repository = _repository(monkeypatch, fake)
+
+    asyncio.run(repository.save(_contact(created_at=None)))
+
+    stamped = fake.connection.executed[0][1][-1]
+    assert isinstance(stamped, datetime) and stamped.microsecond == 0
+
+
+def test_get_page_returns_rows_and_the_next_keyset(monkeypatch):
+    fake = FakeAiomysql(FakeConnection(rows=[_row("T3", 3), _row("T2", 2), _row("T1", 1)]))
+    repository = _repository(monkeypatch, fake)
+
+    rows, next_after = asyncio.run(repository.get_page(2))
+
+    assert [row.ticket_id for row in rows] == ["T3", "T2"]
+    assert next_after == (CREATED_AT, 2)
+    assert fake.connection.executed[0][1] == (3,)
+
+
+def test_get_page_after_a_cursor_filters_by_keyset(monkeypatch):
+    fake = FakeAiomysql(FakeConnection(rows=[_row("T1", 1)]))
+    repository = _repository(monkeypatch, fake)
+
+    rows, next_after = asyncio.run(repository.get_page(2, after=(CREATED_AT, 2)))
+
+    assert [row.ticket_id for row in rows] == ["T1"]
+    assert next_after is None
+    sql, params = fake.connection.executed[0]
+    assert "WHERE created_at < %s" in sql
+    assert params == (CREATED_AT, CREATED_AT, 2, 3)
+
+
+def test_get_watermark_reads_max_id_and_count(monkeypatch):
+    fake = FakeAiomysql(FakeConnection(rows=[(7, 5)]))
+    repository = _repository(monkeypatch, fake)
+
+    assert asyncio.run(repository.get_watermark()) == (7, 5)
+
+
+def test_operational_error_maps_to_database_unavailable_and_is_counted(monkeypatch):
+    error = pymysql.err.OperationalError(2006, "MySQL server has gone away")
+    fake = FakeAiomysql(FakeConnection(error=error))
+    metrics = RecordingMetrics()
+    repository = _repository(monkeypatch, fake, metrics=metrics)
+
+    with pytest.raises(DatabaseUnavailable):
+        asyncio.run(repository.save(_contact()))
+
+    assert ("mysql_query_errors_total", {"operation": "insert", "error": "OperationalError"}) in metrics.counters
+    assert ("mysql_query_duration_seconds", {"operation": "insert"}) in metrics.observations
+
+
+def test_other_mysql_errors_map_to_the_operation_failure(monkeypatch):
+    fake = FakeAiomysql(FakeConnection(error=pymysql.err.IntegrityError(1062, "Duplicate entry")))
+    repository = _repository(monkeypatch, fake)
+
+    with pytest.raises(ContactCreateFailed):
+        asyncio.run(repository.save(_contact()))
+    with pytest.raises(ContactListFailed):
+        asyncio.run(repository.get_page(10))
+
+
+def test_pool_creation_failure_is_database_unavailable(monkeypatch):
+    fake = FakeAiomysql(error=pymysql.err.OperationalError(2003, "Can't connect"))
+    repository = _repository(monkeypatch, fake)
+
+    with pytest.raises(DatabaseUnavailable):
+        asyncio.run(repository.ping())
+
+
+def test_ping_warm_pool_stats_and_close(monkeypatch):
+    fake = FakeAiomysql()
+    repository = _repository(monkeypatch, fake, pool_size=3)
+
+    assert repository.pool_stats() == {"max_size": 3, "size": 0, "idle": 0, "in_use": 0}
+
+    async def scenario():
+        await repository.ping()
+        await repository.warm(5)
+        stats = repository.pool_stats()
+        await repository.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert fake.connection.pings == [False]
+    assert stats == {"max_size": 3, "size": 3, "idle": 3, "in_use": 0}
+    assert fake.pools[0].closed
+    assert repository.pool_stats()["size"] == 0
+
+
+def test_missing_aiomysql_is_reported_on_construction(monkeypatch):
+    monkeypatch.setattr(aiomysql_contact_repository, "aiomysql", None)
+
+    with pytest.raises(RuntimeError, match="aiomysql"):
+        AioMySQLContactRepository(host="db", user="app", password="pw", db="contactos")
@@ -0,0 +1,57 @@
+import pytest
+
+from src.infrastructure.flask import flask_app
+from src.shared import config
+from src.shared.config import Settings
+
+
+def test_settings_from_env_parses_values_and_rejects_unknown_backend():
+    settings = Settings.from_env({
+        "ORIGIN_VERIFY_SECRET": "s3cret",
+        "FLASK_ENV": "development",
+        "CONTACT_REPOSITORY": "SQLite",
+        "CONTACT_FLUSH_INTERVAL_MS": "50",
+        "RATE_LIMIT_ENABLED": "false",
+    })
+
+    assert settings.origin_verify_secret == "s3cret"
+    assert settings.development is True
+    assert settings.contact_repository == "sqlite"
+    assert settings.contact_flush_interval == 0.05
+    assert settings.rate_limit_enabled is False
+    assert settings.duplicate_window_seconds == 600
+    assert Settings.from_env({}).rate_limit_enabled is False
+    assert Settings.from_env({"RATE_LIMIT_ENABLED": "true"}).rate_limit_enabled is True
+    with pytest.raises(ValueError):
+        Settings.from_env({"CONTACT_REPOSITORY": "postgres"})
+
+
+def test_load_env_runs_once_with_local_overrides(monkeypatch, tmp_path):
+    (tmp_path / ".env.remote").write_text("APP_FACTORY_A=remote\nAPP_FACTORY_B=remote\n", encoding="utf-8")
+    (tmp_path / ".env.local").write_text("APP_FACTORY_B=local\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config, "_env_loaded", False)
+    monkeypatch.setenv("APP_FACTORY_A", "environ")
+    monkeypatch.setenv("APP_FACTORY_B", "environ")
+
+    config.load_env()
+    (tmp_path / ".env.local").write_text("APP_FACTORY_B=changed\n", encoding="utf-8")
+    config.load_env()
+
+    assert config.os.environ["APP_FACTORY_A"] == "environ"
+    assert config.os.environ["APP_FACTORY_B"] == "local"
+
+
+def test_create_app_wires_adapters_lazily_and_snapshots_settings(monkeypatch):
+    app = flask_app.create_app(Settings(origin_verify_secret="s3cret", contact_repository="memory"))
+    services = app.extensions["services"]
+    client = app.test_client()
+
+    assert client.get("/health").status_code == 200
+    assert "contact_repository" not in services.__dict__
+    assert "contact_controller" not in services.__dict__
+
+    monkeypatch.setenv("ORIGIN_VERIFY_SECRET", "changed")
+    assert client.get("/v1/contact/list", headers={"X-Origin-Verify": "changed"}).status_code == 403
+    assert client.get("/v1/contact/list", headers={"X-Origin-Verify": "s3cret"}).status_code == 200
+    assert client.get("/health/db").get_json()["backend"] == "memory"
@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+from src.infrastructure.asgi.asgi_app import create_asgi_app
+from src.infrastructure.flask.flask_app import create_app
+from src.shared.config import Settings
+
+SECRET = "s3cret"
+VALID_PAYLOAD = {
+    "name": "Ada Lovelace",
+    "email": "ada@example.com",
+    "company": "Analytical Engines",
+    "message": "Hola",
+    "page_location": "/contacto",
+    "traffic_source": "direct",
+}
+
+
+def _settings(**overrides):
+    defaults = {
+        "origin_verify_secret": SECRET,
+        "contact_repository": "memory",
+        "rate_limit_enabled": False,
+        "duplicate_window_seconds": 0,
+    }
+    return Settings(**{**defaults, **overrides})
+
+
+def _call(app, method, path, body=b"", headers=None, query=b""):
+    raw_headers = [(b"x-origin-verify", SECRET.encode())]
+    raw_headers += [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": raw_headers,
+        "client": ("203.0.113.7", 5000),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, body_message = sent
+    response_headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    payload = body_message["body"]
+    return start["status"], response_headers, json.loads(payload) if payload else None
+
+
+def _post(app, payload, content_type="application/json", headers=None):
+    return _call(
+        app, "POST", "/v1/contact/email", json.dumps(payload).encode(),
+        {"Content-Type": content_type, **(headers or {})},
+    )
+
+
+def test_post_then_list_round_trip_with_etag():
+    app = create_asgi_app(_settings())
+
+    status, _, body = _post(app, VALID_PAYLOAD)
+    assert status == 201
+    assert body["ip"] == "203.0.113.7"
+
+    status, headers, body = _call(app, "GET", "/v1/contact/list", query=b"limit=10")
+    assert status == 200
+    assert [row["ticket_id"] for row in body["contactos"]] == [app.services.contact_repository.get_all()[0].ticket_id]
+    assert body["next_cursor"] is None
+    status, _, _ = _call(app, "GET", "/v1/contact/list", query=b"limit=10", headers={"If-None-Match": headers["etag"]})
+    assert status == 304
+
+
+def test_reuses_controller_validation_and_guards():
+    app = create_asgi_app(_settings())
+
+    status, _, body = _post(app, {**VALID_PAYLOAD, "email": "not-an-email"})
+    assert status == 400
+    assert body["errors"][0]["field"] == "email"
+    assert _post(app, VALID_PAYLOAD, content_type="text/plain")[0] == 415
+    assert _post(app, {**VALID_PAYLOAD, "message": "x" * 30000})[0] == 413
+    status, _, body = _call(app, "POST", "/v1/contact/email", b"{bad", {"Content-Type": "application/json"})
+    assert (status, body["error_code"]) == (400, "JSON_REQUIRED")
+    assert _call(app, "GET", "/v1/contact/email")[0] == 405
+    assert _call(app, "GET", "/nope")[2]["error_code"] == "NOT_FOUND"
+
+    forbidden = create_asgi_app(_settings(origin_verify_secret="other"))
+    assert _call(forbidden, "GET", "/v1/contact/list")[0] == 403
+    status, headers, _ = _call(forbidden, "OPTIONS", "/v1/contact/email", headers={
+        "Origin": "https://profebustos.com.ar", "Access-Control-Request-Method": "POST",
+    })
+    assert status == 204
+    assert headers["access-control-allow-origin"] == "https://profebustos.com.ar"
+
+
+def test_lifespan_warms_sqlite_backend_and_reports_ready(tmp_path):
+    app = create_asgi_app(_settings(
+        contact_repository="sqlite", contact_sqlite_path=str(tmp_path / "contacts.sqlite3"),
+    ))
+    events = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return events.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert app.services.ready is True
+    assert _call(app, "GET", "/health/ready")[2] == {"success": True, "ready": True}
+    assert _call(app, "GET", "/health/db")[2]["backend"] == "sqlite"
+    assert _post(app, VALID_PAYLOAD)[0] == 201
+    assert app.services.contact_repository.get_watermark()[1] == 1
+
+
+def test_flask_and_asgi_share_error_payloads_and_cors_headers():
+    asgi = create_asgi_app(_settings())
+    flask_client = create_app(_settings()).test_client()
+    secret = {"X-Origin-Verify": SECRET}
+    preflight = {"Origin": "https://profebustos.com.ar", "Access-Control-Request-Method": "POST"}
+
+    flask_missing = flask_client.get("/nope", headers=secret)
+    assert _call(asgi, "GET", "/nope")[::2] == (flask_missing.status_code, flask_missing.get_json())
+    flask_unsupported = flask_client.post("/v1/contact/email", data="x", content_type="text/plain", headers=secret)
+    status, _, body = _post(asgi, VALID_PAYLOAD, content_type="text/plain")
+    assert (status, body) == (flask_unsupported.status_code, flask_unsupported.get_json())
+    flask_preflight = flask_client.open("/v1/contact/email", method="OPTIONS", headers=preflight)
+    asgi_headers = _call(asgi, "OPTIONS", "/v1/contact/email", headers=preflight)[1]
+    for name in ("Access-Control-Allow-Origin", "Access-Control-Allow-Methods", "Access-Control-Allow-Headers"):
+        assert asgi_headers[name.lower()] == flask_preflight.headers[name]
@@ -0,0 +1,148 @@
+import threading
+
+import pymysql
+import pytest
+
+from src.infrastructure.pymysql import mysql_client
+from src.infrastructure.pymysql.connection_pool import MySQLConnectionPool, PoolTimeout, PoolUnavailable
+
+
+class FakeConnection:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise pymysql.err.OperationalError(2006, "MySQL server has gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnect:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        conn = FakeConnection()
+        self.created.append(conn)
+        return conn
+
+
+def test_pool_reuses_checked_in_connection():
+    connect = FakeConnect()
+    pool = MySQLConnectionPool(connect, max_size=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert len(connect.created) == 1
+    assert pool.stats()["checkouts"] == 2
+
+
+def test_pool_replaces_dead_connection_on_checkout():
+    connect = FakeConnect()
+    pool = MySQLConnectionPool(connect, max_size=1)
+
+    with pool.connection() as first:
+        pass
+    first.alive = False
+    with pool.connection() as second:
+        pass
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["size"] == 1
+
+
+def test_pool_times_out_when_exhausted():
+    pool = MySQLConnectionPool(FakeConnect(), max_size=1, checkout_timeout=0.05)
+
+    with pool.connection():
+        with pytest.raises(PoolTimeout):
+            pool.checkout()
+
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_pool_discards_connection_on_operational_error():
+    pool = MySQLConnectionPool(FakeConnect(), max_size=1)
+
+    with pytest.raises(pymysql.err.OperationalError):
+        with pool.connection() as conn:
+            raise pymysql.err.OperationalError(2013, "Lost connection")
+
+    assert conn.closed
+    assert pool.stats()["size"] == 0
+
+
+def test_pool_evicts_idle_connections():
+    pool = MySQLConnectionPool(FakeConnect(), max_size=2, max_idle_seconds=0.01)
+
+    with pool.connection() as conn:
+        pass
+    threading.Event().wait(0.02)
+    with pool.connection():
+        pass
+
+    assert conn.closed
+    assert pool.stats()["evicted"] == 1
+
+
+def test_pool_hands_connections_to_waiting_threads():
+    pool = MySQLConnectionPool(FakeConnect(), max_size=2, checkout_timeout=2)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(50):
+                with pool.connection():
+                    pass
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.stats()
+    assert not errors
+    assert stats["size"] <= 2
+    assert stats["in_use"] == 0
+
+
+def test_pool_fails_fast_after_connection_failure():
+    attempts = []
+
+    def failing_connect():
+        attempts.append(1)
+        raise pymysql.err.OperationalError(2003, "Can't connect")
+
+    pool = MySQLConnectionPool(failing_connect, max_size=2, retry_after=60)
+
+    with pytest.raises(pymysql.err.OperationalError):
+        pool.checkout()
+    with pytest.raises(PoolUnavailable):
+        pool.checkout()
+
+    assert len(attempts) == 1
+    assert pool.stats()["available"] is False
+
+
+def test_mysql_sessions_use_utc_like_the_deferred_created_at(monkeypatch):
+    calls = []
+    monkeypatch.setattr(mysql_client.pymysql, "connect", lambda **kwargs: calls.append(kwargs) or FakeConnection())
+
+    mysql_client.MySQLClient(host="db", user="app", db="contacts").connect()
+
+    assert calls[0]["init_command"] == "SET time_zone = '+00:00'"
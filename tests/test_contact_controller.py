@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 from src.application.dtos.contact_dto import ContactDTO
 from src.application.errors import ContactCreateFailed, DatabaseUnavailable
 from src.interface_adapters.controllers.contact_controller import ContactController
@@ -46,7 +49,7 @@ def test_contact_controller_success_returns_ticket_id():
         "name": "Ada",
         "email": "ada@example.com",
         "company": "",
-        "message": "",
+        "message": "Hello",
         "page_location": "",
         "traffic_source": "",
     })
@@ -65,7 +68,7 @@ def test_contact_controller_maps_contact_create_failed():
         "name": "Ada",
         "email": "ada@example.com",
         "company": "",
-        "message": "",
+        "message": "Hello",
         "page_location": "",
         "traffic_source": "",
     })
@@ -83,7 +86,7 @@ def test_contact_controller_maps_db_unavailable():
         "name": "Ada",
         "email": "ada@example.com",
         "company": "",
-        "message": "",
+        "message": "Hello",
         "page_location": "",
         "traffic_source": "",
     })
@@ -92,3 +95,59 @@ def test_contact_controller_maps_db_unavailable():
 
     assert status == 503
     assert response["error_code"] == "DB_UNAVAILABLE"
+
+
+def test_contact_controller_caps_user_agent_at_column_width():
+    class CapturingUseCase(FakeUseCase):
+        def execute(self, **kwargs):
+            self.kwargs = kwargs
+            return super().execute(**kwargs)
+
+    use_case = CapturingUseCase(error=ContactCreateFailed())
+    request = FakeRequest({
+        "name": "Ada",
+        "email": "ada@example.com",
+        "company": "",
+        "message": "Hello",
+        "page_location": "",
+        "traffic_source": "",
+    })
+    request.headers["User-Agent"] = "x" * 600
+
+    ContactController(use_case).registrar_contacto(request)
+
+    assert len(use_case.kwargs["user_agent"]) == 512
+
+
+def test_async_controller_rate_limits_off_the_event_loop():
+    class RecordingRateLimiter:
+        def __init__(self):
+            self.threads = []
+
+        def hit(self, keys):
+            self.threads.append(threading.current_thread())
+            return 30
+
+    class AsyncUseCase:
+        def find_replay(self, name, email, message, idempotency_key=None):
+            return None
+
+        async def execute(self, **kwargs):
+            raise AssertionError("rate limited requests must not register")
+
+    rate_limiter = RecordingRateLimiter()
+    controller = ContactController(AsyncUseCase(), rate_limiter)
+    request = FakeRequest({
+        "name": "Ada",
+        "email": "ada@example.com",
+        "company": "",
+        "message": "Hello",
+        "page_location": "",
+        "traffic_source": "",
+    })
+
+    response, status = asyncio.run(controller.registrar_contacto_async(request))
+
+    assert status == 429
+    assert response["retry_after"] == 30
+    assert rate_limiter.threads and threading.main_thread() not in rate_limiter.threads
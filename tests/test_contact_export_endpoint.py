@@ -0,0 +1,85 @@
+import json
+from datetime import datetime
+
+from src.application.dtos.contact_dto import ContactDTO
+from src.application.errors import DatabaseUnavailable
+from src.infrastructure.flask import flask_app
+from src.infrastructure.flask.json_provider import dumps_bytes
+from src.shared.config import Settings
+
+
+def _client(**services):
+    app = flask_app.create_app(Settings(development=True))
+    for name, value in services.items():
+        setattr(app.extensions["services"], name, value)
+    return app.test_client()
+
+
+def _contacts(count):
+    for index in range(count):
+        yield ContactDTO(
+            ticket_id=f"t-{index}",
+            name="Ada, Countess",
+            email="ada@example.com",
+            company="Analytical Engines",
+            message="Hello",
+            page_location="/",
+            traffic_source="direct",
+            ip="127.0.0.1",
+            user_agent="pytest",
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+        )
+
+
+def _use_case(iter_all):
+    return type("UC", (), {"iter_all": staticmethod(iter_all)})
+
+
+def test_export_streams_ndjson_by_default():
+    client = _client(list_contacts_use_case=_use_case(lambda: _contacts(3)))
+    response = client.get("/v1/contact/export", headers={"Origin": "http://localhost:5173"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)["ticket_id"] for line in lines] == ["t-0", "t-1", "t-2"]
+    assert json.loads(lines[0])["created_at"] == "2024-01-01T12:00:00+00:00"
+    for use_orjson in (True, False):
+        listed = json.loads(dumps_bytes({"created_at": datetime(2024, 1, 1, 12, 0, 0)}, use_orjson=use_orjson))
+        assert listed["created_at"] == json.loads(lines[0])["created_at"]
+
+
+def test_export_streams_csv_when_accepted():
+    client = _client(list_contacts_use_case=_use_case(lambda: _contacts(2)))
+    response = client.get(
+        "/v1/contact/export",
+        headers={"Origin": "http://localhost:5173", "Accept": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0].startswith("ticket_id,name,email")
+    assert lines[1].startswith('t-0,"Ada, Countess",ada@example.com')
+    assert lines[1].endswith(",2024-01-01T12:00:00+00:00")
+    assert len(lines) == 3
+
+
+def test_export_returns_503_when_db_unavailable():
+    def failing_iter():
+        raise DatabaseUnavailable()
+        yield  # pylint: disable=unreachable
+
+    client = _client(list_contacts_use_case=_use_case(failing_iter))
+    response = client.get("/v1/contact/export?format=csv", headers={"Origin": "http://localhost:5173"})
+
+    assert response.status_code == 503
+    assert response.get_json()["error_code"] == "DB_UNAVAILABLE"
+
+
+def test_export_rejects_unknown_format():
+    client = _client()
+    response = client.get("/v1/contact/export?format=xml", headers={"Origin": "http://localhost:5173"})
+
+    assert response.status_code == 400
+    assert response.get_json()["error_code"] == "INVALID_FORMAT"
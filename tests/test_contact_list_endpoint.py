@@ -1,36 +1,60 @@
 from datetime import datetime
 
-from src.entities.contact import Contact
+from src.application.dtos.contact_page_dto import ContactPageDTO
+from src.application.dtos.contact_row import ContactRow
 from src.infrastructure.flask import flask_app
+from src.infrastructure.flask.list_response_cache import ListResponseCache
+from src.interface_adapters.controllers.pagination import decode_cursor, encode_cursor
+from src.shared.config import Settings
+from src.use_cases.list_contacts import MAX_PAGE_SIZE, ListContactsUseCase
 
 
-def test_get_contact_list_returns_expected_shape(monkeypatch):
-    sample_contacts = [
-        Contact(
-            ticket_id="t-1",
-            name="Ada Lovelace",
-            email="ada@example.com",
-            company="Analytical Engines",
-            message="Hello",
-            page_location="/",
-            traffic_source="direct",
-            ip="127.0.0.1",
-            user_agent="pytest",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-        )
-    ]
+def _client(**services):
+    app = flask_app.create_app(Settings(development=True))
+    for name, value in services.items():
+        setattr(app.extensions["services"], name, value)
+    return app.test_client()
+
+
+def _sample_contact(ticket_id="t-1"):
+    return ContactRow(
+        ticket_id=ticket_id,
+        name="Ada Lovelace",
+        email="ada@example.com",
+        company="Analytical Engines",
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        id=7,
+    )
 
-    def fake_execute():
-        return sample_contacts
 
-    monkeypatch.setattr(
-        flask_app,
-        "list_contacts_use_case",
-        type("UC", (), {"execute": staticmethod(fake_execute)}),
+def _use_case(execute_page, watermark=(1, 1)):
+    return type(
+        "UC",
+        (),
+        {
+            "execute_page": staticmethod(execute_page),
+            "watermark": staticmethod(lambda: watermark),
+        },
     )
-    monkeypatch.setenv("FLASK_ENV", "development")
 
-    client = flask_app.app.test_client()
+
+def test_get_contact_list_returns_expected_shape():
+    calls = []
+
+    def fake_execute_page(limit=None, after=None):
+        calls.append((limit, after))
+        return ContactPageDTO(
+            items=[_sample_contact()],
+            limit=50,
+            next_after=(datetime(2024, 1, 1, 12, 0, 0), 7),
+        )
+
+    client = _client(list_contacts_use_case=_use_case(fake_execute_page))
     response = client.get("/v1/contact/list", headers={"Origin": "http://localhost:5173"})
 
     assert response.status_code == 200
@@ -39,3 +63,109 @@ def test_get_contact_list_returns_expected_shape(monkeypatch):
     assert isinstance(payload["contactos"], list)
     assert payload["contactos"][0]["ticket_id"] == "t-1"
     assert payload["contactos"][0]["created_at"] is not None
+    assert decode_cursor(payload["next_cursor"]) == (datetime(2024, 1, 1, 12, 0, 0), 7)
+    assert calls == [(None, None)]
+
+
+def test_get_contact_list_forwards_cursor():
+    calls = []
+
+    def fake_execute_page(limit=None, after=None):
+        calls.append((limit, after))
+        return ContactPageDTO(items=[], limit=limit, next_after=None)
+
+    cursor = encode_cursor((datetime(2024, 1, 1, 12, 0, 0), 7))
+
+    client = _client(list_contacts_use_case=_use_case(fake_execute_page, (2, 2)))
+    response = client.get(
+        f"/v1/contact/list?limit=10&cursor={cursor}",
+        headers={"Origin": "http://localhost:5173"},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["next_cursor"] is None
+    assert calls == [(10, (datetime(2024, 1, 1, 12, 0, 0), 7))]
+
+
+def test_get_contact_list_rejects_invalid_cursor():
+    client = _client()
+    response = client.get(
+        "/v1/contact/list?cursor=not-a-cursor",
+        headers={"Origin": "http://localhost:5173"},
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["error_code"] == "INVALID_PAGINATION"
+
+
+def test_get_contact_list_revalidates_with_etag():
+    calls = []
+    watermark = [(10, 3)]
+
+    def fake_execute_page(limit=None, after=None):
+        calls.append((limit, after))
+        return ContactPageDTO(items=[_sample_contact()], limit=50, next_after=None)
+
+    use_case = type(
+        "UC",
+        (),
+        {
+            "execute_page": staticmethod(fake_execute_page),
+            "watermark": staticmethod(lambda: watermark[0]),
+        },
+    )
+    headers = {"Origin": "http://localhost:5173"}
+    client = _client(list_contacts_use_case=use_case, list_response_cache=ListResponseCache())
+
+    first = client.get("/v1/contact/list", headers=headers)
+    etag = first.headers["ETag"]
+    not_modified = client.get("/v1/contact/list", headers={**headers, "If-None-Match": etag})
+    cached = client.get("/v1/contact/list", headers=headers)
+
+    assert first.status_code == 200
+    assert not_modified.status_code == 304
+    assert cached.get_data() == first.get_data()
+    assert len(calls) == 1
+
+    watermark[0] = (11, 4)
+    changed = client.get("/v1/contact/list", headers={**headers, "If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(calls) == 2
+
+
+def test_list_contacts_use_case_clamps_page_size():
+    class FakeRepository:
+        def __init__(self):
+            self.limits = []
+
+        def get_page(self, limit, after=None):
+            self.limits.append(limit)
+            return [_sample_contact()], None
+
+    repo = FakeRepository()
+    use_case = ListContactsUseCase(repo)
+
+    page = use_case.execute_page(limit=10_000)
+
+    assert repo.limits == [MAX_PAGE_SIZE]
+    assert page.limit == MAX_PAGE_SIZE
+    assert page.items[0].ticket_id == "t-1"
+
+
+def test_repository_save_invalidates_list_cache():
+    from src.interface_adapters.gateways.contact_repository_adapter import ContactRepositoryAdapter
+
+    class FakeClient:
+        def insert_contacto(self, **kwargs):
+            pass
+
+    cache = ListResponseCache()
+    cache.put("50|", "etag", b"{}")
+    repository = ContactRepositoryAdapter(FakeClient())
+    repository.add_change_listener(cache.invalidate)
+
+    repository.save(_sample_contact())
+
+    assert cache.get("50|", "etag") is None
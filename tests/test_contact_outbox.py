@@ -0,0 +1,141 @@
+import json
+
+from src.application.dtos.outbox_event import OutboxEvent
+from src.infrastructure.common.outbox_worker import OutboxWorker
+from src.infrastructure.pymysql.connection_pool import MySQLConnectionPool
+from src.infrastructure.pymysql.mysql_client import CONTACT_CREATED, OUTBOX_INSERT, MySQLClient
+from src.infrastructure.pymysql.outbox_store import CLAIM_SQL, MySQLOutboxStore
+from src.infrastructure.pymysql.schema_migrator import load_migrations
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.connection.statements.append((sql, params))
+
+    def executemany(self, sql, rows):
+        self.connection.statements.append((sql, list(rows)))
+
+    def fetchall(self):
+        return self.connection.rows
+
+
+class FakeConnection:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.open = True
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+def test_bundled_migrations_create_the_outbox_table():
+    migration = next(m for m in load_migrations() if m.version == 3)
+
+    assert "CREATE TABLE IF NOT EXISTS contact_outbox" in migration.statements[0]
+    assert "idx_contact_outbox_claim" in migration.statements[0]
+
+
+def test_insert_contacto_writes_the_outbox_event_in_the_same_transaction():
+    connection = FakeConnection()
+    client = MySQLClient(host="db", user="app", db="contacts", outbox=True)
+    client.pool = MySQLConnectionPool(lambda: connection, max_size=1)
+
+    client.insert_contacto("t-1", "Ada", "ada@example.com", "", "Hola", "/", "direct", "127.0.0.1", "pytest")
+
+    assert connection.commits == 1
+    assert [sql for sql, _ in connection.statements][-1] == OUTBOX_INSERT
+    event_type, ticket_id, payload = connection.statements[-1][1]
+    assert (event_type, ticket_id) == (CONTACT_CREATED, "t-1")
+    assert json.loads(payload)["email"] == "ada@example.com"
+
+
+def _event(event_id, attempts=0, event_type=CONTACT_CREATED):
+    return OutboxEvent(event_id, event_type, f"t-{event_id}", {"ticket_id": f"t-{event_id}"}, attempts)
+
+
+def test_store_claims_with_skip_locked_and_writes_outcomes_before_commit():
+    rows = [{"id": 7, "event_type": CONTACT_CREATED, "ticket_id": "t-7", "payload": '{"ticket_id": "t-7"}', "attempts": 0}]
+    connection = FakeConnection(rows)
+    store = MySQLOutboxStore(lambda: connection)
+
+    with store.claim(10) as batch:
+        assert batch.events == [OutboxEvent(7, CONTACT_CREATED, "t-7", {"ticket_id": "t-7"}, 0)]
+        batch.done(batch.events[0])
+
+    assert connection.statements[0] == (CLAIM_SQL, (10,))
+    assert "SKIP LOCKED" in CLAIM_SQL
+    assert connection.statements[1][0].startswith("UPDATE contact_outbox SET status = 'done'")
+    assert connection.commits == 1
+
+
+class FakeBatch:
+    def __init__(self, events):
+        self.events = events
+        self.done_ids, self.retried, self.dead_ids = [], [], []
+
+    def done(self, event):
+        self.done_ids.append(event.id)
+
+    def retry(self, event, error, delay_seconds):
+        self.retried.append((event.id, delay_seconds))
+
+    def dead(self, event, error):
+        self.dead_ids.append(event.id)
+
+
+class FakeStore:
+    def __init__(self, events):
+        self.batch = FakeBatch(events)
+
+    def claim(self, batch_size):
+        store = self
+
+        class _Claim:
+            def __enter__(self):
+                return store.batch
+
+            def __exit__(self, *exc_info):
+                return False
+
+        return _Claim()
+
+    def close(self):
+        pass
+
+
+def test_worker_marks_events_done_retried_or_dead():
+    def handler(event):
+        if event.id != 1:
+            raise OSError("smtp down")
+
+    store = FakeStore([_event(1), _event(2, attempts=1), _event(3, attempts=4), _event(4, event_type="unknown")])
+    worker = OutboxWorker(store, {CONTACT_CREATED: handler}, concurrency=2, max_attempts=5, retry_backoff=5)
+
+    assert worker.run_once() == 4
+    assert store.batch.done_ids == [1]
+    assert store.batch.retried == [(2, 10), (4, 5)]
+    assert store.batch.dead_ids == [3]
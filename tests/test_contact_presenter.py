@@ -1,4 +1,5 @@
 from src.application.dtos.contact_dto import ContactDTO
+from src.application.dtos.contact_row import ContactRow
 from src.interface_adapters.presenters.contact_presenter import ContactPresenter
 
 
@@ -40,3 +41,26 @@ def test_contact_presenter_to_response_with_created_at():
 
     assert payload["ticket_id"] == "t-1"
     assert payload["created_at"] == "2024-01-01T12:00:00Z"
+
+
+def test_contact_presenter_rows_to_response_drops_internal_id():
+    row = ContactRow(
+        ticket_id="t-1",
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hola",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+        created_at="2024-01-01T12:00:00Z",
+        id=7,
+    )
+
+    payload = ContactPresenter.rows_to_response([row, tuple(row)])
+
+    assert payload[0] == payload[1]
+    assert payload[0]["ticket_id"] == "t-1"
+    assert payload[0]["created_at"] == "2024-01-01T12:00:00Z"
+    assert "id" not in payload[0]
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+
+from src.application.dtos.contact_search_query import ContactSearchQuery
+from src.entities.contact import Contact
+from src.infrastructure.flask import flask_app
+from src.infrastructure.memory.in_memory_contact_repository import InMemoryContactRepository
+from src.infrastructure.sqlite.sqlite_contact_repository import SQLiteContactRepository
+from src.interface_adapters.controllers.pagination import decode_search_cursor, encode_cursor
+from src.shared.config import Settings
+from src.use_cases.list_contacts import ListContactsUseCase, parse_search_query
+
+CONTACTS = [
+    ("t-1", "Ada Lovelace", "ada@example.com", "Analytical Engines", "Necesito una cotización"),
+    ("t-2", "Grace Hopper", "grace@navy.mil", "", "Consulta por cotización de compiladores, cotización urgente"),
+    ("t-3", "Alan Turing", "alan@bletchley.uk", "Bletchley", "Hola"),
+    ("t-4", "Adam Smith", "adam_smith@example.com", "", "Otra cotización"),
+]
+
+
+def _contact(ticket_id, name, email, company, message):
+    return Contact(ticket_id, name, email, company, message, "/", "direct", "127.0.0.1", "pytest",
+                   datetime(2024, 1, 1, 12, 0, 0))
+
+
+def _repositories(tmp_path):
+    repositories = [SQLiteContactRepository(str(tmp_path / "contacts.sqlite3")), InMemoryContactRepository()]
+    for repository in repositories:
+        for values in CONTACTS:
+            repository.save(_contact(*values))
+    return repositories
+
+
+def _walk(repository, query, limit):
+    pages, after = [], None
+    while True:
+        rows, after = repository.search(query, limit, after)
+        pages.append([row.ticket_id for row in rows])
+        if after is None:
+            return pages
+
+
+def test_parse_search_query_splits_terms_or_detects_an_email_prefix():
+    assert parse_search_query("  Cotización URGENTE a ") == ContactSearchQuery(terms=("cotización", "urgente"))
+    assert parse_search_query("Ada@Ex") == ContactSearchQuery(email_prefix="ada@ex")
+    for invalid in ("", "a", "ab", "x" * 101, "a b c", "de la"):
+        with pytest.raises(ValueError):
+            parse_search_query(invalid)
+
+
+def test_search_matches_all_prefixed_terms_by_relevance_with_keyset_pages(tmp_path):
+    for repository in _repositories(tmp_path):
+        # Grace menciona "cotización" dos veces: va primero; el empate se resuelve por id.
+        assert _walk(repository, parse_search_query("cotiz"), 2) == [["t-2", "t-4"], ["t-1"]]
+        assert _walk(repository, parse_search_query("cotización urgente"), 2) == [["t-2"]]
+        assert _walk(repository, parse_search_query("bletch"), 5) == [["t-3"]]
+
+
+def test_search_by_email_prefix_escapes_like_wildcards(tmp_path):
+    for repository in _repositories(tmp_path):
+        assert _walk(repository, parse_search_query("ada@"), 1) == [["t-1"]]
+        assert _walk(repository, parse_search_query("ada_smith@"), 5) == [[]]
+        assert _walk(repository, parse_search_query("adam_smith@ex"), 5) == [["t-4"]]
+
+
+def test_search_endpoint_returns_matches_and_rejects_short_queries():
+    repository = InMemoryContactRepository()
+    for values in CONTACTS:
+        repository.save(_contact(*values))
+    app = flask_app.create_app(Settings(development=True))
+    app.extensions["services"].list_contacts_use_case = ListContactsUseCase(repository)
+    client = app.test_client()
+    headers = {"Origin": "http://localhost:5173"}
+
+    response = client.get("/v1/contact/search?q=cotiz&limit=2", headers=headers)
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [contact["ticket_id"] for contact in body["contactos"]] == ["t-2", "t-4"]
+    assert "id" not in body["contactos"][0]
+
+    following = client.get(f"/v1/contact/search?q=cotiz&limit=2&cursor={body['next_cursor']}", headers=headers)
+    assert [contact["ticket_id"] for contact in following.get_json()["contactos"]] == ["t-1"]
+
+    invalid = client.get("/v1/contact/search?q=ab", headers=headers)
+    assert invalid.status_code == 400
+    assert invalid.get_json()["error_code"] == "INVALID_QUERY"
+    assert invalid.get_json()["error"] == "La búsqueda debe tener entre 3 y 100 caracteres"
+
+
+def test_search_cursor_round_trips_the_score_exactly(tmp_path):
+    for repository in _repositories(tmp_path):
+        _, after = repository.search(parse_search_query("cotiz"), 1)
+        assert decode_search_cursor(encode_cursor(after)) == (float(after[0]), after[1])
+    assert decode_search_cursor(encode_cursor((0.1 + 0.2, 3))) == (0.30000000000000004, 3)
+    assert decode_search_cursor(encode_cursor((1234567, 3))) == (1234567.0, 3)
+    with pytest.raises(ValueError):
+        decode_search_cursor("WzAuMywzXQ")  # [0.3,3]: score sin codificar
@@ -0,0 +1,204 @@
+import os
+
+import pymysql
+import pytest
+
+from src.application.errors import ContactCreateFailed, DatabaseUnavailable
+from src.entities.contact import Contact
+from src.infrastructure.common import contact_spool
+from src.infrastructure.common.contact_spool import DEAD_LETTER_NAME, ContactSpool, ContactSpoolReplayer
+from src.interface_adapters.gateways.contact_repository_adapter import ContactRepositoryAdapter
+from src.use_cases.register_contact import RegisterContactUseCase
+
+
+def _contact(ticket_id):
+    return Contact(
+        ticket_id=ticket_id,
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+
+class IdempotentRepository:
+    def __init__(self, available=True):
+        self.available = available
+        self.rows = {}
+
+    def save(self, contact):
+        if not self.available:
+            raise DatabaseUnavailable()
+        self.rows[contact.ticket_id] = contact
+        return contact
+
+    def save_many(self, contacts):
+        if not self.available:
+            raise DatabaseUnavailable()
+        for contact in contacts:
+            self.rows.setdefault(contact.ticket_id, contact)
+
+
+def test_spool_round_trips_contacts(tmp_path):
+    spool = ContactSpool(str(tmp_path))
+    spool.submit(_contact("t-1"))
+    spool.submit(_contact("t-2"))
+    spool.seal()
+
+    segments = spool.sealed_segments()
+
+    assert len(segments) == 1
+    contacts = spool.read_segment(segments[0])
+    assert [c.ticket_id for c in contacts] == ["t-1", "t-2"]
+    assert contacts[0].created_at is not None
+
+
+def test_spool_stops_at_torn_record(tmp_path):
+    spool = ContactSpool(str(tmp_path))
+    spool.submit(_contact("t-1"))
+    spool.submit(_contact("t-2"))
+    spool.seal()
+    segment = spool.sealed_segments()[0]
+    with open(segment, "r+b") as handle:
+        handle.truncate(os.path.getsize(segment) - 3)
+
+    contacts = spool.read_segment(segment)
+
+    assert [c.ticket_id for c in contacts] == ["t-1"]
+
+
+def test_replayer_resyncs_past_a_corrupt_record_and_keeps_the_segment(tmp_path):
+    spool = ContactSpool(str(tmp_path))
+    for ticket_id in ("t-1", "t-2", "t-3"):
+        spool.submit(_contact(ticket_id))
+    spool.seal()
+    segment = spool.sealed_segments()[0]
+    with open(segment, "r+b") as handle:
+        data = handle.read()
+        handle.seek(data.index(b"t-2"))
+        handle.write(b"X")
+    repo = IdempotentRepository()
+
+    contacts, skipped = spool.scan_segment(segment)
+    replayed = ContactSpoolReplayer(spool, repo).replay_once()
+
+    assert [c.ticket_id for c in contacts] == ["t-1", "t-3"]
+    assert skipped > 0
+    assert replayed == 2
+    assert sorted(repo.rows) == ["t-1", "t-3"]
+    assert os.listdir(str(tmp_path)).count(os.path.basename(segment)[:-len(".log")] + ".corrupt") == 1
+
+
+@pytest.mark.skipif(contact_spool.fcntl is None, reason="requiere flock")
+def test_orphaned_segment_is_sealed_even_if_its_pid_was_reused(tmp_path):
+    live = ContactSpool(str(tmp_path))
+    live.submit(_contact("t-1"))
+    crashed = ContactSpool(str(tmp_path))
+    crashed.submit(_contact("t-2"))
+    # Simula un proceso muerto cuyo pid (el de este test) ya reutilizó otro: el flock se libera.
+    crashed._active.close()
+
+    segments = live.sealed_segments()
+
+    assert [c.ticket_id for path in segments for c in live.read_segment(path)] == ["t-2"]
+    assert any(name.endswith(".open") for name in os.listdir(str(tmp_path)))
+
+
+def test_spool_rotates_segments_by_size(tmp_path):
+    spool = ContactSpool(str(tmp_path), segment_max_bytes=1)
+    spool.submit(_contact("t-1"))
+    spool.submit(_contact("t-2"))
+
+    assert len(spool.sealed_segments()) == 2
+
+
+def test_replayer_drains_spool_idempotently(tmp_path):
+    spool = ContactSpool(str(tmp_path))
+    repo = IdempotentRepository(available=False)
+    replayer = ContactSpoolReplayer(spool, repo, batch_size=1)
+    spool.submit(_contact("t-1"))
+    spool.submit(_contact("t-2"))
+
+    with pytest.raises(DatabaseUnavailable):
+        replayer.replay_once()
+    assert spool.pending_bytes() > 0
+
+    repo.available = True
+    repo.rows["t-1"] = _contact("t-1")
+    replayed = replayer.replay_once()
+
+    assert replayed == 2
+    assert sorted(repo.rows) == ["t-1", "t-2"]
+    assert spool.pending_bytes() == 0
+
+
+def test_replayer_dead_letters_rows_mysql_rejects(tmp_path):
+    class RejectingRepository(IdempotentRepository):
+        def save_many(self, contacts):
+            if any(len(c.user_agent) > 512 for c in contacts):
+                raise ContactCreateFailed() from pymysql.err.DataError(1406, "Data too long for column 'user_agent'")
+            super().save_many(contacts)
+
+    spool = ContactSpool(str(tmp_path))
+    repo = RejectingRepository()
+    replayer = ContactSpoolReplayer(spool, repo)
+    spool.submit(_contact("t-1"))
+    poison = _contact("t-2")
+    poison.user_agent = "x" * 600
+    spool.submit(poison)
+    spool.submit(_contact("t-3"))
+
+    replayed = replayer.replay_once()
+
+    assert replayed == 2
+    assert sorted(repo.rows) == ["t-1", "t-3"]
+    assert spool.pending_bytes() == 0
+    dead = spool.read_dead_letters(os.path.join(str(tmp_path), DEAD_LETTER_NAME))
+    assert [c.ticket_id for c in dead] == ["t-2"]
+    assert spool.sealed_segments() == []
+
+
+def test_adapter_only_maps_connection_errors_to_database_unavailable():
+    class FailingClient:
+        def __init__(self, error):
+            self.error = error
+
+        def insert_contactos(self, rows):
+            raise self.error
+
+    with pytest.raises(DatabaseUnavailable):
+        ContactRepositoryAdapter(FailingClient(pymysql.err.OperationalError(2003, "down"))).save_many([_contact("t-1")])
+    with pytest.raises(ContactCreateFailed):
+        ContactRepositoryAdapter(FailingClient(pymysql.err.DataError(1406, "too long"))).save_many([_contact("t-1")])
+    with pytest.raises(ContactCreateFailed):
+        ContactRepositoryAdapter(FailingClient(pymysql.err.IntegrityError(1062, "dup"))).save_many([_contact("t-1")])
+
+
+def test_register_contact_spools_when_db_unavailable(tmp_path):
+    class FakeIdGenerator:
+        def new_id(self):
+            return "t-1"
+
+    spool = ContactSpool(str(tmp_path))
+    use_case = RegisterContactUseCase(
+        IdempotentRepository(available=False), FakeIdGenerator(), fallback_queue=spool
+    )
+
+    result = use_case.execute(
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+    assert result.deferred is True
+    spool.seal()
+    assert [c.ticket_id for c in spool.read_segment(spool.sealed_segments()[0])] == ["t-1"]
@@ -0,0 +1,226 @@
+import sqlite3
+from datetime import date, datetime, timezone
+
+from src.application.dtos.contact_daily_stat import ContactDailyStat
+from src.entities.contact import Contact
+from src.entities.traffic_attribution import traffic_attribution
+from src.infrastructure.common import utc_clock
+from src.infrastructure.flask import flask_app
+from src.infrastructure.memory.in_memory_contact_repository import InMemoryContactRepository
+from src.infrastructure.pymysql.contact_stats_rollup import ContactStatsRollup
+from src.infrastructure.pymysql.connection_pool import MySQLConnectionPool
+from src.infrastructure.pymysql.mysql_client import STATS_INCREMENT, MySQLClient, daily_stats_increments
+from src.infrastructure.sqlite.sqlite_contact_repository import SCHEMA, SQLiteContactRepository
+from src.shared.config import Settings
+from src.use_cases.contact_stats import ContactStatsUseCase
+
+SITE = "profebustos.com.ar"
+
+
+def _contact(ticket_id, page_location, traffic_source, created_at):
+    return Contact(ticket_id, "Ada", "ada@example.com", "", "Hola", page_location, traffic_source,
+                   "127.0.0.1", "pytest", created_at)
+
+
+def _contacts():
+    return [
+        _contact("t-1", "https://www.profebustos.com.ar/?utm_source=Google#contacto", "direct", datetime(2024, 1, 1, 9)),
+        _contact("t-2", "https://profebustos.com.ar/#/contacto?utm_source=google", None, datetime(2024, 1, 1, 23)),
+        _contact("t-3", "https://profebustos.com.ar/", "newsletter", datetime(2024, 1, 2, 10)),
+        _contact("t-4", None, None, datetime(2024, 1, 2, 11)),
+    ]
+
+
+EXPECTED = [
+    ContactDailyStat(date(2024, 1, 1), SITE, "google", 2),
+    ContactDailyStat(date(2024, 1, 2), "", "direct", 1),
+    ContactDailyStat(date(2024, 1, 2), SITE, "newsletter", 1),
+]
+
+
+def test_traffic_attribution_prefers_utm_source_over_the_form_field():
+    assert traffic_attribution("https://www.profebustos.com.ar/?utm_source=Google", "direct") == (SITE, "google")
+    assert traffic_attribution("https://datamaq.com.ar/#/c?utm_source=ig&x=1", None) == ("datamaq.com.ar", "ig")
+    assert traffic_attribution("/contacto", " Newsletter ") == ("", "newsletter")
+    assert traffic_attribution(None, "") == ("", "direct")
+
+
+def test_repositories_keep_the_daily_rollup_on_insert(tmp_path):
+    contacts = _contacts()
+    for repository in (SQLiteContactRepository(str(tmp_path / "contacts.sqlite3")), InMemoryContactRepository()):
+        repository.save(contacts[0])
+        # El reenvío de t-1 se omite y no cuenta.
+        repository.save_many(contacts)
+
+        assert repository.get_daily_stats(date(2024, 1, 1), date(2024, 1, 2)) == EXPECTED
+        assert repository.get_daily_stats(date(2024, 1, 2), date(2024, 1, 2), site=SITE) == EXPECTED[2:]
+
+
+def test_sqlite_repository_rolls_up_contacts_saved_before_the_stats_table(tmp_path):
+    path = str(tmp_path / "contacts.sqlite3")
+    with sqlite3.connect(path) as conn:
+        for statement in SCHEMA:
+            conn.execute(statement)
+        conn.execute(
+            "INSERT INTO contactos (ticket_id, name, email, message, page_location, traffic_source, created_at) "
+            "VALUES ('old', 'Ada', 'ada@example.com', 'Hola', 'https://profebustos.com.ar/', 'x', '2023-12-31 10:00:00')"
+        )
+
+    stats = SQLiteContactRepository(path).get_daily_stats(date(2023, 12, 31), date(2023, 12, 31))
+
+    assert stats == [ContactDailyStat(date(2023, 12, 31), SITE, "x", 1)]
+
+
+def test_mysql_batch_increments_are_grouped_in_key_order():
+    rows = [
+        ("t-1", "Ada", "a@x", "", "Hola", "https://profebustos.com.ar/?utm_source=b", None, None, None, datetime(2024, 1, 1)),
+        ("t-2", "Ada", "a@x", "", "Hola", "https://profebustos.com.ar/?utm_source=a", None, None, None, datetime(2024, 1, 1)),
+        ("t-3", "Ada", "a@x", "", "Hola", "https://profebustos.com.ar/?utm_source=b", None, None, None, datetime(2024, 1, 1)),
+    ]
+
+    assert daily_stats_increments(rows) == [(date(2024, 1, 1), SITE, "a", 1), (date(2024, 1, 1), SITE, "b", 2)]
+
+
+class FixedClock:
+    def __init__(self, now):
+        self._now = now
+
+    def now(self):
+        return self._now
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        connection = self.connection
+        connection.executed.append((sql, params))
+        if sql.startswith("SELECT GET_LOCK"):
+            self._result = [{"acquired": 1}]
+        elif sql.startswith("SELECT last_id"):
+            self._result = [{"last_id": connection.watermark}] if connection.watermark else []
+        elif sql.startswith("SELECT id, DATE(created_at)"):
+            last_id, limit = params
+            self._result = [
+                {"id": row_id, "day": created_at.date()}
+                for row_id, created_at, _ in connection.contacts if row_id > last_id
+            ][:limit]
+        elif sql.startswith("SELECT page_location"):
+            start, end = params
+            self._result = [
+                {"page_location": page_location, "traffic_source": None}
+                for _, created_at, page_location in connection.contacts if start <= created_at.date() < end
+            ]
+        elif sql.startswith("DELETE FROM contact_daily_stats"):
+            connection.deleted.append(params[0])
+        elif sql.startswith("INSERT INTO contact_stats_watermark"):
+            connection.watermark = params[1]
+
+    def executemany(self, sql, rows):
+        self.connection.executed.append((sql, list(rows)))
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+
+class FakeConnection:
+    def __init__(self, contacts, watermark=0):
+        self.contacts = contacts
+        self.watermark = watermark
+        self.executed = []
+        self.deleted = []
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_catch_up_rebuilds_only_days_after_the_high_water_mark_plus_today():
+    contacts = [
+        (1, datetime(2024, 1, 1, 9), "https://profebustos.com.ar/?utm_source=google"),
+        (2, datetime(2024, 1, 2, 9), "https://profebustos.com.ar/?utm_source=google"),
+        (3, datetime(2024, 1, 2, 10), "https://profebustos.com.ar/"),
+    ]
+    connection = FakeConnection(contacts, watermark=1)
+
+    result = ContactStatsRollup(lambda: connection, batch_size=1, clock=FixedClock(datetime(2024, 1, 3, 0, 30))).run()
+
+    assert result == {"days": 2, "last_id": 3}
+    assert connection.deleted == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert connection.watermark == 3
+    increments = [rows for sql, rows in connection.executed if sql == STATS_INCREMENT]
+    assert increments == [[(date(2024, 1, 2), SITE, "direct", 1), (date(2024, 1, 2), SITE, "google", 1)]]
+    assert connection.executed[-1][0].startswith("SELECT RELEASE_LOCK")
+    assert connection.closed
+
+
+def test_direct_insert_rolls_up_on_the_day_of_its_own_created_at():
+    connection = FakeConnection([])
+    client = MySQLClient(host="db", user="app", db="contacts", daily_stats=True)
+    client.pool = MySQLConnectionPool(lambda: connection, max_size=1)
+    created_at = datetime(2024, 1, 1, 23, 59, 59)
+
+    client.insert_contacto("t-1", "Ada", "ada@example.com", "", "Hola",
+                           "https://profebustos.com.ar/", "direct", "127.0.0.1", "pytest", created_at)
+
+    (insert_sql, values), (stats_sql, increments) = connection.executed
+    assert "NOW()" not in insert_sql
+    assert values[-1] == created_at
+    assert stats_sql == STATS_INCREMENT
+    assert increments == [(date(2024, 1, 1), SITE, "direct", 1)]
+
+
+def test_utc_now_drops_microseconds_so_the_rollup_day_matches_the_stored_row(monkeypatch):
+    class LateClock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2024, 1, 1, 23, 59, 59, 600000, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(utc_clock, "datetime", LateClock)
+    created_at = utc_clock.utc_now()
+    row = ("t-1", "Ada", "ada@example.com", "", "Hola", "https://profebustos.com.ar/", "direct",
+           "127.0.0.1", "pytest", created_at)
+
+    # MySQL redondearía 23:59:59.6 a 2024-01-02 00:00:00 mientras el rollup contaba el 1 de enero.
+    assert created_at == datetime(2024, 1, 1, 23, 59, 59)
+    assert daily_stats_increments([row]) == [(date(2024, 1, 1), SITE, "direct", 1)]
+
+
+def test_stats_endpoint_reads_the_rollup_and_validates_the_range():
+    repository = InMemoryContactRepository()
+    repository.save_many(_contacts())
+    app = flask_app.create_app(Settings(development=True))
+    app.extensions["services"].contact_stats_use_case = ContactStatsUseCase(
+        repository, FixedClock(datetime(2024, 1, 2, 23, 59))
+    )
+    client = app.test_client()
+    headers = {"Origin": "http://localhost:5173"}
+
+    body = client.get("/v1/contact/stats", headers=headers).get_json()
+    assert body["from"] == "2023-12-04"
+    assert body["stats"][0] == {"day": "2024-01-01", "site": SITE, "traffic_source": "google", "contacts": 2}
+    assert body["totals"] == {"google": 2, "direct": 1, "newsletter": 1}
+
+    invalid = client.get("/v1/contact/stats?from=2024-01-05&to=2024-01-01", headers=headers)
+    assert invalid.status_code == 400
+    assert invalid.get_json()["error_code"] == "INVALID_DATE_RANGE"
@@ -1,6 +1,8 @@
 from interface_adapters.controllers.contact_controller import (
+    _ERROR_MESSAGES,
     sanitize_and_validate_contact_payload,
 )
+from interface_adapters.controllers.contact_validation import ERROR_PRIORITY, FieldSpec, compile_validator
 
 
 def test_sanitize_and_validate_returns_normalized_payload():
@@ -29,7 +31,7 @@ def test_sanitize_and_validate_rejects_invalid_email():
         "name": "Ada",
         "email": "not-an-email",
         "company": "",
-        "message": "",
+        "message": "Hello",
         "page_location": "",
         "traffic_source": "",
     }
@@ -38,5 +40,64 @@ def test_sanitize_and_validate_rejects_invalid_email():
 
     assert normalized is None
     assert error_status == 400
-    assert error_response["error"] == "El correo electrÃ³nico tiene un formato invÃ¡lido"
+    assert error_response["error"] == "El correo electrónico tiene un formato inválido"
     assert "error_code" not in error_response
+
+
+def test_sanitize_and_validate_reports_all_field_errors():
+    data = {
+        "name": "",
+        "email": "not-an-email",
+        "company": "x" * 161,
+        "message": "<p></p>",
+    }
+
+    error_response, error_status, normalized = sanitize_and_validate_contact_payload(data)
+
+    assert normalized is None
+    assert error_status == 400
+    assert error_response["error_code"] == "MISSING_FIELDS"
+    assert error_response["errors"] == [
+        {"field": "name", "error_code": "MISSING_FIELDS"},
+        {"field": "email", "error_code": "INVALID_EMAIL"},
+        {"field": "company", "error_code": "FIELD_LENGTH_EXCEEDED"},
+        {"field": "message", "error_code": "MISSING_FIELDS"},
+    ]
+
+
+def test_sanitize_and_validate_rejects_oversized_payload():
+    data = {
+        "name": "Ada",
+        "email": "ada@example.com",
+        "company": "x" * 160,
+        "message": "€" * 1200,
+        "page_location": "https://example.com/" + "p" * 490,
+        "traffic_source": "t" * 128,
+    }
+
+    error_response, error_status, normalized = sanitize_and_validate_contact_payload(data)
+
+    assert normalized is None
+    assert error_status == 413
+    assert error_response["error_code"] == "PAYLOAD_TOO_LARGE"
+    assert error_response["error"] == "El contenido del formulario excede el tamaño permitido"
+
+
+def test_sanitize_and_validate_rejects_non_string_fields():
+    data = {"name": ["Ada"], "email": "ada@example.com", "message": "Hola"}
+
+    error_response, error_status, _ = sanitize_and_validate_contact_payload(data)
+
+    assert error_status == 400
+    assert error_response["errors"] == [{"field": "name", "error_code": "INVALID_TYPE"}]
+    assert error_response["error"] == "Tipo de campo inválido"
+
+
+def test_min_length_reports_field_too_short():
+    validate = compile_validator((FieldSpec("name", required=True, min_length=3),))
+
+    normalized, errors = validate({"name": "Al"})
+
+    assert errors == [{"field": "name", "error_code": "FIELD_TOO_SHORT"}]
+    assert "name" not in normalized
+    assert set(_ERROR_MESSAGES) == set(ERROR_PRIORITY)
@@ -0,0 +1,177 @@
+import threading
+
+import pytest
+
+from src.application.dtos.contact_dto import ContactDTO
+from src.application.errors import ContactCreateFailed, ContactQueueFull
+from src.entities.contact import Contact
+from src.infrastructure.common import contact_write_behind_queue
+from src.infrastructure.common.contact_write_behind_queue import ContactWriteBehindQueue
+from src.interface_adapters.controllers.contact_controller import ContactController
+from src.use_cases.register_contact import RegisterContactUseCase
+
+
+def _contact(ticket_id):
+    return Contact(
+        ticket_id=ticket_id,
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+
+class RecordingRepository:
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+        self.flushed = threading.Event()
+
+    def save_many(self, contacts):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("db down")
+        self.batches.append([c.ticket_id for c in contacts])
+        self.flushed.set()
+
+
+def test_queue_flushes_in_batches_and_drains_on_stop():
+    repo = RecordingRepository()
+    write_queue = ContactWriteBehindQueue(repo, batch_size=3, flush_interval=0.05)
+    for index in range(7):
+        write_queue.submit(_contact(f"t-{index}"))
+
+    write_queue.start()
+    write_queue.stop(timeout=2)
+
+    flushed = [ticket for batch in repo.batches for ticket in batch]
+    assert flushed == [f"t-{index}" for index in range(7)]
+    assert all(len(batch) <= 3 for batch in repo.batches)
+    assert write_queue.stats()["flushed"] == 7
+
+
+def test_queue_stamps_created_at_on_submit():
+    write_queue = ContactWriteBehindQueue(RecordingRepository())
+    contact = _contact("t-1")
+
+    write_queue.submit(contact)
+
+    assert contact.created_at is not None
+
+
+def test_queue_rejects_when_full():
+    write_queue = ContactWriteBehindQueue(RecordingRepository(), max_size=1, submit_timeout=0.01)
+    write_queue.submit(_contact("t-1"))
+
+    with pytest.raises(ContactQueueFull):
+        write_queue.submit(_contact("t-2"))
+
+    assert write_queue.stats()["rejected"] == 1
+
+
+def test_queue_rejects_after_stop_and_registers_atexit_once(monkeypatch):
+    registered = []
+    monkeypatch.setattr(contact_write_behind_queue.atexit, "register", registered.append)
+    write_queue = ContactWriteBehindQueue(RecordingRepository(), flush_interval=0.01)
+
+    write_queue.start()
+    write_queue.stop(timeout=2)
+    write_queue.start()
+    write_queue.stop(timeout=2)
+
+    assert registered == [write_queue.stop]
+    with pytest.raises(ContactQueueFull):
+        write_queue.submit(_contact("t-1"))
+
+
+def test_queue_retries_failed_batches():
+    repo = RecordingRepository(failures=1)
+    write_queue = ContactWriteBehindQueue(repo, flush_interval=0.01, retry_backoff=0.01)
+    write_queue.submit(_contact("t-1"))
+
+    write_queue.start()
+    assert repo.flushed.wait(2)
+    write_queue.stop(timeout=2)
+
+    assert repo.batches == [["t-1"]]
+
+
+def test_register_contact_defers_to_queue_and_controller_returns_202():
+    class FakeIdGenerator:
+        def new_id(self):
+            return "t-1"
+
+    class FakeQueue:
+        def __init__(self):
+            self.submitted = []
+
+        def submit(self, contact):
+            self.submitted.append(contact)
+
+    class FailingRepository:
+        def save(self, contact):
+            raise AssertionError("save must not run in write-behind mode")
+
+    contact_queue = FakeQueue()
+    use_case = RegisterContactUseCase(FailingRepository(), FakeIdGenerator(), contact_queue)
+
+    result = use_case.execute(
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+    assert isinstance(result, ContactDTO)
+    assert result.deferred is True
+    assert [c.ticket_id for c in contact_queue.submitted] == ["t-1"]
+
+    class FakeRequest:
+        is_json = True
+        remote_addr = "127.0.0.1"
+        headers = {"User-Agent": "pytest"}
+        path = "/v1/contact/email"
+
+        def get_json(self):
+            return {"name": "Ada", "email": "ada@example.com", "message": "Hello"}
+
+    response, status = ContactController(use_case).registrar_contacto(FakeRequest())
+
+    assert status == 202
+    assert response["ticket_id"] == "t-1"
+
+
+def test_queue_isolates_rows_mysql_rejects_without_retrying_the_batch():
+    class RejectingRepository(RecordingRepository):
+        def save_many(self, contacts):
+            if any(c.ticket_id == "t-1" for c in contacts):
+                raise ContactCreateFailed()
+            super().save_many(contacts)
+
+    class ListFallback:
+        def __init__(self):
+            self.contacts = []
+
+        def submit(self, contact):
+            self.contacts.append(contact.ticket_id)
+
+    repo = RejectingRepository()
+    fallback = ListFallback()
+    write_queue = ContactWriteBehindQueue(repo, batch_size=3, retry_backoff=60, fallback=fallback)
+    for index in range(3):
+        write_queue.submit(_contact(f"t-{index}"))
+
+    write_queue.start()
+    write_queue.stop(timeout=2)
+
+    assert repo.batches == [["t-0"], ["t-2"]]
+    assert fallback.contacts == ["t-1"]
+    assert write_queue.stats()["flushed"] == 2
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.application.errors import IdempotencyKeyReused
+from src.infrastructure.common.ttl_lru_cache import TTLLRUCache
+from src.interface_adapters.controllers.contact_controller import ContactController
+from src.use_cases.register_contact import AsyncRegisterContactUseCase, RegisterContactUseCase
+
+
+class FakeContactRepository:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, contact):
+        self.saved.append(contact)
+        return contact
+
+
+class SequentialIdGenerator:
+    def __init__(self):
+        self.count = 0
+
+    def new_id(self):
+        self.count += 1
+        return f"t-{self.count}"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _submit(use_case, name="Ada", message="Hello", idempotency_key=None):
+    return use_case.execute(
+        name=name,
+        email="ada@example.com",
+        company="",
+        message=message,
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+        idempotency_key=idempotency_key,
+    )
+
+
+def test_ttl_lru_cache_expires_and_evicts():
+    clock = FakeClock()
+    cache = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_repeated_content_is_answered_from_cache():
+    repo = FakeContactRepository()
+    use_case = RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+
+    first = _submit(use_case)
+    second = _submit(use_case, name="  ada ", message="Hello ")
+
+    assert len(repo.saved) == 1
+    assert second.ticket_id == first.ticket_id
+    assert second.replayed is True
+    assert first.replayed is False
+
+
+def test_idempotency_key_replays_original_ticket():
+    repo = FakeContactRepository()
+    use_case = RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+
+    first = _submit(use_case, idempotency_key="k-1")
+    second = _submit(use_case, name=" ada", idempotency_key="k-1")
+    third = _submit(use_case, message="A different message")
+
+    assert second.ticket_id == first.ticket_id
+    assert third.ticket_id != first.ticket_id
+    assert len(repo.saved) == 2
+
+
+def test_idempotency_key_reused_with_other_content_is_rejected():
+    repo = FakeContactRepository()
+    use_case = RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+    _submit(use_case, idempotency_key="k-1")
+
+    with pytest.raises(IdempotencyKeyReused):
+        _submit(use_case, message="Edited before retry", idempotency_key="k-1")
+    assert len(repo.saved) == 1
+
+
+def test_controller_answers_replayed_submission_with_200():
+    class FakeRequest:
+        is_json = True
+        remote_addr = "127.0.0.1"
+        headers = {"User-Agent": "pytest", "Idempotency-Key": "k-1"}
+        path = "/v1/contact/email"
+
+        def get_json(self):
+            return {"name": "Ada", "email": "ada@example.com", "message": "Hello"}
+
+    repo = FakeContactRepository()
+    controller = ContactController(
+        RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+    )
+
+    first_response, first_status = controller.registrar_contacto(FakeRequest())
+    second_response, second_status = controller.registrar_contacto(FakeRequest())
+
+    assert first_status == 201
+    assert second_status == 200
+    assert second_response["ticket_id"] == first_response["ticket_id"]
+    assert len(repo.saved) == 1
+
+
+def test_replayed_submission_does_not_spend_the_rate_limit():
+    class FakeRequest:
+        is_json = True
+        remote_addr = "127.0.0.1"
+        headers = {"User-Agent": "pytest", "Idempotency-Key": "k-1"}
+        path = "/v1/contact/email"
+
+        def get_json(self):
+            return {"name": "Ada", "email": "ada@example.com", "message": "Hello"}
+
+    class OneShotRateLimiter:
+        def __init__(self):
+            self.hits = 0
+
+        def hit(self, keys):
+            self.hits += 1
+            return 0 if self.hits == 1 else 60
+
+    rate_limiter = OneShotRateLimiter()
+    repo = FakeContactRepository()
+    controller = ContactController(
+        RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache()), rate_limiter
+    )
+
+    first_response, first_status = controller.registrar_contacto(FakeRequest())
+    statuses = [controller.registrar_contacto(FakeRequest())[1] for _ in range(3)]
+
+    assert first_status == 201
+    assert statuses == [200, 200, 200]
+    assert rate_limiter.hits == 1
+    assert len(repo.saved) == 1
+
+
+def test_controller_rejects_reused_idempotency_key_with_422():
+    class FakeRequest:
+        is_json = True
+        remote_addr = "127.0.0.1"
+        headers = {"User-Agent": "pytest", "Idempotency-Key": "k-1"}
+        path = "/v1/contact/email"
+
+        def __init__(self, message):
+            self.message = message
+
+        def get_json(self):
+            return {"name": "Ada", "email": "ada@example.com", "message": self.message}
+
+    repo = FakeContactRepository()
+    controller = ContactController(
+        RegisterContactUseCase(repo, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+    )
+
+    assert controller.registrar_contacto(FakeRequest("Hello"))[1] == 201
+    response, status = controller.registrar_contacto(FakeRequest("Hello again"))
+
+    assert status == 422
+    assert response["error_code"] == "IDEMPOTENCY_KEY_REUSED"
+    assert len(repo.saved) == 1
+
+
+def test_concurrent_identical_submissions_insert_once():
+    class SlowRepository(FakeContactRepository):
+        def save(self, contact):
+            time.sleep(0.05)
+            return super().save(contact)
+
+    repository = SlowRepository()
+    use_case = RegisterContactUseCase(repository, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+    start = threading.Barrier(4)
+    results = []
+
+    def submit():
+        start.wait()
+        results.append(_submit(use_case))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(repository.saved) == 1
+    assert {result.ticket_id for result in results} == {"t-1"}
+    assert sorted(result.replayed for result in results) == [False, True, True, True]
+    assert not use_case._pending._locks
+
+
+def test_concurrent_identical_async_submissions_insert_once():
+    class SlowAsyncRepository(FakeContactRepository):
+        async def save(self, contact):
+            await asyncio.sleep(0.01)
+            return super().save(contact)
+
+    repository = SlowAsyncRepository()
+    use_case = AsyncRegisterContactUseCase(repository, SequentialIdGenerator(), submission_cache=TTLLRUCache())
+
+    async def submit_twice():
+        return await asyncio.gather(_submit(use_case), _submit(use_case, idempotency_key="k-1"))
+
+    first, second = asyncio.run(submit_twice())
+
+    assert len(repository.saved) == 1
+    assert first.ticket_id == second.ticket_id == "t-1"
+    assert second.replayed is True
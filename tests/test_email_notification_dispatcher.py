@@ -0,0 +1,98 @@
+from src.application.dtos.contact_dto import ContactDTO
+from src.infrastructure.common.ttl_lru_cache import TTLLRUCache
+from src.infrastructure.smtp.debug_smtp_server import DebugSMTPServer
+from src.infrastructure.smtp.email_notification_dispatcher import EmailNotificationDispatcher, SMTPMailer
+from src.use_cases.register_contact import RegisterContactUseCase
+
+
+def _contact(ticket_id):
+    return ContactDTO(
+        ticket_id=ticket_id,
+        name="Ada Lovelace",
+        email="ada@example.com",
+        company="Analytical Engines",
+        message="Necesito un presupuesto",
+        page_location="/contacto",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+
+def _dispatcher(server, **overrides):
+    host, port = server.server_address
+    options = {"workers": 1, "digest_threshold": 3, "batch_window": 0.05, "retry_backoff": 0.01}
+    options.update(overrides)
+    return EmailNotificationDispatcher(
+        lambda: SMTPMailer(host, port, starttls=False, timeout=2),
+        sender="no-reply@profebustos.com.ar",
+        recipient="equipo@profebustos.com.ar",
+        **options,
+    )
+
+
+def test_single_notifications_and_burst_digest_share_one_smtp_connection():
+    server = DebugSMTPServer(("127.0.0.1", 0)).start()
+    try:
+        dispatcher = _dispatcher(server)
+        dispatcher.notify(_contact("t-0"))
+        for index in range(1, 5):
+            dispatcher.notify(_contact(f"t-{index}"))
+        dispatcher.start()
+        dispatcher.stop(timeout=5)
+    finally:
+        server.stop()
+
+    [digest] = server.messages
+    assert digest["Subject"] == "5 nuevas consultas"
+    assert digest.get_content().count("Ticket: ") == 5
+    assert server.connections == 1
+    assert (dispatcher.stats()["sent"], dispatcher.stats()["digests"]) == (5, 1)
+
+
+def test_retries_with_backoff_and_drops_when_queue_is_full():
+    server = DebugSMTPServer(("127.0.0.1", 0), fail_next=2).start()
+    try:
+        dispatcher = _dispatcher(server, max_size=1)
+        dispatcher.notify(_contact("t-1"))
+        dispatcher.notify(_contact("t-2"))
+        dispatcher.start()
+        dispatcher.stop(timeout=5)
+    finally:
+        server.stop()
+
+    [message] = server.messages
+    assert message["Reply-To"] == "ada@example.com"
+    assert message["Subject"].endswith("[t-1]")
+    stats = dispatcher.stats()
+    assert (stats["sent"], stats["dropped"], stats["failed"]) == (1, 1, 0)
+
+
+def test_register_contact_notifies_new_contacts_but_not_replays():
+    class Repository:
+        def save(self, contact):
+            return contact
+
+    class Ids:
+        def __init__(self):
+            self.count = 0
+
+        def new_id(self):
+            self.count += 1
+            return f"id-{self.count}"
+
+    notified = []
+    notifier = type("Notifier", (), {"notify": staticmethod(notified.append)})()
+    use_case = RegisterContactUseCase(
+        Repository(), Ids(), submission_cache=TTLLRUCache(max_entries=10, ttl_seconds=60), notifier=notifier
+    )
+    payload = {
+        "name": "Ada", "email": "ada@example.com", "company": None, "message": "Hola",
+        "page_location": "/", "traffic_source": "direct", "ip": "127.0.0.1", "user_agent": "pytest",
+    }
+
+    first = use_case.execute(**payload)
+    replay = use_case.execute(**payload)
+
+    assert replay.replayed is True
+    assert [contact.ticket_id for contact in notified] == [first.ticket_id]
@@ -0,0 +1,113 @@
+import runpy
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.application.errors import DatabaseUnavailable
+from src.entities.contact import Contact
+from src.infrastructure.flask import flask_app
+from src.shared.config import Settings
+
+CONF = runpy.run_path(str(Path(__file__).resolve().parents[1] / "gunicorn.conf.py"))
+
+
+class _FlakyRepository:
+    def __init__(self):
+        self.down = True
+        self.warmed = []
+
+    def warm(self, connections):
+        if self.down:
+            raise DatabaseUnavailable()
+        self.warmed.append(connections)
+
+
+class _Log:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message, *args):
+        self.warnings.append(message % args)
+
+
+def _worker(app):
+    application = SimpleNamespace(wsgi=lambda: app)
+    return SimpleNamespace(app=application, pid=1234, log=_Log())
+
+
+def test_readiness_reports_healthy_only_after_warm_up():
+    app = flask_app.create_app(Settings(contact_repository="memory", mysql_pool_warm=3))
+    services = app.extensions["services"]
+    repository = _FlakyRepository()
+    services.contact_repository = repository
+    client = app.test_client()
+    worker = _worker(app)
+
+    CONF["post_worker_init"](worker)
+    assert services.ready is False
+    assert worker.log.warnings
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.get_json()["error_code"] == "NOT_READY"
+
+    repository.down = False
+    assert client.get("/health/ready").get_json() == {"success": True, "ready": True}
+    assert client.get("/health/ready").status_code == 200
+    assert repository.warmed == [3]
+
+
+def test_post_fork_discards_parent_state_and_worker_exit_flushes(tmp_path):
+    settings = Settings(
+        contact_repository="memory",
+        contact_spool_dir=str(tmp_path / "spool"),
+        write_behind=True,
+        contact_flush_interval=0.01,
+    )
+    app = flask_app.create_app(settings)
+    services = app.extensions["services"]
+    parent_queue = services.contact_write_queue
+    parent_replayer = services.contact_spool_replayer
+    metrics = services.metrics
+    server = SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app))
+    worker = _worker(app)
+
+    CONF["when_ready"](server)
+    assert not parent_queue._thread.is_alive()
+
+    CONF["post_fork"](server, worker)
+    assert services.contact_write_queue is not parent_queue
+    assert services.contact_spool_replayer is not parent_replayer
+    assert services.metrics is metrics
+    assert services.contact_write_queue._thread.is_alive()
+
+    CONF["post_worker_init"](worker)
+    assert services.ready is True
+    services.contact_write_queue.submit(_contact())
+
+    CONF["worker_exit"](server, worker)
+    assert not services.contact_write_queue._thread.is_alive()
+    assert len(services.contact_repository.get_all()) == 1
+
+
+def _contact():
+    return Contact(
+        ticket_id="t-1",
+        name="Ana",
+        email="ana@example.com",
+        company=None,
+        message="Hola",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    )
+
+
+def test_child_exit_folds_the_dead_worker_metrics_into_the_aggregate(tmp_path):
+    app = flask_app.create_app(Settings(contact_repository="memory", metrics_dir=str(tmp_path)))
+    server = SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app))
+    (tmp_path / "metrics-1234.db").write_bytes(b"")
+
+    CONF["child_exit"](server, _worker(app))
+
+    assert not (tmp_path / "metrics-1234.db").exists()
+    assert (tmp_path / "metrics-aggregate.db").exists()
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from src.entities.contact import Contact
+from src.infrastructure.memory.in_memory_contact_repository import InMemoryContactRepository
+
+
+def _contact(ticket_id, created_at):
+    return Contact(ticket_id, "Ada", "ada@example.com", "", "Hola", "/", "direct", "127.0.0.1", "pytest", created_at)
+
+
+def test_in_memory_repository_pages_newest_first_with_keyset():
+    repository = InMemoryContactRepository()
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(5):
+        repository.save(_contact(f"t-{i}", start + timedelta(minutes=i)))
+
+    first, after = repository.get_page(2)
+    second, after_second = repository.get_page(2, after)
+    last, end = repository.get_page(2, after_second)
+
+    assert [row.ticket_id for row in first + second + last] == ["t-4", "t-3", "t-2", "t-1", "t-0"]
+    assert end is None
+    assert repository.get_watermark() == (5, 5)
+
+
+def test_in_memory_repository_save_many_is_idempotent_and_notifies():
+    repository = InMemoryContactRepository()
+    changes = []
+    repository.add_change_listener(lambda: changes.append(1))
+    batch = [_contact("t-1", None), _contact("t-2", None)]
+
+    repository.save_many(batch)
+    repository.save_many(batch)
+
+    assert [c.ticket_id for c in repository.iter_all()] == ["t-2", "t-1"]
+    assert len(changes) == 2
@@ -0,0 +1,52 @@
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from src.application.dtos.contact_dto import ContactDTO
+from src.infrastructure.flask.json_provider import FastJSONProvider, orjson
+
+
+def _dto():
+    return ContactDTO(
+        ticket_id="t-1",
+        name="Ada",
+        email="ada@example.com",
+        company="",
+        message="Hola",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+ENCODERS = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(orjson is None, reason="orjson not installed")),
+]
+
+
+@pytest.mark.parametrize("use_orjson", ENCODERS)
+def test_provider_encodes_dataclasses_and_naive_datetimes_as_utc(use_orjson):
+    provider = FastJSONProvider(Flask(__name__), use_orjson=use_orjson)
+
+    payload = json.loads(provider.dumps_bytes({"contactos": [_dto()]}))
+
+    contact = payload["contactos"][0]
+    assert contact["ticket_id"] == "t-1"
+    assert contact["created_at"] == "2024-01-01T12:00:00+00:00"
+    assert provider.loads(provider.dumps({"name": "Añá"})) == {"name": "Añá"}
+
+
+def test_provider_backs_jsonify():
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    with app.app_context():
+        response = app.json.response(success=True, when=datetime(2024, 1, 1))
+
+    assert response.mimetype == "application/json"
+    assert json.loads(response.get_data()) == {"success": True, "when": "2024-01-01T00:00:00+00:00"}
@@ -0,0 +1,51 @@
+import json
+import logging
+import logging.handlers
+
+from src.application.dtos.contact_page_dto import ContactPageDTO
+from src.infrastructure.flask import flask_app
+from src.shared import logger_flask_v0
+from src.shared.config import Settings
+from src.shared.logger_flask_v0 import JSONLineFormatter, get_logger
+
+
+def test_json_formatter_emits_ctx_as_top_level_fields():
+    record = logging.LogRecord("flask_app", logging.INFO, __file__, 1, "Request log", None, None)
+    record.ctx = {"req_id": "abc", "ms": 12.5, "status": 201}
+
+    entry = json.loads(JSONLineFormatter().format(record))
+
+    assert entry["msg"] == "Request log"
+    assert entry["req_id"] == "abc"
+    assert entry["ms"] == 12.5
+    assert entry["status"] == 201
+
+
+def test_get_logger_shares_one_queue_handler_per_top_level_logger():
+    parent = get_logger("profebustos")
+    child = get_logger("profebustos.test_logging")
+
+    queue_handlers = [h for h in parent.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    assert len(queue_handlers) == 1
+    assert not child.handlers
+    assert queue_handlers[0] is logger_flask_v0._queue_handler  # pylint: disable=protected-access
+
+
+def test_request_log_samples_successful_requests_only(caplog):
+    use_case = type("UC", (), {
+        "watermark": staticmethod(lambda: (0, 0)),
+        "execute_page": staticmethod(lambda limit=None, after=None: ContactPageDTO(items=[], limit=50)),
+    })
+    app = flask_app.create_app(Settings(development=True, log_sample_rate=0.0))
+    app.extensions["services"].list_contacts_use_case = use_case
+    client = app.test_client()
+    headers = {"Origin": "http://localhost:5173"}
+
+    with caplog.at_level(logging.INFO, logger="flask_app"):
+        assert client.get("/v1/contact/list", headers=headers).status_code == 200
+        assert client.get("/v1/contact/list?limit=abc", headers=headers).status_code == 400
+
+    request_logs = [r for r in caplog.records if r.getMessage() == "Request log"]
+    assert len(request_logs) == 1
+    assert request_logs[0].ctx["status"] == 400
+    assert request_logs[0].ctx["req_id"]
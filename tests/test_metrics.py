@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+
+from src.infrastructure.flask import flask_app
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry, MmapValues, read_store
+from src.shared.config import Settings
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])  # pylint: disable=consider-using-with
+    process.wait()
+    return process.pid
+
+
+def test_mmap_values_are_readable_from_another_reader(tmp_path):
+    path = str(tmp_path / "metrics-1.db")
+    values = MmapValues(path)
+    for i in range(3000):  # fuerza el crecimiento del archivo
+        values.add(f"key-{i}", 1.0)
+    values.add("key-0", 2.5)
+    values.set("gauge", 7.0)
+
+    stored = dict(read_store(path))
+
+    assert stored["key-0"] == 3.5
+    assert stored["key-2999"] == 1.0
+    assert stored["gauge"] == 7.0
+    values.close()
+
+
+def test_registry_aggregates_counters_across_worker_files(tmp_path):
+    registry = MetricsRegistry(directory=str(tmp_path))
+    registry.counter("jobs_total", "Jobs.", ("kind",))
+    registry.gauge("depth", "Depth.")
+    registry.inc("jobs_total", {"kind": "a"})
+    registry.set_gauge("depth", 3)
+
+    other = MmapValues(str(tmp_path / f"metrics-{_dead_pid()}.db"))
+    other.add(registry._key("jobs_total", "", {"kind": "a"}), 4)  # pylint: disable=protected-access
+    other.set(registry._key("depth", "", None), 99)  # pylint: disable=protected-access
+    other.close()
+
+    text = registry.render()
+
+    assert 'jobs_total{kind="a"} 5' in text
+    assert f'depth{{pid="{os.getpid()}"}} 3' in text
+    assert "99" not in text
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        registry.observe("latency_seconds", value, {"route": "/x"})
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/x",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+    assert 'latency_seconds_sum{route="/x"} 4.05' in text
+
+
+def test_metrics_endpoint_requires_origin_secret_and_counts_requests():
+    client = flask_app.create_app(Settings(origin_verify_secret="s3cret")).test_client()
+
+    assert client.get("/metrics").status_code == 403
+    client.post("/v1/contact/email", json={"name": "Ada"}, headers={"X-Origin-Verify": "s3cret"})
+    response = client.get("/metrics", headers={"X-Origin-Verify": "s3cret"})
+
+    text = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert 'http_requests_total{method="POST",route="/v1/contact/email",status="400"} 1' in text
+    assert 'contact_validation_failures_total{error_code="MISSING_FIELDS"} 2' in text
+    assert 'mysql_pool_connections{state="idle",pid="' in text
+
+
+def test_dead_worker_counters_are_merged_and_its_file_removed(tmp_path):
+    registry = MetricsRegistry(directory=str(tmp_path))
+    registry.counter("jobs_total", "Jobs.", ("kind",))
+    registry.gauge("depth", "Depth.")
+    registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.inc("jobs_total", {"kind": "a"})
+    for _ in range(2):
+        pid = _dead_pid()
+        other = MmapValues(str(tmp_path / f"metrics-{pid}.db"))
+        other.add(registry._key("jobs_total", "", {"kind": "a"}), 4)  # pylint: disable=protected-access
+        other.add(registry._key("latency_seconds", "_count", None), 1)  # pylint: disable=protected-access
+        other.set(registry._key("depth", "", None), 99)  # pylint: disable=protected-access
+        other.close()
+        registry.mark_process_dead(pid)
+
+    text = registry.render()
+
+    assert set(os.listdir(tmp_path)) == {"metrics-aggregate.db", f"metrics-{os.getpid()}.db"}
+    assert 'jobs_total{kind="a"} 9' in text
+    assert "latency_seconds_count 2" in text
+    assert "99" not in text
+    registry.mark_process_dead(pid)
+    registry.reset()
+    assert os.listdir(tmp_path) == []
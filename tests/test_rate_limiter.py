@@ -0,0 +1,81 @@
+import pytest
+
+from src.infrastructure.sqlite.rate_limiter import SQLiteRateLimiter, parse_rate
+from src.interface_adapters.controllers.contact_controller import ContactController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parse_rate():
+    assert parse_rate("5/hour") == (5, 3600)
+    assert parse_rate("10/minutes") == (10, 60)
+    with pytest.raises(ValueError):
+        parse_rate("5/fortnight")
+
+
+def test_limiter_blocks_after_capacity_and_refills(tmp_path):
+    clock = FakeClock()
+    limiter = SQLiteRateLimiter(str(tmp_path / "rl.sqlite3"), {"ip": (2, 60)}, clock=clock)
+
+    assert limiter.hit({"ip": "1.1.1.1"}) == 0
+    assert limiter.hit({"ip": "1.1.1.1"}) == 0
+    assert limiter.hit({"ip": "1.1.1.1"}) == 30
+    assert limiter.hit({"ip": "2.2.2.2"}) == 0
+
+    clock.now += 30
+    assert limiter.hit({"ip": "1.1.1.1"}) == 0
+
+
+def test_limiter_state_is_shared_between_instances(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "rl.sqlite3")
+    worker_a = SQLiteRateLimiter(path, {"email": (1, 3600)}, clock=clock)
+    worker_b = SQLiteRateLimiter(path, {"email": (1, 3600)}, clock=clock)
+
+    assert worker_a.hit({"email": "ada@example.com"}) == 0
+    assert worker_b.hit({"email": "ada@example.com"}) > 0
+
+
+def test_rejected_hit_does_not_consume_other_buckets(tmp_path):
+    clock = FakeClock()
+    limiter = SQLiteRateLimiter(
+        str(tmp_path / "rl.sqlite3"), {"ip": (5, 60), "email": (1, 60)}, clock=clock
+    )
+
+    assert limiter.hit({"ip": "1.1.1.1", "email": "ada@example.com"}) == 0
+    for _ in range(4):
+        assert limiter.hit({"ip": "1.1.1.1", "email": "ada@example.com"}) > 0
+    assert limiter.hit({"ip": "1.1.1.1", "email": "grace@example.com"}) == 0
+
+
+def test_controller_returns_429_before_use_case(tmp_path):
+    class FailingUseCase:
+        def find_replay(self, name, email, message, idempotency_key=None):
+            return None
+
+        def execute(self, **kwargs):
+            raise AssertionError("use case must not run when rate limited")
+
+    class FakeRequest:
+        is_json = True
+        remote_addr = "10.0.0.1"
+        headers = {"User-Agent": "pytest", "CF-Connecting-IP": "1.1.1.1"}
+        path = "/v1/contact/email"
+
+        def get_json(self):
+            return {"name": "Ada", "email": "Ada@Example.com", "message": "Hello"}
+
+    limiter = SQLiteRateLimiter(str(tmp_path / "rl.sqlite3"), {"email": (1, 3600)})
+    limiter.hit({"email": "ada@example.com"})
+
+    response, status = ContactController(FailingUseCase(), limiter).registrar_contacto(FakeRequest())
+
+    assert status == 429
+    assert response["error_code"] == "RATE_LIMITED"
+    assert response["retry_after"] > 0
@@ -1,4 +1,8 @@
-from use_cases.register_contact import RegisterContactUseCase
+import asyncio
+import threading
+
+from src.application.errors import DatabaseUnavailable
+from use_cases.register_contact import AsyncRegisterContactUseCase, RegisterContactUseCase
 
 
 class FakeContactRepository:
@@ -40,3 +44,37 @@ def test_register_contact_creates_ticket_and_saves_once():
     assert repo.saved[0] is not result
     assert result.ticket_id == "fixed-id-123"
     assert id_generator.calls == 1
+
+
+def test_async_register_contact_falls_back_to_spool_when_db_is_down():
+    class DownRepository:
+        async def save(self, contact):
+            raise DatabaseUnavailable()
+
+    class Spool:
+        def __init__(self):
+            self.submitted = []
+            self.threads = []
+
+        def submit(self, contact):
+            self.submitted.append(contact)
+            self.threads.append(threading.current_thread())
+
+    spool = Spool()
+    use_case = AsyncRegisterContactUseCase(DownRepository(), FakeIdGenerator("async-id"), fallback_queue=spool)
+
+    result = asyncio.run(use_case.execute(
+        name="Ada Lovelace",
+        email="ada@example.com",
+        company=None,
+        message="Hello",
+        page_location="/",
+        traffic_source="direct",
+        ip="127.0.0.1",
+        user_agent="pytest",
+    ))
+
+    assert result.deferred is True
+    assert [contact.ticket_id for contact in spool.submitted] == ["async-id"]
+    # El fsync del spool no corre en el hilo del event loop.
+    assert threading.main_thread() not in spool.threads
@@ -0,0 +1,69 @@
+import json
+import pstats
+
+from src.infrastructure.flask import flask_app
+from src.infrastructure.flask.request_profiler import ProfileStore
+from src.shared.config import Settings
+
+
+def _profiled_client(tmp_path):
+    settings = Settings(
+        profiling_enabled=True,
+        profile_secret="prof-secret",
+        profile_dir=str(tmp_path),
+        profile_max_files=2,
+        profile_sample_interval=0.0005,
+    )
+    app = flask_app.create_app(settings)
+    return app.test_client(), app.extensions["services"].request_profiler.store
+
+
+def _write_marker(path):
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write("profile")
+
+
+def test_profile_store_keeps_only_the_newest_files(tmp_path):
+    store = ProfileStore(str(tmp_path), max_files=2)
+    for i in range(4):
+        store.save(f"p{i}.prof", _write_marker)
+
+    assert len(store.list()) == 2
+    assert store.path("../etc/passwd") is None
+
+
+def test_authorized_request_is_profiled_and_downloadable(tmp_path):
+    client, store = _profiled_client(tmp_path)
+    token = {"X-Profile-Token": "prof-secret"}
+
+    response = client.get("/health", headers={"X-Profile": "cprofile", **token})
+
+    name = response.headers["X-Profile-Id"]
+    assert name.endswith(".prof")
+    pstats.Stats(store.path(name))
+    listing = client.get("/debug/profiles", headers=token).get_json()
+    assert [p["name"] for p in listing["profiles"]] == [name]
+    assert client.get(f"/debug/profiles/{name}", headers=token).status_code == 200
+
+
+def test_sampling_mode_writes_speedscope_profile(tmp_path):
+    client, store = _profiled_client(tmp_path)
+
+    response = client.get("/health", headers={"X-Profile": "sample", "X-Profile-Token": "prof-secret"})
+
+    name = response.headers["X-Profile-Id"]
+    with open(store.path(name), encoding="utf-8") as handle:
+        document = json.load(handle)
+    assert document["profiles"][0]["type"] == "sampled"
+
+
+def test_requests_without_valid_token_are_not_profiled(tmp_path):
+    client, store = _profiled_client(tmp_path)
+
+    plain = client.get("/health")
+    forged = client.get("/health", headers={"X-Profile": "cprofile", "X-Profile-Token": "nope"})
+
+    assert "X-Profile-Id" not in plain.headers
+    assert "X-Profile-Id" not in forged.headers
+    assert store.list() == []
+    assert client.get("/debug/profiles", headers={"X-Profile-Token": "nope"}).status_code == 403
@@ -0,0 +1,82 @@
+from src.infrastructure.pymysql.schema_migrator import (
+    Migration,
+    SchemaMigrator,
+    load_migrations,
+    split_statements,
+)
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append(sql)
+        if sql.startswith("SELECT GET_LOCK"):
+            self._result = [{"acquired": 1}]
+        elif sql.startswith("SELECT version FROM schema_migrations"):
+            self._result = [{"version": v} for v in sorted(self.connection.applied)]
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            self.connection.applied.add(params[0])
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+
+class FakeConnection:
+    def __init__(self, applied=()):
+        self.applied = set(applied)
+        self.executed = []
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def test_split_statements_ignores_comments_and_blank_statements():
+    sql = "-- comment\nCREATE TABLE a (id INT);\n\nALTER TABLE a\n    ADD INDEX i (id);\n"
+
+    assert split_statements(sql) == ["CREATE TABLE a (id INT)", "ALTER TABLE a\n    ADD INDEX i (id)"]
+
+
+def test_bundled_migrations_are_ordered_and_index_contactos():
+    migrations = load_migrations()
+
+    versions = [migration.version for migration in migrations]
+    assert versions == sorted(versions)
+    assert versions[:2] == [1, 2]
+    assert "uq_contactos_ticket_id" in migrations[1].statements[0]
+
+
+def test_migrator_applies_only_pending_migrations_under_lock():
+    connection = FakeConnection(applied={1})
+    migrations = [
+        Migration(1, "first", ["CREATE TABLE first (id INT)"]),
+        Migration(2, "second", ["CREATE TABLE second (id INT)"]),
+    ]
+
+    applied = SchemaMigrator(connect=lambda: connection, migrations=migrations).migrate()
+
+    assert applied == [2]
+    assert connection.applied == {1, 2}
+    assert "CREATE TABLE first (id INT)" not in connection.executed
+    assert "CREATE TABLE second (id INT)" in connection.executed
+    assert connection.executed[0].startswith("SELECT GET_LOCK")
+    assert connection.executed[-1].startswith("SELECT RELEASE_LOCK")
+    assert connection.closed
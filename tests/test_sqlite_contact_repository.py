@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.application.errors import ContactCreateFailed
+from src.entities.contact import Contact
+from src.infrastructure.memory.in_memory_contact_repository import InMemoryContactRepository
+from src.infrastructure.sqlite.sqlite_contact_repository import SQLiteContactRepository
+
+
+def _contact(ticket_id, created_at):
+    return Contact(ticket_id, "Ada", "ada@example.com", "", "Hola", "/", "direct", "127.0.0.1", "pytest", created_at)
+
+
+def _walk(repository, limit):
+    pages, after = [], None
+    while True:
+        rows, after = repository.get_page(limit, after)
+        pages.append([row.ticket_id for row in rows])
+        if after is None:
+            return pages
+
+
+def test_sqlite_repository_pages_like_the_in_memory_backend(tmp_path):
+    sqlite_repository = SQLiteContactRepository(str(tmp_path / "contacts.sqlite3"))
+    memory_repository = InMemoryContactRepository()
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    # Dos contactos por segundo: el desempate por id tiene que respetarse en el keyset.
+    contacts = [_contact(f"t-{i}", start + timedelta(seconds=i // 2)) for i in range(7)]
+    for contact in contacts:
+        sqlite_repository.save(contact)
+        memory_repository.save(contact)
+
+    assert _walk(sqlite_repository, 3) == _walk(memory_repository, 3)
+    assert _walk(sqlite_repository, 3)[0] == ["t-6", "t-5", "t-4"]
+    rows, _ = sqlite_repository.get_page(1)
+    assert rows[0].created_at == start + timedelta(seconds=3)
+    assert rows[0].id == 7
+    assert [c.ticket_id for c in sqlite_repository.iter_all()] == [f"t-{i}" for i in reversed(range(7))]
+    assert sqlite_repository.get_watermark() == (7, 7)
+
+
+def test_sqlite_repository_persists_and_deduplicates_batches(tmp_path):
+    path = str(tmp_path / "contacts.sqlite3")
+    repository = SQLiteContactRepository(path)
+    changes = []
+    repository.add_change_listener(lambda: changes.append(1))
+    batch = [_contact("t-1", None), _contact("t-2", None)]
+
+    repository.save_many(batch)
+    repository.save_many(batch)
+    with pytest.raises(ContactCreateFailed):
+        repository.save(_contact("t-1", None))
+
+    reopened = SQLiteContactRepository(path)
+    assert reopened.get_watermark() == (2, 2)
+    assert {c.ticket_id for c in reopened.get_all()} == {"t-1", "t-2"}
+    assert len(changes) == 2
+    reopened.ping()
@@ -2,4 +2,11 @@
 WSGI entrypoint for production.
 """
 
-from src.infrastructure.flask.flask_app import app
+from src.shared.config import load_env
+
+# Los .env se cargan antes de importar la app: el logging se configura al importarla.
+load_env()
+
+from src.infrastructure.flask.flask_app import create_app  # noqa: E402  pylint: disable=wrong-import-position
+
+app = create_app()